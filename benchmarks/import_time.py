@@ -0,0 +1,45 @@
+"""
+Compare the time it takes to import the json5 parser with and without the pregenerated parse tables in
+``json5._parsetab``. ``import json5`` alone no longer imports the parser (it is imported when first needed, such as
+by ``json5.parse_source`` or to report a decoding error), so ``json5.parser`` is imported explicitly.
+
+Each import is done in a fresh interpreter, after a warm-up import so that bytecode caches are in place (as they would
+be for an installed package). Run with ``python benchmarks/import_time.py [runs]``.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+TIMED_IMPORT = '''
+import sys
+import time
+if {without_tables!r}:
+    class BlockParsetab:
+        def find_spec(self, name, path=None, target=None):
+            if name == 'json5._parsetab':
+                raise ImportError(name)
+    sys.meta_path.insert(0, BlockParsetab())
+start = time.perf_counter()
+import json5.parser
+print(time.perf_counter() - start)
+'''
+
+
+def time_import(without_tables: bool, runs: int) -> list[float]:
+    code = TIMED_IMPORT.format(without_tables=without_tables)
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    timings = [float(subprocess.check_output([sys.executable, '-c', code], env=env)) for _ in range(runs + 1)]
+    return timings[1:]
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    cached = time_import(without_tables=False, runs=runs)
+    built = time_import(without_tables=True, runs=runs)
+    for label, timings in (('building parse tables', built), ('pregenerated tables', cached)):
+        print(f'{label:>24}: median {statistics.median(timings) * 1000:.1f}ms, best {min(timings) * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,66 @@
-from .dumper import dump
-from .dumper import dumps
-from .loader import JsonIdentifier
-from .loader import load
-from .loader import loads
+from __future__ import annotations
+
+import importlib
+import typing
+
 from .utils import JSON5DecodeError
+from .utils import JsonIdentifier
+
+if typing.TYPE_CHECKING:
+    from .decoder import Decoder
+    from .decoder import items
+    from .decoder import iterparse
+    from .dumper import dump
+    from .dumper import dump_lines
+    from .dumper import dumps
+    from .loader import load
+    from .loader import load_columns
+    from .loader import load_lines
+    from .loader import load_path
+    from .loader import loads
+
+__all__ = [
+    'dump',
+    'dumps',
+    'load',
+    'loads',
+    'load_lines',
+    'load_path',
+    'load_columns',
+    'dump_lines',
+    'items',
+    'iterparse',
+    'Decoder',
+    'JSON5DecodeError',
+    'JsonIdentifier',
+]
+
+# Submodules are only imported when one of their functions is first used, so that, for example, a program that only
+# dumps JSON5 never imports the parser.
+_LAZY_ATTRIBUTES = {
+    'dump': 'dumper',
+    'dumps': 'dumper',
+    'dump_lines': 'dumper',
+    'load': 'loader',
+    'loads': 'loader',
+    'load_lines': 'loader',
+    'load_path': 'loader',
+    'load_columns': 'loader',
+    'items': 'decoder',
+    'iterparse': 'decoder',
+    'Decoder': 'decoder',
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['dump', 'dumps', 'load', 'loads', 'JSON5DecodeError', 'JsonIdentifier']
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,267 @@
+# This file is generated by json5.parser.write_parse_tables. Do not edit it by hand.
+# fmt: off
+from __future__ import annotations
+
+GRAMMAR_HASH = '8daea1b0cfe2f9ddc88b6d72734cfd6ff6ab01b68e8d703bfb4729e8fcc28e7a'
+
+lr_action: dict[int, dict[str, int]] = {
+    0: {'PLUS': -3, 'MINUS': -3, 'HEXADECIMAL': -3, 'FLOAT': -3, 'INTEGER': -3, 'NAN': -3, 'INFINITY': -3, 'OCTAL': -3, 'NULL': -3, 'FALSE': -3, 'TRUE': -3, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -3, 'UNTERMINATED_SINGLE_QUOTE_STRING': -3, 'SINGLE_QUOTE_STRING': -3, 'DOUBLE_QUOTE_STRING': -3, 'LBRACKET': -3, 'LBRACE': -3, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    1: {'$end': 0},
+    2: {'PLUS': 17, 'MINUS': 18, 'HEXADECIMAL': 19, 'FLOAT': 20, 'INTEGER': 21, 'NAN': 22, 'INFINITY': 23, 'OCTAL': 24, 'NULL': 25, 'FALSE': 26, 'TRUE': 27, 'UNTERMINATED_DOUBLE_QUOTE_STRING': 30, 'UNTERMINATED_SINGLE_QUOTE_STRING': 31, 'LBRACKET': -88, 'LBRACE': -46, 'SINGLE_QUOTE_STRING': 34, 'DOUBLE_QUOTE_STRING': 35},
+    3: {'PLUS': -2, 'MINUS': -2, 'HEXADECIMAL': -2, 'FLOAT': -2, 'INTEGER': -2, 'NAN': -2, 'INFINITY': -2, 'OCTAL': -2, 'NULL': -2, 'FALSE': -2, 'TRUE': -2, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -2, 'UNTERMINATED_SINGLE_QUOTE_STRING': -2, 'SINGLE_QUOTE_STRING': -2, 'DOUBLE_QUOTE_STRING': -2, 'LBRACKET': -2, 'LBRACE': -2, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    4: {'WHITESPACE': -5, 'LINE_COMMENT': -5, 'BLOCK_COMMENT': -5, 'PLUS': -5, 'MINUS': -5, 'HEXADECIMAL': -5, 'FLOAT': -5, 'INTEGER': -5, 'NAN': -5, 'INFINITY': -5, 'OCTAL': -5, 'NULL': -5, 'FALSE': -5, 'TRUE': -5, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -5, 'UNTERMINATED_SINGLE_QUOTE_STRING': -5, 'SINGLE_QUOTE_STRING': -5, 'DOUBLE_QUOTE_STRING': -5, 'LBRACKET': -5, 'LBRACE': -5},
+    5: {'WHITESPACE': -6, 'LINE_COMMENT': -6, 'BLOCK_COMMENT': -6, 'PLUS': -6, 'MINUS': -6, 'HEXADECIMAL': -6, 'FLOAT': -6, 'INTEGER': -6, 'NAN': -6, 'INFINITY': -6, 'OCTAL': -6, 'NULL': -6, 'FALSE': -6, 'TRUE': -6, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -6, 'UNTERMINATED_SINGLE_QUOTE_STRING': -6, 'SINGLE_QUOTE_STRING': -6, 'DOUBLE_QUOTE_STRING': -6, 'LBRACKET': -6, 'LBRACE': -6},
+    6: {'WHITESPACE': -36, 'LINE_COMMENT': -36, 'BLOCK_COMMENT': -36, 'PLUS': -36, 'MINUS': -36, 'HEXADECIMAL': -36, 'FLOAT': -36, 'INTEGER': -36, 'NAN': -36, 'INFINITY': -36, 'OCTAL': -36, 'NULL': -36, 'FALSE': -36, 'TRUE': -36, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -36, 'UNTERMINATED_SINGLE_QUOTE_STRING': -36, 'SINGLE_QUOTE_STRING': -36, 'DOUBLE_QUOTE_STRING': -36, 'LBRACKET': -36, 'LBRACE': -36, '$end': -36, 'RBRACKET': -36, 'RBRACE': -36, 'NAME': -36, 'COLON': -36, 'COMMA': -36},
+    7: {'WHITESPACE': -37, 'LINE_COMMENT': -37, 'BLOCK_COMMENT': -37, 'PLUS': -37, 'MINUS': -37, 'HEXADECIMAL': -37, 'FLOAT': -37, 'INTEGER': -37, 'NAN': -37, 'INFINITY': -37, 'OCTAL': -37, 'NULL': -37, 'FALSE': -37, 'TRUE': -37, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -37, 'UNTERMINATED_SINGLE_QUOTE_STRING': -37, 'SINGLE_QUOTE_STRING': -37, 'DOUBLE_QUOTE_STRING': -37, 'LBRACKET': -37, 'LBRACE': -37, '$end': -37, 'RBRACKET': -37, 'RBRACE': -37, 'NAME': -37, 'COLON': -37, 'COMMA': -37},
+    8: {'WHITESPACE': -38, 'LINE_COMMENT': -38, 'BLOCK_COMMENT': -38, 'PLUS': -38, 'MINUS': -38, 'HEXADECIMAL': -38, 'FLOAT': -38, 'INTEGER': -38, 'NAN': -38, 'INFINITY': -38, 'OCTAL': -38, 'NULL': -38, 'FALSE': -38, 'TRUE': -38, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -38, 'UNTERMINATED_SINGLE_QUOTE_STRING': -38, 'SINGLE_QUOTE_STRING': -38, 'DOUBLE_QUOTE_STRING': -38, 'LBRACKET': -38, 'LBRACE': -38, '$end': -38, 'RBRACKET': -38, 'RBRACE': -38, 'NAME': -38, 'COLON': -38, 'COMMA': -38},
+    9: {'WHITESPACE': -39, 'LINE_COMMENT': -39, 'BLOCK_COMMENT': -39, 'PLUS': -39, 'MINUS': -39, 'HEXADECIMAL': -39, 'FLOAT': -39, 'INTEGER': -39, 'NAN': -39, 'INFINITY': -39, 'OCTAL': -39, 'NULL': -39, 'FALSE': -39, 'TRUE': -39, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -39, 'UNTERMINATED_SINGLE_QUOTE_STRING': -39, 'SINGLE_QUOTE_STRING': -39, 'DOUBLE_QUOTE_STRING': -39, 'LBRACKET': -39, 'LBRACE': -39, '$end': -39, 'RBRACKET': -39, 'RBRACE': -39, 'NAME': -39, 'COLON': -39, 'COMMA': -39},
+    10: {'$end': -8, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    11: {'WHITESPACE': -103, 'LINE_COMMENT': -103, 'BLOCK_COMMENT': -103, '$end': -103, 'COMMA': -103, 'RBRACKET': -103, 'RBRACE': -103},
+    12: {'WHITESPACE': -104, 'LINE_COMMENT': -104, 'BLOCK_COMMENT': -104, '$end': -104, 'COMMA': -104, 'RBRACKET': -104, 'RBRACE': -104},
+    13: {'WHITESPACE': -105, 'LINE_COMMENT': -105, 'BLOCK_COMMENT': -105, '$end': -105, 'COMMA': -105, 'RBRACKET': -105, 'RBRACE': -105},
+    14: {'WHITESPACE': -106, 'LINE_COMMENT': -106, 'BLOCK_COMMENT': -106, '$end': -106, 'COMMA': -106, 'RBRACKET': -106, 'RBRACE': -106},
+    15: {'WHITESPACE': -107, 'LINE_COMMENT': -107, 'BLOCK_COMMENT': -107, '$end': -107, 'COMMA': -107, 'RBRACKET': -107, 'RBRACE': -107},
+    16: {'WHITESPACE': -108, 'LINE_COMMENT': -108, 'BLOCK_COMMENT': -108, '$end': -108, 'COMMA': -108, 'RBRACKET': -108, 'RBRACE': -108},
+    17: {'HEXADECIMAL': 19, 'FLOAT': 20, 'INTEGER': 21, 'NAN': 22, 'INFINITY': 23, 'OCTAL': 24},
+    18: {'HEXADECIMAL': 19, 'FLOAT': 20, 'INTEGER': 21, 'NAN': 22, 'INFINITY': 23, 'OCTAL': 24},
+    19: {'WHITESPACE': -95, 'LINE_COMMENT': -95, 'BLOCK_COMMENT': -95, '$end': -95, 'COMMA': -95, 'RBRACKET': -95, 'RBRACE': -95},
+    20: {'EXPONENT': 43, 'WHITESPACE': -101, 'LINE_COMMENT': -101, 'BLOCK_COMMENT': -101, '$end': -101, 'COMMA': -101, 'RBRACKET': -101, 'RBRACE': -101},
+    21: {'EXPONENT': 44, 'WHITESPACE': -102, 'LINE_COMMENT': -102, 'BLOCK_COMMENT': -102, '$end': -102, 'COMMA': -102, 'RBRACKET': -102, 'RBRACE': -102},
+    22: {'WHITESPACE': -98, 'LINE_COMMENT': -98, 'BLOCK_COMMENT': -98, '$end': -98, 'COMMA': -98, 'RBRACKET': -98, 'RBRACE': -98},
+    23: {'WHITESPACE': -99, 'LINE_COMMENT': -99, 'BLOCK_COMMENT': -99, '$end': -99, 'COMMA': -99, 'RBRACKET': -99, 'RBRACE': -99},
+    24: {'WHITESPACE': -100, 'LINE_COMMENT': -100, 'BLOCK_COMMENT': -100, '$end': -100, 'COMMA': -100, 'RBRACKET': -100, 'RBRACE': -100},
+    25: {'WHITESPACE': -119, 'LINE_COMMENT': -119, 'BLOCK_COMMENT': -119, '$end': -119, 'COMMA': -119, 'RBRACKET': -119, 'RBRACE': -119},
+    26: {'WHITESPACE': -117, 'LINE_COMMENT': -117, 'BLOCK_COMMENT': -117, '$end': -117, 'COMMA': -117, 'RBRACKET': -117, 'RBRACE': -117},
+    27: {'WHITESPACE': -118, 'LINE_COMMENT': -118, 'BLOCK_COMMENT': -118, '$end': -118, 'COMMA': -118, 'RBRACKET': -118, 'RBRACE': -118},
+    28: {'LBRACKET': 45},
+    29: {'LBRACE': 46},
+    30: {'WHITESPACE': -113, 'LINE_COMMENT': -113, 'BLOCK_COMMENT': -113, '$end': -113, 'COMMA': -113, 'RBRACKET': -113, 'COLON': -113, 'RBRACE': -113},
+    31: {'WHITESPACE': -114, 'LINE_COMMENT': -114, 'BLOCK_COMMENT': -114, '$end': -114, 'COMMA': -114, 'RBRACKET': -114, 'COLON': -114, 'RBRACE': -114},
+    32: {'WHITESPACE': -115, 'LINE_COMMENT': -115, 'BLOCK_COMMENT': -115, '$end': -115, 'COMMA': -115, 'RBRACKET': -115, 'COLON': -115, 'RBRACE': -115},
+    33: {'WHITESPACE': -116, 'LINE_COMMENT': -116, 'BLOCK_COMMENT': -116, '$end': -116, 'COMMA': -116, 'RBRACKET': -116, 'COLON': -116, 'RBRACE': -116},
+    34: {'WHITESPACE': -112, 'LINE_COMMENT': -112, 'BLOCK_COMMENT': -112, '$end': -112, 'COMMA': -112, 'RBRACKET': -112, 'COLON': -112, 'RBRACE': -112},
+    35: {'WHITESPACE': -111, 'LINE_COMMENT': -111, 'BLOCK_COMMENT': -111, '$end': -111, 'COMMA': -111, 'RBRACKET': -111, 'COLON': -111, 'RBRACE': -111},
+    36: {'WHITESPACE': -4, 'LINE_COMMENT': -4, 'BLOCK_COMMENT': -4, 'PLUS': -4, 'MINUS': -4, 'HEXADECIMAL': -4, 'FLOAT': -4, 'INTEGER': -4, 'NAN': -4, 'INFINITY': -4, 'OCTAL': -4, 'NULL': -4, 'FALSE': -4, 'TRUE': -4, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -4, 'UNTERMINATED_SINGLE_QUOTE_STRING': -4, 'SINGLE_QUOTE_STRING': -4, 'DOUBLE_QUOTE_STRING': -4, 'LBRACKET': -4, 'LBRACE': -4},
+    37: {'$end': -1},
+    38: {'$end': -7, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    39: {'WHITESPACE': -10, 'LINE_COMMENT': -10, 'BLOCK_COMMENT': -10, '$end': -10},
+    40: {'WHITESPACE': -11, 'LINE_COMMENT': -11, 'BLOCK_COMMENT': -11, '$end': -11},
+    41: {'WHITESPACE': -109, 'LINE_COMMENT': -109, 'BLOCK_COMMENT': -109, '$end': -109, 'COMMA': -109, 'RBRACKET': -109, 'RBRACE': -109},
+    42: {'WHITESPACE': -110, 'LINE_COMMENT': -110, 'BLOCK_COMMENT': -110, '$end': -110, 'COMMA': -110, 'RBRACKET': -110, 'RBRACE': -110},
+    43: {'WHITESPACE': -96, 'LINE_COMMENT': -96, 'BLOCK_COMMENT': -96, '$end': -96, 'COMMA': -96, 'RBRACKET': -96, 'RBRACE': -96},
+    44: {'WHITESPACE': -97, 'LINE_COMMENT': -97, 'BLOCK_COMMENT': -97, '$end': -97, 'COMMA': -97, 'RBRACKET': -97, 'RBRACE': -97},
+    45: {'RBRACKET': -82, 'PLUS': -82, 'MINUS': -82, 'HEXADECIMAL': -82, 'FLOAT': -82, 'INTEGER': -82, 'NAN': -82, 'INFINITY': -82, 'OCTAL': -82, 'NULL': -82, 'FALSE': -82, 'TRUE': -82, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -82, 'UNTERMINATED_SINGLE_QUOTE_STRING': -82, 'SINGLE_QUOTE_STRING': -82, 'DOUBLE_QUOTE_STRING': -82, 'LBRACKET': -82, 'LBRACE': -82, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    46: {'RBRACE': -54, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -54, 'UNTERMINATED_SINGLE_QUOTE_STRING': -54, 'NAME': -54, 'SINGLE_QUOTE_STRING': -54, 'DOUBLE_QUOTE_STRING': -54, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    47: {'WHITESPACE': -9, 'LINE_COMMENT': -9, 'BLOCK_COMMENT': -9, '$end': -9},
+    48: {'RBRACKET': -87, 'PLUS': -91, 'MINUS': -91, 'HEXADECIMAL': -91, 'FLOAT': -91, 'INTEGER': -91, 'NAN': -91, 'INFINITY': -91, 'OCTAL': -91, 'NULL': -91, 'FALSE': -91, 'TRUE': -91, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -91, 'UNTERMINATED_SINGLE_QUOTE_STRING': -91, 'SINGLE_QUOTE_STRING': -91, 'DOUBLE_QUOTE_STRING': -91, 'LBRACKET': -91, 'LBRACE': -91},
+    49: {'RBRACKET': -81, 'PLUS': -81, 'MINUS': -81, 'HEXADECIMAL': -81, 'FLOAT': -81, 'INTEGER': -81, 'NAN': -81, 'INFINITY': -81, 'OCTAL': -81, 'NULL': -81, 'FALSE': -81, 'TRUE': -81, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -81, 'UNTERMINATED_SINGLE_QUOTE_STRING': -81, 'SINGLE_QUOTE_STRING': -81, 'DOUBLE_QUOTE_STRING': -81, 'LBRACKET': -81, 'LBRACE': -81, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    50: {'WHITESPACE': -84, 'LINE_COMMENT': -84, 'BLOCK_COMMENT': -84, 'RBRACKET': -84, 'PLUS': -84, 'MINUS': -84, 'HEXADECIMAL': -84, 'FLOAT': -84, 'INTEGER': -84, 'NAN': -84, 'INFINITY': -84, 'OCTAL': -84, 'NULL': -84, 'FALSE': -84, 'TRUE': -84, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -84, 'UNTERMINATED_SINGLE_QUOTE_STRING': -84, 'SINGLE_QUOTE_STRING': -84, 'DOUBLE_QUOTE_STRING': -84, 'LBRACKET': -84, 'LBRACE': -84},
+    51: {'WHITESPACE': -85, 'LINE_COMMENT': -85, 'BLOCK_COMMENT': -85, 'RBRACKET': -85, 'PLUS': -85, 'MINUS': -85, 'HEXADECIMAL': -85, 'FLOAT': -85, 'INTEGER': -85, 'NAN': -85, 'INFINITY': -85, 'OCTAL': -85, 'NULL': -85, 'FALSE': -85, 'TRUE': -85, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -85, 'UNTERMINATED_SINGLE_QUOTE_STRING': -85, 'SINGLE_QUOTE_STRING': -85, 'DOUBLE_QUOTE_STRING': -85, 'LBRACKET': -85, 'LBRACE': -85},
+    52: {'RBRACE': -59, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -47, 'UNTERMINATED_SINGLE_QUOTE_STRING': -47, 'NAME': -47, 'SINGLE_QUOTE_STRING': -47, 'DOUBLE_QUOTE_STRING': -47},
+    53: {'RBRACE': -53, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -53, 'UNTERMINATED_SINGLE_QUOTE_STRING': -53, 'NAME': -53, 'SINGLE_QUOTE_STRING': -53, 'DOUBLE_QUOTE_STRING': -53, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    54: {'WHITESPACE': -56, 'LINE_COMMENT': -56, 'BLOCK_COMMENT': -56, 'RBRACE': -56, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -56, 'UNTERMINATED_SINGLE_QUOTE_STRING': -56, 'NAME': -56, 'SINGLE_QUOTE_STRING': -56, 'DOUBLE_QUOTE_STRING': -56},
+    55: {'WHITESPACE': -57, 'LINE_COMMENT': -57, 'BLOCK_COMMENT': -57, 'RBRACE': -57, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -57, 'UNTERMINATED_SINGLE_QUOTE_STRING': -57, 'NAME': -57, 'SINGLE_QUOTE_STRING': -57, 'DOUBLE_QUOTE_STRING': -57},
+    56: {'RBRACKET': -89},
+    57: {'RBRACKET': -86},
+    58: {'RBRACKET': -76, 'COMMA': -90},
+    59: {'PLUS': 17, 'MINUS': 18, 'HEXADECIMAL': 19, 'FLOAT': 20, 'INTEGER': 21, 'NAN': 22, 'INFINITY': 23, 'OCTAL': 24, 'NULL': 25, 'FALSE': 26, 'TRUE': 27, 'UNTERMINATED_DOUBLE_QUOTE_STRING': 30, 'UNTERMINATED_SINGLE_QUOTE_STRING': 31, 'LBRACKET': -88, 'LBRACE': -46, 'SINGLE_QUOTE_STRING': 34, 'DOUBLE_QUOTE_STRING': 35},
+    60: {'WHITESPACE': -83, 'LINE_COMMENT': -83, 'BLOCK_COMMENT': -83, 'RBRACKET': -83, 'PLUS': -83, 'MINUS': -83, 'HEXADECIMAL': -83, 'FLOAT': -83, 'INTEGER': -83, 'NAN': -83, 'INFINITY': -83, 'OCTAL': -83, 'NULL': -83, 'FALSE': -83, 'TRUE': -83, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -83, 'UNTERMINATED_SINGLE_QUOTE_STRING': -83, 'SINGLE_QUOTE_STRING': -83, 'DOUBLE_QUOTE_STRING': -83, 'LBRACKET': -83, 'LBRACE': -83},
+    61: {'RBRACE': -51},
+    62: {'RBRACE': -58},
+    63: {'RBRACE': -42, 'COMMA': -50},
+    64: {'COLON': -14, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    65: {'UNTERMINATED_DOUBLE_QUOTE_STRING': 30, 'UNTERMINATED_SINGLE_QUOTE_STRING': 31, 'NAME': 86, 'SINGLE_QUOTE_STRING': 34, 'DOUBLE_QUOTE_STRING': 35},
+    66: {'WHITESPACE': -55, 'LINE_COMMENT': -55, 'BLOCK_COMMENT': -55, 'RBRACE': -55, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -55, 'UNTERMINATED_SINGLE_QUOTE_STRING': -55, 'NAME': -55, 'SINGLE_QUOTE_STRING': -55, 'DOUBLE_QUOTE_STRING': -55},
+    67: {'RBRACKET': 87},
+    68: {'RBRACKET': -74},
+    69: {'RBRACKET': -75, 'COMMA': -90},
+    70: {'COMMA': -78, 'RBRACKET': -78},
+    71: {'COMMA': -79, 'RBRACKET': -79},
+    72: {'COMMA': 89},
+    73: {'COMMA': -62, 'RBRACKET': -62, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    74: {'RBRACE': 94},
+    75: {'RBRACE': -40},
+    76: {'RBRACE': -41, 'COMMA': -50},
+    77: {'COMMA': -44, 'RBRACE': -44},
+    78: {'COMMA': -45, 'RBRACE': -45},
+    79: {'COMMA': 96},
+    80: {'COLON': -48},
+    81: {'COLON': -13, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    82: {'WHITESPACE': -16, 'LINE_COMMENT': -16, 'BLOCK_COMMENT': -16, 'COLON': -16},
+    83: {'WHITESPACE': -17, 'LINE_COMMENT': -17, 'BLOCK_COMMENT': -17, 'COLON': -17},
+    84: {'WHITESPACE': -93, 'LINE_COMMENT': -93, 'BLOCK_COMMENT': -93, 'COLON': -93},
+    85: {'WHITESPACE': -94, 'LINE_COMMENT': -94, 'BLOCK_COMMENT': -94, 'COLON': -94},
+    86: {'WHITESPACE': -92, 'LINE_COMMENT': -92, 'BLOCK_COMMENT': -92, 'COLON': -92},
+    87: {'WHITESPACE': -80, 'LINE_COMMENT': -80, 'BLOCK_COMMENT': -80, '$end': -80, 'COMMA': -80, 'RBRACKET': -80, 'RBRACE': -80},
+    88: {'COMMA': -77, 'RBRACKET': -77},
+    89: {'PLUS': -68, 'MINUS': -68, 'HEXADECIMAL': -68, 'FLOAT': -68, 'INTEGER': -68, 'NAN': -68, 'INFINITY': -68, 'OCTAL': -68, 'NULL': -68, 'FALSE': -68, 'TRUE': -68, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -68, 'UNTERMINATED_SINGLE_QUOTE_STRING': -68, 'SINGLE_QUOTE_STRING': -68, 'DOUBLE_QUOTE_STRING': -68, 'LBRACKET': -68, 'LBRACE': -68, 'COMMA': -68, 'RBRACKET': -68, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    90: {'COMMA': -60, 'RBRACKET': -60},
+    91: {'COMMA': -61, 'RBRACKET': -61, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    92: {'WHITESPACE': -64, 'LINE_COMMENT': -64, 'BLOCK_COMMENT': -64, 'COMMA': -64, 'RBRACKET': -64},
+    93: {'WHITESPACE': -65, 'LINE_COMMENT': -65, 'BLOCK_COMMENT': -65, 'COMMA': -65, 'RBRACKET': -65},
+    94: {'WHITESPACE': -52, 'LINE_COMMENT': -52, 'BLOCK_COMMENT': -52, '$end': -52, 'COMMA': -52, 'RBRACKET': -52, 'RBRACE': -52},
+    95: {'COMMA': -43, 'RBRACE': -43},
+    96: {'UNTERMINATED_DOUBLE_QUOTE_STRING': -30, 'UNTERMINATED_SINGLE_QUOTE_STRING': -30, 'NAME': -30, 'SINGLE_QUOTE_STRING': -30, 'DOUBLE_QUOTE_STRING': -30, 'COMMA': -30, 'RBRACE': -30, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    97: {'COLON': 108},
+    98: {'WHITESPACE': -15, 'LINE_COMMENT': -15, 'BLOCK_COMMENT': -15, 'COLON': -15},
+    99: {'COMMA': -73, 'RBRACKET': -73, 'PLUS': -91, 'MINUS': -91, 'HEXADECIMAL': -91, 'FLOAT': -91, 'INTEGER': -91, 'NAN': -91, 'INFINITY': -91, 'OCTAL': -91, 'NULL': -91, 'FALSE': -91, 'TRUE': -91, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -91, 'UNTERMINATED_SINGLE_QUOTE_STRING': -91, 'SINGLE_QUOTE_STRING': -91, 'DOUBLE_QUOTE_STRING': -91, 'LBRACKET': -91, 'LBRACE': -91},
+    100: {'PLUS': -67, 'MINUS': -67, 'HEXADECIMAL': -67, 'FLOAT': -67, 'INTEGER': -67, 'NAN': -67, 'INFINITY': -67, 'OCTAL': -67, 'NULL': -67, 'FALSE': -67, 'TRUE': -67, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -67, 'UNTERMINATED_SINGLE_QUOTE_STRING': -67, 'SINGLE_QUOTE_STRING': -67, 'DOUBLE_QUOTE_STRING': -67, 'LBRACKET': -67, 'LBRACE': -67, 'COMMA': -67, 'RBRACKET': -67, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    101: {'WHITESPACE': -70, 'LINE_COMMENT': -70, 'BLOCK_COMMENT': -70, 'PLUS': -70, 'MINUS': -70, 'HEXADECIMAL': -70, 'FLOAT': -70, 'INTEGER': -70, 'NAN': -70, 'INFINITY': -70, 'OCTAL': -70, 'NULL': -70, 'FALSE': -70, 'TRUE': -70, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -70, 'UNTERMINATED_SINGLE_QUOTE_STRING': -70, 'SINGLE_QUOTE_STRING': -70, 'DOUBLE_QUOTE_STRING': -70, 'LBRACKET': -70, 'LBRACE': -70, 'COMMA': -70, 'RBRACKET': -70},
+    102: {'WHITESPACE': -71, 'LINE_COMMENT': -71, 'BLOCK_COMMENT': -71, 'PLUS': -71, 'MINUS': -71, 'HEXADECIMAL': -71, 'FLOAT': -71, 'INTEGER': -71, 'NAN': -71, 'INFINITY': -71, 'OCTAL': -71, 'NULL': -71, 'FALSE': -71, 'TRUE': -71, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -71, 'UNTERMINATED_SINGLE_QUOTE_STRING': -71, 'SINGLE_QUOTE_STRING': -71, 'DOUBLE_QUOTE_STRING': -71, 'LBRACKET': -71, 'LBRACE': -71, 'COMMA': -71, 'RBRACKET': -71},
+    103: {'WHITESPACE': -63, 'LINE_COMMENT': -63, 'BLOCK_COMMENT': -63, 'COMMA': -63, 'RBRACKET': -63},
+    104: {'COMMA': -35, 'RBRACE': -35, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -47, 'UNTERMINATED_SINGLE_QUOTE_STRING': -47, 'NAME': -47, 'SINGLE_QUOTE_STRING': -47, 'DOUBLE_QUOTE_STRING': -47},
+    105: {'UNTERMINATED_DOUBLE_QUOTE_STRING': -29, 'UNTERMINATED_SINGLE_QUOTE_STRING': -29, 'NAME': -29, 'SINGLE_QUOTE_STRING': -29, 'DOUBLE_QUOTE_STRING': -29, 'COMMA': -29, 'RBRACE': -29, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    106: {'WHITESPACE': -32, 'LINE_COMMENT': -32, 'BLOCK_COMMENT': -32, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -32, 'UNTERMINATED_SINGLE_QUOTE_STRING': -32, 'NAME': -32, 'SINGLE_QUOTE_STRING': -32, 'DOUBLE_QUOTE_STRING': -32, 'COMMA': -32, 'RBRACE': -32},
+    107: {'WHITESPACE': -33, 'LINE_COMMENT': -33, 'BLOCK_COMMENT': -33, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -33, 'UNTERMINATED_SINGLE_QUOTE_STRING': -33, 'NAME': -33, 'SINGLE_QUOTE_STRING': -33, 'DOUBLE_QUOTE_STRING': -33, 'COMMA': -33, 'RBRACE': -33},
+    108: {'PLUS': -19, 'MINUS': -19, 'HEXADECIMAL': -19, 'FLOAT': -19, 'INTEGER': -19, 'NAN': -19, 'INFINITY': -19, 'OCTAL': -19, 'NULL': -19, 'FALSE': -19, 'TRUE': -19, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -19, 'UNTERMINATED_SINGLE_QUOTE_STRING': -19, 'SINGLE_QUOTE_STRING': -19, 'DOUBLE_QUOTE_STRING': -19, 'LBRACKET': -19, 'LBRACE': -19, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    109: {'COMMA': -66, 'RBRACKET': -66},
+    110: {'COMMA': -72, 'RBRACKET': -72},
+    111: {'WHITESPACE': -69, 'LINE_COMMENT': -69, 'BLOCK_COMMENT': -69, 'PLUS': -69, 'MINUS': -69, 'HEXADECIMAL': -69, 'FLOAT': -69, 'INTEGER': -69, 'NAN': -69, 'INFINITY': -69, 'OCTAL': -69, 'NULL': -69, 'FALSE': -69, 'TRUE': -69, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -69, 'UNTERMINATED_SINGLE_QUOTE_STRING': -69, 'SINGLE_QUOTE_STRING': -69, 'DOUBLE_QUOTE_STRING': -69, 'LBRACKET': -69, 'LBRACE': -69, 'COMMA': -69, 'RBRACKET': -69},
+    112: {'COMMA': -28, 'RBRACE': -28},
+    113: {'COMMA': -34, 'RBRACE': -34},
+    114: {'WHITESPACE': -31, 'LINE_COMMENT': -31, 'BLOCK_COMMENT': -31, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -31, 'UNTERMINATED_SINGLE_QUOTE_STRING': -31, 'NAME': -31, 'SINGLE_QUOTE_STRING': -31, 'DOUBLE_QUOTE_STRING': -31, 'COMMA': -31, 'RBRACE': -31},
+    115: {'PLUS': -49, 'MINUS': -49, 'HEXADECIMAL': -49, 'FLOAT': -49, 'INTEGER': -49, 'NAN': -49, 'INFINITY': -49, 'OCTAL': -49, 'NULL': -49, 'FALSE': -49, 'TRUE': -49, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -49, 'UNTERMINATED_SINGLE_QUOTE_STRING': -49, 'SINGLE_QUOTE_STRING': -49, 'DOUBLE_QUOTE_STRING': -49, 'LBRACKET': -49, 'LBRACE': -49},
+    116: {'PLUS': -18, 'MINUS': -18, 'HEXADECIMAL': -18, 'FLOAT': -18, 'INTEGER': -18, 'NAN': -18, 'INFINITY': -18, 'OCTAL': -18, 'NULL': -18, 'FALSE': -18, 'TRUE': -18, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -18, 'UNTERMINATED_SINGLE_QUOTE_STRING': -18, 'SINGLE_QUOTE_STRING': -18, 'DOUBLE_QUOTE_STRING': -18, 'LBRACKET': -18, 'LBRACE': -18, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    117: {'WHITESPACE': -21, 'LINE_COMMENT': -21, 'BLOCK_COMMENT': -21, 'PLUS': -21, 'MINUS': -21, 'HEXADECIMAL': -21, 'FLOAT': -21, 'INTEGER': -21, 'NAN': -21, 'INFINITY': -21, 'OCTAL': -21, 'NULL': -21, 'FALSE': -21, 'TRUE': -21, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -21, 'UNTERMINATED_SINGLE_QUOTE_STRING': -21, 'SINGLE_QUOTE_STRING': -21, 'DOUBLE_QUOTE_STRING': -21, 'LBRACKET': -21, 'LBRACE': -21},
+    118: {'WHITESPACE': -22, 'LINE_COMMENT': -22, 'BLOCK_COMMENT': -22, 'PLUS': -22, 'MINUS': -22, 'HEXADECIMAL': -22, 'FLOAT': -22, 'INTEGER': -22, 'NAN': -22, 'INFINITY': -22, 'OCTAL': -22, 'NULL': -22, 'FALSE': -22, 'TRUE': -22, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -22, 'UNTERMINATED_SINGLE_QUOTE_STRING': -22, 'SINGLE_QUOTE_STRING': -22, 'DOUBLE_QUOTE_STRING': -22, 'LBRACKET': -22, 'LBRACE': -22},
+    119: {'PLUS': 17, 'MINUS': 18, 'HEXADECIMAL': 19, 'FLOAT': 20, 'INTEGER': 21, 'NAN': 22, 'INFINITY': 23, 'OCTAL': 24, 'NULL': 25, 'FALSE': 26, 'TRUE': 27, 'UNTERMINATED_DOUBLE_QUOTE_STRING': 30, 'UNTERMINATED_SINGLE_QUOTE_STRING': 31, 'LBRACKET': -88, 'LBRACE': -46, 'SINGLE_QUOTE_STRING': 34, 'DOUBLE_QUOTE_STRING': 35},
+    120: {'WHITESPACE': -20, 'LINE_COMMENT': -20, 'BLOCK_COMMENT': -20, 'PLUS': -20, 'MINUS': -20, 'HEXADECIMAL': -20, 'FLOAT': -20, 'INTEGER': -20, 'NAN': -20, 'INFINITY': -20, 'OCTAL': -20, 'NULL': -20, 'FALSE': -20, 'TRUE': -20, 'UNTERMINATED_DOUBLE_QUOTE_STRING': -20, 'UNTERMINATED_SINGLE_QUOTE_STRING': -20, 'SINGLE_QUOTE_STRING': -20, 'DOUBLE_QUOTE_STRING': -20, 'LBRACKET': -20, 'LBRACE': -20},
+    121: {'COMMA': -24, 'RBRACE': -24, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    122: {'COMMA': -12, 'RBRACE': -12},
+    123: {'COMMA': -23, 'RBRACE': -23, 'WHITESPACE': 7, 'LINE_COMMENT': 8, 'BLOCK_COMMENT': 9},
+    124: {'WHITESPACE': -26, 'LINE_COMMENT': -26, 'BLOCK_COMMENT': -26, 'COMMA': -26, 'RBRACE': -26},
+    125: {'WHITESPACE': -27, 'LINE_COMMENT': -27, 'BLOCK_COMMENT': -27, 'COMMA': -27, 'RBRACE': -27},
+    126: {'WHITESPACE': -25, 'LINE_COMMENT': -25, 'BLOCK_COMMENT': -25, 'COMMA': -25, 'RBRACE': -25},
+}
+
+lr_goto: dict[int, dict[str, int]] = {
+    0: {'text': 1, '_1_wsc_repeat': 2, '_1_wsc_items': 3, '_1_wsc_item': 4, 'wsc': 5, 'comment': 6},
+    1: {},
+    2: {'value': 10, 'number': 11, 'null': 12, 'boolean': 13, 'json_array': 14, 'json_object': 15, 'string': 16, 'seen_LBRACKET': 28, 'seen_LBRACE': 29, 'single_quoted_string': 32, 'double_quoted_string': 33},
+    3: {'_1_wsc_item': 36, 'wsc': 5, 'comment': 6},
+    4: {},
+    5: {},
+    6: {},
+    7: {},
+    8: {},
+    9: {},
+    10: {'_2_wsc_repeat': 37, '_2_wsc_items': 38, '_2_wsc_item': 39, 'wsc': 40, 'comment': 6},
+    11: {},
+    12: {},
+    13: {},
+    14: {},
+    15: {},
+    16: {},
+    17: {'number': 41},
+    18: {'number': 42},
+    19: {},
+    20: {},
+    21: {},
+    22: {},
+    23: {},
+    24: {},
+    25: {},
+    26: {},
+    27: {},
+    28: {},
+    29: {},
+    30: {},
+    31: {},
+    32: {},
+    33: {},
+    34: {},
+    35: {},
+    36: {},
+    37: {},
+    38: {'_2_wsc_item': 47, 'wsc': 40, 'comment': 6},
+    39: {},
+    40: {},
+    41: {},
+    42: {},
+    43: {},
+    44: {},
+    45: {'_15_wsc_repeat': 48, '_15_wsc_items': 49, '_15_wsc_item': 50, 'wsc': 51, 'comment': 6},
+    46: {'_9_wsc_repeat': 52, '_9_wsc_items': 53, '_9_wsc_item': 54, 'wsc': 55, 'comment': 6},
+    47: {},
+    48: {'_16_array_values_optional': 56, 'array_values': 57, 'first_array_value': 58, 'array_value_seen': 59},
+    49: {'_15_wsc_item': 60, 'wsc': 51, 'comment': 6},
+    50: {},
+    51: {},
+    52: {'_10_key_value_pairs_optional': 61, 'key_value_pairs': 62, 'first_key_value_pair': 63, 'key': 64, 'seen_key': 65},
+    53: {'_9_wsc_item': 66, 'wsc': 55, 'comment': 6},
+    54: {},
+    55: {},
+    56: {'seen_RBRACKET': 67},
+    57: {},
+    58: {'_14_subsequent_array_value_repeat': 68, '_14_subsequent_array_value_items': 69, '_14_subsequent_array_value_item': 70, 'subsequent_array_value': 71, 'array_delimiter_seen': 72},
+    59: {'value': 73, 'number': 11, 'null': 12, 'boolean': 13, 'json_array': 14, 'json_object': 15, 'string': 16, 'seen_LBRACKET': 28, 'seen_LBRACE': 29, 'single_quoted_string': 32, 'double_quoted_string': 33},
+    60: {},
+    61: {'seen_RBRACE': 74},
+    62: {},
+    63: {'_8_subsequent_key_value_pair_repeat': 75, '_8_subsequent_key_value_pair_items': 76, '_8_subsequent_key_value_pair_item': 77, 'subsequent_key_value_pair': 78, 'object_delimiter_seen': 79},
+    64: {'_3_wsc_repeat': 80, '_3_wsc_items': 81, '_3_wsc_item': 82, 'wsc': 83, 'comment': 6},
+    65: {'string': 84, 'identifier': 85, 'single_quoted_string': 32, 'double_quoted_string': 33},
+    66: {},
+    67: {},
+    68: {},
+    69: {'_14_subsequent_array_value_item': 88, 'subsequent_array_value': 71, 'array_delimiter_seen': 72},
+    70: {},
+    71: {},
+    72: {},
+    73: {'_11_wsc_repeat': 90, '_11_wsc_items': 91, '_11_wsc_item': 92, 'wsc': 93, 'comment': 6},
+    74: {},
+    75: {},
+    76: {'_8_subsequent_key_value_pair_item': 95, 'subsequent_key_value_pair': 78, 'object_delimiter_seen': 79},
+    77: {},
+    78: {},
+    79: {},
+    80: {'seen_colon': 97},
+    81: {'_3_wsc_item': 98, 'wsc': 83, 'comment': 6},
+    82: {},
+    83: {},
+    84: {},
+    85: {},
+    86: {},
+    87: {},
+    88: {},
+    89: {'_12_wsc_repeat': 99, '_12_wsc_items': 100, '_12_wsc_item': 101, 'wsc': 102, 'comment': 6},
+    90: {},
+    91: {'_11_wsc_item': 103, 'wsc': 93, 'comment': 6},
+    92: {},
+    93: {},
+    94: {},
+    95: {},
+    96: {'_6_wsc_repeat': 104, '_6_wsc_items': 105, '_6_wsc_item': 106, 'wsc': 107, 'comment': 6},
+    97: {},
+    98: {},
+    99: {'_13_first_array_value_optional': 109, 'first_array_value': 110, 'array_value_seen': 59},
+    100: {'_12_wsc_item': 111, 'wsc': 102, 'comment': 6},
+    101: {},
+    102: {},
+    103: {},
+    104: {'_7_first_key_value_pair_optional': 112, 'first_key_value_pair': 113, 'key': 64, 'seen_key': 65},
+    105: {'_6_wsc_item': 114, 'wsc': 107, 'comment': 6},
+    106: {},
+    107: {},
+    108: {'_4_wsc_repeat': 115, '_4_wsc_items': 116, '_4_wsc_item': 117, 'wsc': 118, 'comment': 6},
+    109: {},
+    110: {},
+    111: {},
+    112: {},
+    113: {},
+    114: {},
+    115: {'object_value_seen': 119},
+    116: {'_4_wsc_item': 120, 'wsc': 118, 'comment': 6},
+    117: {},
+    118: {},
+    119: {'value': 121, 'number': 11, 'null': 12, 'boolean': 13, 'json_array': 14, 'json_object': 15, 'string': 16, 'seen_LBRACKET': 28, 'seen_LBRACE': 29, 'single_quoted_string': 32, 'double_quoted_string': 33},
+    120: {},
+    121: {'_5_wsc_repeat': 122, '_5_wsc_items': 123, '_5_wsc_item': 124, 'wsc': 125, 'comment': 6},
+    122: {},
+    123: {'_5_wsc_item': 126, 'wsc': 125, 'comment': 6},
+    124: {},
+    125: {},
+    126: {},
+}
+
+defaulted_states: dict[int, int] = {37: -1, 56: -89, 57: -86, 61: -51, 62: -58, 68: -74, 75: -40, 80: -48}
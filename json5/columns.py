@@ -0,0 +1,203 @@
+"""
+Decoding arrays of records, such as ``[{ts: 1, v: 2.0}, {ts: 2, v: 2.5}]``, into columns: a dict holding a list of
+values for each field, such as ``{'ts': [1, 2], 'v': [2.0, 2.5]}``.
+
+The fields of each record are added to their columns as they are decoded, so no dict is kept for any of the records.
+"""
+from __future__ import annotations
+
+import json
+import typing
+
+from .decoder import _convert_numeric_arrays
+from .decoder import _detect_encoding
+from .decoder import _is_json_compatible
+from .decoder import _json_decoder
+from .decoder import _JSON_WHITESPACE
+from .decoder import _parse_source
+from .decoder import _uses_json
+from .decoder import Decoder
+from .loader import _numeric_array
+from .loader import Environment
+from .utils import JSON5DecodeError
+
+if typing.TYPE_CHECKING:
+    from mmap import mmap
+
+__all__ = ['ColumnDecoder']
+
+
+class _Columns:
+    """
+    The columns of the records decoded so far. Records missing a field have ``None`` in its column.
+    """
+
+    __slots__ = ('columns', 'rows', 'filled', 'fields', 'field_columns')
+
+    def __init__(self) -> None:
+        self.columns: dict[typing.Any, list[typing.Any]] = {}
+        self.rows = 0
+        # how many of the columns have a value for the current record
+        self.filled = 0
+        # the fields of the last record added by ``add_record`` and their columns, if it had all of the fields
+        self.fields: tuple[typing.Any, ...] | None = None
+        self.field_columns: tuple[list[typing.Any], ...] = ()
+
+    def add(self, key: typing.Any, value: typing.Any) -> None:
+        column = self.columns.get(key)
+        if column is None:
+            column = self.columns[key] = [None] * self.rows
+        elif len(column) > self.rows:
+            # a duplicate key: the last value wins, as in objects
+            column[-1] = value
+            return
+        column.append(value)
+        self.filled += 1
+
+    def end_row(self) -> None:
+        if self.filled != len(self.columns):
+            for column in self.columns.values():
+                if len(column) == self.rows:
+                    column.append(None)
+        self.rows += 1
+        self.filled = 0
+
+    def add_record(self, record: dict[typing.Any, typing.Any]) -> None:
+        """
+        Add all the fields of a record. When it has the same fields in the same order as the record before, their
+        values are appended to the columns without looking them up.
+        """
+        fields = tuple(record)
+        if fields == self.fields:
+            for column, value in zip(self.field_columns, record.values()):
+                column.append(value)
+            self.rows += 1
+            return
+        for key, value in record.items():
+            self.add(key, value)
+        self.end_row()
+        if len(fields) == len(self.columns):
+            self.fields = fields
+            self.field_columns = tuple(self.columns[key] for key in fields)
+        else:
+            self.fields = None
+
+
+class ColumnDecoder(Decoder):
+    """
+    A ``Decoder`` for documents that are an array of objects, which returns a dict of the values of each field (in the
+    order the fields first appear) rather than a list of dicts. Records that lack some of the fields have ``None`` in
+    their columns. Documents that aren't an array of objects raise a ``JSON5DecodeError``.
+
+    With ``numeric_arrays``, columns holding only numbers become arrays too, like arrays of numbers in the values do.
+    The object hooks apply to the objects in the values, but not to the records themselves.
+
+    Documents that are plain JSON are decoded one record at a time with the ``json`` module, unless ``try_json`` is
+    ``False``, ``max_depth`` is set, or an object hook is set (as the ``json`` module would pass it the records).
+    """
+
+    def __init__(self, env: Environment | None = None, try_json: bool = True, **env_kwargs: typing.Any):
+        super().__init__(env, try_json=False, **env_kwargs)
+        env = self.env
+        self.record_decoder: json.JSONDecoder | None = None
+        if try_json and _uses_json(env) and env.object_hook is None and env.object_pairs_hook is None:
+            self.record_decoder = _json_decoder(env)
+
+    def decode(self, s: str) -> dict[typing.Any, typing.Any]:
+        if self.record_decoder is not None and _is_json_compatible(s):
+            try:
+                return self._decode_json_records(s, self.record_decoder)
+            except (json.JSONDecodeError, RecursionError):
+                pass
+            except Exception:
+                # a hook failed: report any error in the document instead, as Decoder.decode does
+                _parse_source(s)
+                raise
+        columns: dict[typing.Any, typing.Any] = super().decode(s)
+        return columns
+
+    def decode_bytes(self, data: bytes | bytearray | memoryview | mmap) -> dict[typing.Any, typing.Any]:
+        if self.record_decoder is not None:
+            return self.decode(str(data, _detect_encoding(data)))
+        columns: dict[typing.Any, typing.Any] = super().decode_bytes(data)
+        return columns
+
+    def _decode_json_records(self, s: str, record_decoder: json.JSONDecoder) -> dict[typing.Any, typing.Any]:
+        """
+        Decode the records of a JSON document one by one with the ``json`` module. Anything that isn't an array of
+        objects raises a ``json.JSONDecodeError``, so the document is decoded again as JSON5 to report the error.
+        """
+        numeric_arrays = self.env.numeric_arrays
+        columns = _Columns()
+        idx = _JSON_WHITESPACE.match(s, 0).end()
+        if s[idx : idx + 1] != '[':
+            raise json.JSONDecodeError('Expected an array of objects', s, idx)
+        idx = _JSON_WHITESPACE.match(s, idx + 1).end()
+        # scan_once decodes the value starting at an index, like raw_decode but without its overhead
+        scan_once = record_decoder.scan_once  # type: ignore[attr-defined]
+        if s[idx : idx + 1] != ']':
+            while True:
+                if s[idx : idx + 1] != '{':
+                    raise json.JSONDecodeError('Expected an object', s, idx)
+                record, idx = scan_once(s, idx)
+                if numeric_arrays:
+                    _convert_numeric_arrays(record, numeric_arrays)
+                columns.add_record(record)
+                if s[idx : idx + 1] != ',':
+                    idx = _JSON_WHITESPACE.match(s, idx).end()
+                if s[idx : idx + 1] == ',':
+                    idx = _JSON_WHITESPACE.match(s, idx + 1).end()
+                    continue
+                break
+        if s[idx : idx + 1] != ']':
+            raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+        if _JSON_WHITESPACE.match(s, idx + 1).end() != len(s):
+            raise json.JSONDecodeError('Extra data', s, idx + 1)
+        return self._finish_columns(columns)
+
+    def _value(self, depth: int = 0) -> typing.Any:
+        """
+        Decode the array of records starting at the current token into columns
+        """
+        tok = self._tok
+        if tok is None or tok.type != 'LBRACKET':
+            raise JSON5DecodeError('Expected an array of objects', tok)
+        max_depth = self.env.max_depth
+        if max_depth is not None and depth >= max_depth:
+            raise JSON5DecodeError(f'Maximum nesting depth of {max_depth} exceeded', tok)
+        columns = _Columns()
+        self._advance()
+        self._skip_wsc()
+        while self._tok is not None and self._tok.type != 'RBRACKET':
+            tok = self._tok
+            if tok.type != 'LBRACE':
+                raise JSON5DecodeError('Expected an object', tok)
+            if max_depth is not None and depth + 1 >= max_depth:
+                raise JSON5DecodeError(f'Maximum nesting depth of {max_depth} exceeded', tok)
+            self._advance()
+            self._skip_wsc()
+            while self._tok is not None and self._tok.type != 'RBRACE':
+                key = self._key()
+                self._expect('COLON')
+                self._skip_wsc()
+                columns.add(key, super()._value(depth + 2))
+                self._skip_wsc()
+                if self._tok is None or self._tok.type != 'COMMA':
+                    break
+                self._advance()
+                self._skip_wsc()
+            self._expect('RBRACE')
+            columns.end_row()
+            self._skip_wsc()
+            if self._tok is None or self._tok.type != 'COMMA':
+                break
+            self._advance()
+            self._skip_wsc()
+        self._expect('RBRACKET')
+        return self._finish_columns(columns)
+
+    def _finish_columns(self, columns: _Columns) -> dict[typing.Any, typing.Any]:
+        numeric_arrays = self.env.numeric_arrays
+        if not numeric_arrays:
+            return columns.columns
+        return {key: _numeric_array(column, numeric_arrays) for key, column in columns.columns.items()}
@@ -0,0 +1,802 @@
+from __future__ import annotations
+
+import json
+import math
+import typing
+
+import regex as re
+
+from .loader import _numeric_array
+from .loader import Environment
+from .tokenizer import decode_identifier_name
+from .tokenizer import decode_string_literal
+from .tokenizer import DEFAULT_CHUNK_SIZE
+from .tokenizer import is_valid_identifier_name
+from .tokenizer import JSON5Token
+from .tokenizer import JSONLexer
+from .tokenizer import tokenize
+from .tokenizer import tokenize_bytes
+from .tokenizer import tokenize_file
+from .utils import JSON5DecodeError
+from .utils import JsonIdentifier
+
+if typing.TYPE_CHECKING:
+    from mmap import mmap
+
+    from .loader import T_NumericArrays
+
+__all__ = ['Decoder', 'items', 'iterparse']
+
+_WSC_TYPES = frozenset({'WHITESPACE', 'LINE_COMMENT', 'BLOCK_COMMENT'})
+
+# JSON5 decodes surrogate escapes one at a time rather than combining pairs like the json module does
+_SURROGATE_ESCAPE = re.compile(r'\\u[dD][89a-fA-F]')
+
+# Characters that, right after a value the json module decoded, mean the JSON5 tokens there are different (``0x1F``,
+# ``01`` or ``1.`` are numbers and ``trueish`` is a name in JSON5, but json stops decoding after the first character)
+_JSON5_TOKEN_CONTINUES = re.compile(r'[\w$.\\]')
+
+
+# JSON (not JSON5) whitespace, which the json module expects to have been skipped before a value it decodes
+_JSON_WHITESPACE = json.decoder.WHITESPACE  # type: ignore[attr-defined]
+
+_CONSTANTS: dict[str, typing.Any] = {'Infinity': math.inf, '-Infinity': -math.inf, 'NaN': math.nan}
+
+
+def _parse_source(s: str) -> None:
+    # The full parser is only needed to produce detailed error messages, so it (and sly) is imported on first use
+    from .parser import parse_source
+
+    parse_source(s)
+
+
+def _unsigned(hook: typing.Callable[[str], typing.Any]) -> typing.Callable[[str], typing.Any]:
+    # The json module passes the sign of a number to parse_int/parse_float, but JSON5 treats it as a unary operator
+    def parse(raw_value: str) -> typing.Any:
+        if raw_value[0] == '-':
+            return hook(raw_value[1:]) * -1
+        return hook(raw_value)
+
+    return parse
+
+
+def _json_decoder(env: Environment) -> json.JSONDecoder:
+    """
+    Make a stdlib JSON decoder that produces the same results as JSON5 decoding with the given environment
+    """
+    object_pairs_hook: typing.Callable[[list[tuple[str, typing.Any]]], typing.Any] | None = None
+    if env.object_pairs_hook is not None:
+        pairs_hook = env.object_pairs_hook
+
+        def deduplicated_pairs_hook(pairs: list[tuple[str, typing.Any]]) -> typing.Any:
+            # JSON5 only passes on the last value of any duplicate keys
+            return pairs_hook(list(dict(pairs).items()))
+
+        object_pairs_hook = deduplicated_pairs_hook
+
+    return json.JSONDecoder(
+        object_hook=env.object_hook,
+        parse_float=_unsigned(env.parse_float) if env.parse_float else None,
+        parse_int=_unsigned(env.parse_int) if env.parse_int else None,
+        parse_constant=env.parse_constant or _CONSTANTS.__getitem__,  # type: ignore[arg-type]
+        object_pairs_hook=object_pairs_hook,
+        strict=True,
+    )
+
+
+def _uses_json(env: Environment) -> bool:
+    """
+    Whether documents can be decoded by the json module. It has no depth limit of its own, and when numeric arrays are
+    converted, object hooks would be passed lists where JSON5 decoding passes them arrays.
+    """
+    if env.max_depth is not None:
+        return False
+    return not env.numeric_arrays or (env.object_hook is None and env.object_pairs_hook is None)
+
+
+def _convert_numeric_arrays(value: typing.Any, numeric_arrays: T_NumericArrays) -> typing.Any:
+    """
+    Convert the arrays of numbers in a value decoded by the json module, which has no hook for arrays, like
+    ``Decoder`` does. The dicts and lists are walked with an explicit stack and updated in place.
+    """
+    if type(value) is list:
+        converted = _numeric_array(value, numeric_arrays)
+        if converted is not value:
+            return converted
+    elif type(value) is not dict:
+        return value
+    stack = [value]
+    while stack:
+        container = stack.pop()
+        for key, item in container.items() if type(container) is dict else enumerate(container):
+            item_type = type(item)
+            if item_type is list:
+                converted = _numeric_array(item, numeric_arrays)
+                if converted is item:
+                    stack.append(item)
+                else:
+                    container[key] = converted
+            elif item_type is dict:
+                stack.append(item)
+    return value
+
+
+def _detect_encoding(data: bytes | bytearray | memoryview | mmap) -> str:
+    """
+    Detect the encoding of a JSON5 document from its first bytes, which can only be ASCII characters
+    """
+    return json.detect_encoding(bytes(data[:4]))
+
+
+def _is_json_compatible(s: str, start: int = 0, end: int | None = None) -> bool:
+    """
+    Whether any valid JSON in ``s[start:end]`` would decode the same way with the json module as it does as JSON5
+    """
+    if end is None:
+        end = len(s)
+    if s.find('\u2028', start, end) != -1 or s.find('\u2029', start, end) != -1:
+        # allowed in JSON strings, but JSON5 strings may not contain these unescaped
+        return False
+    if s.find('\\u', start, end) != -1 and _SURROGATE_ESCAPE.search(s, start, end):
+        return False
+    return True
+
+
+def _string_value(tok: JSON5Token) -> str:
+    errors: list[JSON5DecodeError] = []
+    characters = decode_string_literal(tok.value, tok, errors)
+    if errors:
+        raise errors[0]
+    return characters
+
+
+def _identifier_value(tok: JSON5Token) -> JsonIdentifier:
+    name = tok.value
+    if '\\' in name:
+        name = decode_identifier_name(name)
+        if not is_valid_identifier_name(name):
+            raise JSON5DecodeError('Invalid identifier name', tok)
+    return JsonIdentifier(name)
+
+
+def _stop_at_illegal_character(
+    lexer: JSONLexer, tokens: typing.Iterator[JSON5Token]
+) -> typing.Generator[JSON5Token, None, None]:
+    # Text following a value doesn't have to be JSON5 at all. Rather than failing when the lexer reaches it, end the
+    # tokens with an ERROR token, which is only a problem if it turns out to be part of the value.
+    try:
+        yield from tokens
+    except JSON5DecodeError as exc:
+        yield JSON5Token('ERROR', exc.msg, lexer.lineno, lexer.index, lexer.index, '')
+
+
+class Decoder:
+    """
+    Decode JSON5 text directly into Python objects.
+
+    This produces the same results as parsing the text to a model and loading it with ``DefaultLoader``, but builds
+    the Python objects straight from the token stream without creating any model nodes along the way.
+
+    The decoder only does the bare minimum of error checking needed to recognize whether a document is valid. When
+    it finds a problem, the document is handed to the full parser, which produces the detailed error message.
+
+    Because much JSON5 input is really just JSON, documents are first given to the (much faster) ``json`` module,
+    unless ``try_json`` is ``False``. Only when that fails are they decoded as JSON5. (The ``json`` module has no depth
+    limit of its own, so it isn't used when ``max_depth`` is set, nor when ``numeric_arrays`` is set along with an
+    object hook.)
+
+    A decoder is configured once, with an ``env`` or the same keyword arguments as ``loads`` (``object_hook``,
+    ``parse_float``, ``parse_int``, ``parse_constant``, ``strict``, ``object_pairs_hook``, ``parse_json5_identifiers``,
+    ``max_depth`` and ``numeric_arrays``), and can then be used to decode any number of documents. It keeps state while
+    decoding, so one decoder should not be used by several threads at once.
+    """
+
+    def __init__(self, env: Environment | None = None, try_json: bool = True, **env_kwargs: typing.Any):
+        if env is None:
+            env = Environment(**env_kwargs)
+        self.env: Environment = env
+        self.json_decoder: json.JSONDecoder | None = _json_decoder(env) if try_json and _uses_json(env) else None
+        self._tokens: typing.Iterator[JSON5Token] = iter(())
+        self._tok: JSON5Token | None = None
+        # The keys decoded so far, by their source text. Objects in a document tend to share the same keys, so each
+        # distinct key is only decoded once and all objects refer to the same key object. Cleared after each top-level
+        # value, so decoding a stream of values doesn't keep the keys of all of them.
+        self._keys: dict[str, str] = {}
+        # Where the previous raw_decode started: the text, the index, its line number and whether the json module may
+        # still decode the values there. Decoding several values of a text in a row calls raw_decode with increasing
+        # indexes, and this lets each call carry on from the previous one rather than look at the text from its start.
+        self._raw_position: tuple[str, int, int, bool] | None = None
+
+    def decode(self, s: str) -> typing.Any:
+        try:
+            if self.json_decoder is not None and _is_json_compatible(s):
+                try:
+                    value = self.json_decoder.decode(s)
+                except (json.JSONDecodeError, RecursionError):
+                    # the json module decodes nested values recursively, so it can't decode very deeply nested documents
+                    pass
+                else:
+                    if self.env.numeric_arrays:
+                        return _convert_numeric_arrays(value, self.env.numeric_arrays)
+                    return value
+            return self._decode(s)
+        except Exception:
+            # Let the full parser report the error with all of its context.
+            # In the (unexpected) case it finds no problem, fall back to our own error.
+            # Hooks are called as values are decoded, so one may raise before the decoder has reached an error further
+            # on in the document. The parser checks the whole document, so that error is the one reported.
+            _parse_source(s)
+            raise
+
+    def raw_decode(self, s: str, idx: int = 0) -> tuple[typing.Any, int]:
+        """
+        Decode the first JSON5 value in ``s`` starting at index ``idx``, ignoring whatever text follows it.
+        Whitespace and comments before the value are skipped.
+
+        Returns a tuple of the value and the index in ``s`` where the value ended. This can be used to decode a value
+        embedded in a larger text, or several values in a row, without slicing ``s``.
+        """
+        position = self._raw_position
+        if position is not None and position[0] is s and position[1] <= idx:
+            lineno = position[2] + s.count('\n', position[1], idx)
+            json_decoder = self.json_decoder if position[3] else None
+        else:
+            lineno = s.count('\n', 0, idx) + 1
+            json_decoder = self.json_decoder
+        if json_decoder is not None:
+            try:
+                value, end = json_decoder.raw_decode(s, _JSON_WHITESPACE.match(s, idx).end())
+            except (json.JSONDecodeError, RecursionError):
+                pass
+            else:
+                if _is_json_compatible(s, idx, end) and not _JSON5_TOKEN_CONTINUES.match(s, end):
+                    self._raw_position = (s, idx, lineno, True)
+                    if self.env.numeric_arrays:
+                        value = _convert_numeric_arrays(value, self.env.numeric_arrays)
+                    return value, end
+        # A json error counts the lines from the start of the text to where it happened, so once the json module fails on
+        # a text it isn't tried again on the rest of it
+        self._raw_position = (s, idx, lineno, False)
+        lexer = JSONLexer()
+        self._tokens = _stop_at_illegal_character(lexer, lexer.tokenize(s, lineno=lineno, index=idx))
+        self._advance()
+        try:
+            self._skip_wsc()
+            value = self._value()
+            # The lexer has already produced the token after the value, which starts where the value ends
+            return value, len(s) if self._tok is None else self._tok.index
+        except JSON5DecodeError as exc:
+            if exc.token is not None and exc.token.type == 'ERROR':
+                raise JSON5DecodeError(exc.token.value, None) from None
+            raise
+        finally:
+            self._tokens = iter(())
+            self._tok = None
+            self._keys.clear()
+
+    def decode_stream(self, f: typing.TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> typing.Any:
+        """
+        Decode the JSON5 document read from ``f``, reading it ``chunk_size`` characters at a time.
+
+        Text is discarded as soon as it has been decoded, so memory use does not grow with the size of the document
+        (apart from the decoded objects themselves). Since the text is no longer available when a problem is found,
+        error messages can't be as detailed as those of ``decode``.
+        """
+        return self._decode_tokens(tokenize_file(f, chunk_size=chunk_size))
+
+    def decode_bytes(self, data: bytes | bytearray | memoryview | mmap) -> typing.Any:
+        """
+        Decode a JSON5 document from encoded text in any buffer, such as a memory-mapped file. As with ``json.loads``,
+        the encoding (UTF-8, UTF-16 or UTF-32) is detected from the first bytes.
+
+        UTF-8 text is tokenized directly and only the text of each token is decoded, rather than decoding the whole
+        document to a ``str`` first. When ``try_json`` is on, the text is decoded anyway to give it to the ``json``
+        module, as that is much quicker for documents that are plain JSON.
+        """
+        encoding = _detect_encoding(data)
+        if self.json_decoder is not None or not encoding.startswith('utf-8'):
+            return self.decode(str(data, encoding))
+        try:
+            return self._decode_tokens(tokenize_bytes(data))
+        except Exception:
+            # as in decode, an error in the document is reported rather than whatever a hook raised before reaching it
+            _parse_source(str(data, encoding))
+            raise
+
+    def _decode(self, s: str) -> typing.Any:
+        return self._decode_tokens(tokenize(s))
+
+    def _decode_tokens(self, tokens: typing.Iterator[JSON5Token]) -> typing.Any:
+        self._tokens = tokens
+        self._advance()
+        try:
+            self._skip_wsc()
+            value = self._value()
+            self._skip_wsc()
+            if self._tok is not None:
+                raise JSON5DecodeError('Syntax Error', self._tok)
+            return value
+        finally:
+            self._tokens = iter(())
+            self._tok = None
+            self._keys.clear()
+
+    def _iter_values(self, tokens: typing.Iterator[JSON5Token]) -> typing.Iterator[typing.Any]:
+        """
+        Decode any number of consecutive values from ``tokens``, which may be separated by whitespace and comments
+        """
+        self._tokens = tokens
+        self._advance()
+        try:
+            self._skip_wsc()
+            while self._tok is not None:
+                value = self._value()
+                self._keys.clear()
+                yield value
+                self._skip_wsc()
+        finally:
+            self._tokens = iter(())
+            self._tok = None
+            self._keys.clear()
+
+    def _decode_value_at(
+        self, tok: JSON5Token, tokens: typing.Iterator[JSON5Token]
+    ) -> tuple[typing.Any, JSON5Token | None]:
+        """
+        Decode the value starting at ``tok``, taking further tokens from ``tokens``.
+        Returns the value along with the token following it.
+        """
+        self._tokens = tokens
+        self._tok = tok
+        try:
+            return self._value(), self._tok
+        finally:
+            self._tokens = iter(())
+            self._tok = None
+            self._keys.clear()
+
+    def _advance(self) -> None:
+        self._tok = next(self._tokens, None)
+
+    def _skip_wsc(self) -> None:
+        while self._tok is not None and self._tok.type in _WSC_TYPES:
+            self._tok = next(self._tokens, None)
+
+    def _expect(self, tok_type: str) -> None:
+        self._skip_wsc()
+        if self._tok is None or self._tok.type != tok_type:
+            raise JSON5DecodeError(f'Syntax Error. Was expecting {tok_type}', self._tok)
+        self._advance()
+
+    def _value(self, depth: int = 0) -> typing.Any:
+        """
+        Decode the value starting at the current token. Objects and arrays are decoded with an explicit stack of the
+        containers still open rather than recursively, so they can be nested to any depth (up to ``env.max_depth``).
+        ``depth`` is how many containers the value is already nested in.
+        """
+        tok = self._tok
+        if tok is None or (tok.type != 'LBRACE' and tok.type != 'LBRACKET'):
+            return self._scalar()
+        max_depth = self.env.max_depth
+        # the containers enclosing the innermost open one, each with whether it's an object and the key being decoded
+        stack: list[tuple[typing.Any, bool, typing.Any]] = []
+        container: typing.Any = None
+        in_object = False
+        key: typing.Any = None
+        while True:
+            tok = self._tok
+            if tok is not None and (tok.type == 'LBRACE' or tok.type == 'LBRACKET'):
+                if max_depth is not None and depth + len(stack) >= max_depth:
+                    raise JSON5DecodeError(f'Maximum nesting depth of {max_depth} exceeded', tok)
+                self._advance()
+                self._skip_wsc()
+                if tok.type == 'LBRACE':
+                    if self._tok is not None and self._tok.type != 'RBRACE':
+                        stack.append((container, in_object, key))
+                        container = {}
+                        in_object = True
+                        key = self._key()
+                        self._expect('COLON')
+                        self._skip_wsc()
+                        continue
+                    self._expect('RBRACE')
+                    value = self._finish_object({})
+                else:
+                    if self._tok is not None and self._tok.type != 'RBRACKET':
+                        stack.append((container, in_object, key))
+                        container = []
+                        in_object = False
+                        continue
+                    self._expect('RBRACKET')
+                    value = []
+            else:
+                value = self._scalar()
+            # Add the value to its container, then move on to the container's next value or close it
+            while stack:
+                if in_object:
+                    container[key] = value
+                else:
+                    container.append(value)
+                self._skip_wsc()
+                tok = self._tok
+                if tok is not None and tok.type == 'COMMA':
+                    self._advance()
+                    self._skip_wsc()
+                    tok = self._tok
+                    if tok is not None and tok.type != ('RBRACE' if in_object else 'RBRACKET'):
+                        if in_object:
+                            key = self._key()
+                            self._expect('COLON')
+                            self._skip_wsc()
+                        break
+                if in_object:
+                    self._expect('RBRACE')
+                    value = self._finish_object(container)
+                else:
+                    self._expect('RBRACKET')
+                    value = self._finish_array(container)
+                container, in_object, key = stack.pop()
+            else:
+                return value
+
+    def _scalar(self) -> typing.Any:
+        tok = self._tok
+        if tok is None:
+            raise JSON5DecodeError('Expecting value. Received unexpected EOF', None)
+        tok_type = tok.type
+        if tok_type == 'DOUBLE_QUOTE_STRING' or tok_type == 'SINGLE_QUOTE_STRING':
+            self._advance()
+            return _string_value(tok)
+        elif tok_type == 'TRUE':
+            self._advance()
+            return True
+        elif tok_type == 'FALSE':
+            self._advance()
+            return False
+        elif tok_type == 'NULL':
+            self._advance()
+            return None
+        elif tok_type == 'MINUS':
+            self._advance()
+            if self._tok is not None and self._tok.type == 'INFINITY':
+                self._advance()
+                return self._constant('-Infinity', -math.inf)
+            return self._number() * -1
+        elif tok_type == 'PLUS':
+            self._advance()
+            return self._number()
+        return self._number()
+
+    def _number(self) -> typing.Any:
+        tok = self._tok
+        if tok is None:
+            raise JSON5DecodeError('Expecting value. Received unexpected EOF', None)
+        tok_type = tok.type
+        self._advance()
+        env = self.env
+        if tok_type == 'INTEGER' or tok_type == 'FLOAT':
+            raw_value = tok.value
+            if self._tok is not None and self._tok.type == 'EXPONENT':
+                raw_value += self._tok.value
+                tok_type = 'FLOAT'
+                self._advance()
+            if tok_type == 'INTEGER':
+                if env.parse_int:
+                    return env.parse_int(raw_value)
+                return int(raw_value)
+            if env.parse_float:
+                return env.parse_float(raw_value)
+            return float(raw_value)
+        elif tok_type == 'HEXADECIMAL':
+            if env.parse_int:
+                return env.parse_int(tok.value)
+            return int(tok.value, 0)
+        elif tok_type == 'INFINITY':
+            return self._constant('Infinity', math.inf)
+        elif tok_type == 'NAN':
+            return self._constant('NaN', math.nan)
+        raise JSON5DecodeError('Syntax Error', tok)
+
+    def _constant(self, const: typing.Literal['-Infinity', 'Infinity', 'NaN'], value: float) -> typing.Any:
+        if self.env.parse_constant:
+            return self.env.parse_constant(const)
+        return value
+
+    def _key(self) -> typing.Any:
+        tok = self._tok
+        if tok is None:
+            raise JSON5DecodeError('Expecting value. Received unexpected EOF', None)
+        self._advance()
+        tok_type = tok.type
+        if tok_type == 'NAME':
+            key: str | None = self._keys.get(tok.value)
+            if key is None:
+                key = self._keys[tok.value] = _identifier_value(tok)
+            if self.env.parse_json5_identifiers:
+                return self.env.parse_json5_identifiers(key)  # type: ignore[arg-type]
+            return key
+        elif tok_type == 'DOUBLE_QUOTE_STRING' or tok_type == 'SINGLE_QUOTE_STRING':
+            key = self._keys.get(tok.value)
+            if key is None:
+                key = self._keys[tok.value] = _string_value(tok)
+            return key
+        raise JSON5DecodeError('Syntax Error. Was expecting RBRACE or key', tok)
+
+    def _finish_object(self, d: dict[typing.Any, typing.Any]) -> typing.Any:
+        env = self.env
+        if env.object_pairs_hook:
+            return env.object_pairs_hook(list(d.items()))
+        elif env.object_hook:
+            return env.object_hook(d)
+        return d
+
+    def _finish_array(self, values: list[typing.Any]) -> typing.Any:
+        if self.env.numeric_arrays:
+            return _numeric_array(values, self.env.numeric_arrays)
+        return values
+
+
+# What _walk_tokens expects to see next
+_EXPECT_VALUE = 0
+_EXPECT_VALUE_OR_RBRACKET = 1
+_EXPECT_KEY_OR_RBRACE = 2
+_EXPECT_COLON = 3
+_EXPECT_COMMA_OR_CLOSE = 4
+_EXPECT_END = 5
+
+_SCALAR_EVENTS = {
+    'DOUBLE_QUOTE_STRING': 'string',
+    'SINGLE_QUOTE_STRING': 'string',
+    'TRUE': 'boolean',
+    'FALSE': 'boolean',
+    'NULL': 'null',
+}
+
+_NUMBER_TYPES = frozenset({'INTEGER', 'FLOAT', 'HEXADECIMAL', 'INFINITY', 'NAN'})
+
+T_Event = typing.Tuple[str, str, typing.Any]
+
+
+def _join_prefix(prefix: str, name: str) -> str:
+    return f'{prefix}.{name}' if prefix else name
+
+
+def iterparse(source: str | typing.TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> typing.Iterator[T_Event]:
+    """
+    Parse JSON5 text (or a file) incrementally, yielding ``(prefix, event, value)`` tuples as the document is read.
+
+    The events are ``start_map``, ``map_key``, ``end_map``, ``start_array``, ``end_array``, ``string``, ``number``,
+    ``boolean`` and ``null``. ``prefix`` is the path to the value the event belongs to: object keys and ``item`` for
+    array elements, separated by dots. For example, ``{foo: [1]}`` produces::
+
+        ('', 'start_map', None)
+        ('', 'map_key', 'foo')
+        ('foo', 'start_array', None)
+        ('foo.item', 'number', 1)
+        ('foo', 'end_array', None)
+        ('', 'end_map', None)
+
+    Files are read ``chunk_size`` characters at a time and no objects are built, so memory use only depends on how
+    deeply the document is nested.
+    """
+    if isinstance(source, str):
+        try:
+            yield from _iterparse_tokens(tokenize(source))
+        except JSON5DecodeError:
+            _parse_source(source)
+            raise
+    else:
+        yield from _iterparse_tokens(tokenize_file(source, chunk_size=chunk_size))
+
+
+def _number_event_value(tok: JSON5Token, tokens: typing.Iterator[JSON5Token]) -> tuple[typing.Any, JSON5Token | None]:
+    """
+    Get the value of the number starting with ``tok``, along with the token following it
+    """
+    tok_type = tok.type
+    following = next(tokens, None)
+    if tok_type == 'INTEGER' or tok_type == 'FLOAT':
+        raw_value = tok.value
+        if following is not None and following.type == 'EXPONENT':
+            raw_value += following.value
+            tok_type = 'FLOAT'
+            following = next(tokens, None)
+        if tok_type == 'INTEGER':
+            return int(raw_value), following
+        return float(raw_value), following
+    elif tok_type == 'HEXADECIMAL':
+        return int(tok.value, 0), following
+    elif tok_type == 'INFINITY':
+        return math.inf, following
+    elif tok_type == 'NAN':
+        return math.nan, following
+    raise JSON5DecodeError('Syntax Error', tok)
+
+
+T_TokenEvent = typing.Tuple[str, JSON5Token, typing.Any, typing.Optional[int]]
+
+
+def _walk_tokens(
+    tokens: typing.Iterator[JSON5Token],
+    decoder: Decoder | None = None,
+    decode_here: typing.Callable[[], bool] | None = None,
+) -> typing.Iterator[T_TokenEvent]:
+    """
+    Check the structure of the value made of ``tokens``, producing an ``(event, token, value, end)`` tuple for each
+    part of it. ``event`` is one of:
+
+    * ``start_map``, ``end_map``, ``start_array`` or ``end_array``, for the token of the brace or bracket
+    * ``map_key``, for the token of a key, which is left for the caller to decode
+    * ``null``, ``boolean``, ``string`` or ``number``, along with the value. ``token`` is the first token of the value
+      and ``end`` the index where it ends, or ``None`` for a number at the end of the tokens.
+    * ``value``, for a whole value decoded in one go with ``decoder``. This is done for the values before which
+      ``decode_here`` returns true.
+
+    This is what iterparse, items and tapes are built from.
+    """
+    containers: list[bool] = []  # whether each container we're in is an object
+    value: typing.Any
+    expect = _EXPECT_VALUE
+    tok = next(tokens, None)
+    while tok is not None:
+        tok_type = tok.type
+        if tok_type in _WSC_TYPES:
+            tok = next(tokens, None)
+            continue
+        if expect == _EXPECT_COMMA_OR_CLOSE:
+            is_object = containers[-1]
+            if tok_type == 'COMMA':
+                expect = _EXPECT_KEY_OR_RBRACE if is_object else _EXPECT_VALUE_OR_RBRACKET
+                tok = next(tokens, None)
+                continue
+            elif (tok_type == 'RBRACE') is not is_object or (tok_type != 'RBRACE' and tok_type != 'RBRACKET'):
+                raise JSON5DecodeError(
+                    f"Syntax Error. Was expecting COMMA or {'RBRACE' if is_object else 'RBRACKET'}", tok
+                )
+            # a closing brace/bracket is handled below
+        elif expect == _EXPECT_COLON:
+            if tok_type != 'COLON':
+                raise JSON5DecodeError('Syntax Error. Was expecting COLON', tok)
+            expect = _EXPECT_VALUE
+            tok = next(tokens, None)
+            continue
+        elif expect == _EXPECT_END:
+            raise JSON5DecodeError('Syntax Error', tok)
+
+        if tok_type == 'RBRACE' and (expect == _EXPECT_KEY_OR_RBRACE or expect == _EXPECT_COMMA_OR_CLOSE):
+            containers.pop()
+            yield 'end_map', tok, None, tok.end
+            tok = next(tokens, None)
+        elif tok_type == 'RBRACKET' and (expect == _EXPECT_VALUE_OR_RBRACKET or expect == _EXPECT_COMMA_OR_CLOSE):
+            containers.pop()
+            yield 'end_array', tok, None, tok.end
+            tok = next(tokens, None)
+        elif expect == _EXPECT_KEY_OR_RBRACE:
+            if tok_type != 'NAME' and tok_type != 'DOUBLE_QUOTE_STRING' and tok_type != 'SINGLE_QUOTE_STRING':
+                raise JSON5DecodeError('Syntax Error. Was expecting RBRACE or key', tok)
+            yield 'map_key', tok, None, tok.end
+            expect = _EXPECT_COLON
+            tok = next(tokens, None)
+            continue
+        # Anything else must be a value
+        elif decode_here is not None and decode_here():
+            assert decoder is not None
+            start_tok = tok
+            value, tok = decoder._decode_value_at(tok, tokens)
+            yield 'value', start_tok, value, None if tok is None else tok.index
+        elif tok_type == 'LBRACE' or tok_type == 'LBRACKET':
+            is_object = tok_type == 'LBRACE'
+            containers.append(is_object)
+            yield 'start_map' if is_object else 'start_array', tok, None, tok.end
+            expect = _EXPECT_KEY_OR_RBRACE if is_object else _EXPECT_VALUE_OR_RBRACKET
+            tok = next(tokens, None)
+            continue
+        elif tok_type in _SCALAR_EVENTS:
+            if tok_type == 'NULL':
+                value = None
+            elif tok_type == 'TRUE' or tok_type == 'FALSE':
+                value = tok_type == 'TRUE'
+            else:
+                value = _string_value(tok)
+            yield _SCALAR_EVENTS[tok_type], tok, value, tok.end
+            tok = next(tokens, None)
+        else:
+            start_tok = tok
+            if tok_type == 'MINUS' or tok_type == 'PLUS':
+                number_tok = next(tokens, None)
+                if number_tok is None or number_tok.type not in _NUMBER_TYPES:
+                    raise JSON5DecodeError('Syntax Error', number_tok or tok)
+                value, tok = _number_event_value(number_tok, tokens)
+                if tok_type == 'MINUS':
+                    value *= -1
+            else:
+                value, tok = _number_event_value(tok, tokens)
+            # the token following the number starts right where the number ends
+            yield 'number', start_tok, value, None if tok is None else tok.index
+
+        # A value (or container) was completed; figure out what comes next
+        expect = _EXPECT_COMMA_OR_CLOSE if containers else _EXPECT_END
+    if expect != _EXPECT_END:
+        raise JSON5DecodeError('Expecting value. Received unexpected EOF', None)
+
+
+def _iterparse_tokens(
+    tokens: typing.Iterator[JSON5Token], decoder: Decoder | None = None, build_prefix: str | None = None
+) -> typing.Iterator[T_Event]:
+    """
+    Produce the iterparse events for ``tokens``.
+    If a ``decoder`` is given, values found at ``build_prefix`` are decoded in one go and produce a single
+    ``value`` event instead.
+    """
+    containers: list[tuple[bool, str]] = []  # (is_object, prefix) of each container we're in
+    value_prefix = ''  # the prefix of the next value
+    decode_here = None if decoder is None else lambda: value_prefix == build_prefix
+    for event, tok, value, _ in _walk_tokens(tokens, decoder, decode_here):
+        if event == 'map_key':
+            prefix = containers[-1][1]
+            key = _identifier_value(tok) if tok.type == 'NAME' else _string_value(tok)
+            yield prefix, 'map_key', key
+            value_prefix = _join_prefix(prefix, key)
+            continue
+        elif event == 'start_map' or event == 'start_array':
+            yield value_prefix, event, None
+            if event == 'start_map':
+                containers.append((True, value_prefix))
+            else:
+                containers.append((False, value_prefix))
+                value_prefix = _join_prefix(value_prefix, 'item')
+            continue
+        elif event == 'end_map' or event == 'end_array':
+            _, prefix = containers.pop()
+            yield prefix, event, None
+        else:
+            yield value_prefix, event, value
+        # A value (or container) was completed: the next value of an array has the same prefix
+        if containers:
+            is_object, prefix = containers[-1]
+            if not is_object:
+                value_prefix = _join_prefix(prefix, 'item')
+
+
+def items(
+    source: str | typing.TextIO,
+    prefix: str,
+    *,
+    object_hook: typing.Callable[[dict[typing.Any, typing.Any]], typing.Any] | None = None,
+    parse_float: typing.Callable[[str], typing.Any] | None = None,
+    parse_int: typing.Callable[[str], typing.Any] | None = None,
+    parse_constant: typing.Callable[[typing.Literal['-Infinity', 'Infinity', 'NaN']], typing.Any] | None = None,
+    strict: bool = True,
+    object_pairs_hook: typing.Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
+    parse_json5_identifiers: typing.Callable[[JsonIdentifier], typing.Any] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> typing.Iterator[typing.Any]:
+    """
+    Yield the Python values found at ``prefix`` (as used by ``iterparse``) in a JSON5 string or file, one at a time.
+
+    For example, ``items(f, 'records.item')`` yields each element of the ``records`` array of the top-level object.
+    Only one value is built at a time, so memory use depends on the size of the individual values rather than the
+    size of the whole document. The hook keywords work the same as for ``load``.
+    """
+    decoder = Decoder(
+        try_json=False,
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        parse_json5_identifiers=parse_json5_identifiers,
+    )
+    if isinstance(source, str):
+        events = _iterparse_tokens(tokenize(source), decoder, prefix)
+    else:
+        events = _iterparse_tokens(tokenize_file(source, chunk_size=chunk_size), decoder, prefix)
+    try:
+        for _, event, value in events:
+            if event == 'value':
+                yield value
+    except JSON5DecodeError:
+        if isinstance(source, str):
+            _parse_source(source)
+        raise
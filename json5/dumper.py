@@ -5,10 +5,8 @@ import json
 import math
 import typing
 from abc import abstractmethod
-from functools import singledispatchmethod
 from typing import Any
 
-from .loader import JsonIdentifier
 from .model import BlockComment
 from .model import BooleanLiteral
 from .model import Comment
@@ -29,7 +27,9 @@ from .model import SingleQuotedString
 from .model import String
 from .model import TrailingComma
 from .model import UnaryOp
-from .model import Value
+from .utils import handles
+from .utils import JsonIdentifier
+from .utils import TypeDispatch
 
 
 class Environment:
@@ -51,6 +51,27 @@ def dump(obj: Any, f: typing.TextIO, **kwargs: Any) -> int:
     return f.write(text)
 
 
+def dump_lines(iterable: typing.Iterable[Any], f: typing.TextIO, dumper: BaseDumper | None = None) -> int:
+    """
+    Write each object of ``iterable`` to ``f`` on its own line (JSON5 Lines), returning the number of lines written.
+    The same dumper is used for all of the objects, writing directly to ``f``.
+    """
+    if dumper is None:
+        dumper = DefaultDumper()
+    env = dumper.env
+    outfile = env.outfile
+    env.outfile = f
+    count = 0
+    try:
+        for obj in iterable:
+            dumper.dump(obj)
+            f.write('\n')
+            count += 1
+    finally:
+        env.outfile = outfile
+    return count
+
+
 def dumps(obj: Any, dumper: BaseDumper | None = None, indent: int = 0) -> str:
     env = Environment()
     env.indent = indent
@@ -62,13 +83,12 @@ def dumps(obj: Any, dumper: BaseDumper | None = None, indent: int = 0) -> str:
     return ret
 
 
-class BaseDumper:
+class BaseDumper(TypeDispatch):
     def __init__(self, env: Environment | None = None):
         if env is None:
             env = Environment()
         self.env = env
 
-    @singledispatchmethod
     @abstractmethod
     def dump(self, obj: Any) -> Any:
         return NotImplemented
@@ -79,40 +99,20 @@ class DefaultDumper(BaseDumper):
     Dump Python objects to a JSON string
     """
 
-    @singledispatchmethod
     def dump(self, obj: Any) -> Any:
-        raise NotImplementedError(f"Cannot dump node {repr(obj)}")
+        obj_type = type(obj)
+        handler = self._handlers.get(obj_type) or self._find_handler(obj_type)
+        if handler is None:
+            raise NotImplementedError(f"Cannot dump node {repr(obj)}")
+        return handler(self, obj)
+
+    to_json = handles
 
-    to_json = dump.register
+    # dicts and lists are dumped with an explicit stack rather than recursively, so they can be nested to any depth
 
     @to_json(dict)
     def dict_to_json(self, d: dict[Any, Any]) -> Any:
-        self.env.write('{', indent=0)
-        if self.env.indent:
-            self.env.write('\n', indent=0)
-            self.env.indent_level += 1
-        index = 0
-        for index, (key, value) in enumerate(d.items(), start=1):
-            if self.env.indent:
-                self.env.write('')
-            self.dump(key)
-            self.env.write(': ', indent=0)
-            self.dump(value)
-            if index == len(d):
-                break
-            if self.env.indent:
-                self.env.write(',', indent=0)
-                self.env.write('\n', indent=0)
-            else:
-                self.env.write(', ', indent=0)
-
-        if self.env.indent:
-            self.env.indent_level -= 1
-            if index != 0:
-                self.env.write('\n', indent=0)
-            self.env.write('}')
-        else:
-            self.env.write('}', indent=0)
+        self._dump_nested(d, True)
 
     @to_json(int)
     def int_to_json(self, i: int) -> Any:
@@ -128,25 +128,86 @@ class DefaultDumper(BaseDumper):
 
     @to_json(list)
     def list_to_json(self, the_list: list[Any]) -> Any:
-        self.env.write('[', indent=0)
-        if self.env.indent:
-            self.env.indent_level += 1
-            self.env.write('\n', indent=0)
-        list_length = len(the_list)
-        for index, item in enumerate(the_list, start=1):
-            if self.env.indent:
-                self.env.write('')
-            self.dump(item)
-            if index != list_length:
-                if self.env.indent:
-                    self.env.write(',', indent=0)
+        self._dump_nested(the_list, False)
+
+    def _dump_nested(self, obj: dict[Any, Any] | list[Any], is_dict: bool) -> None:
+        """
+        Dump a dict or list along with the dicts and lists inside it. Rather than recursing, the ones still being
+        dumped are kept on an explicit stack. Dicts and lists whose handlers are overridden are dumped by their
+        handlers instead, and when ``dump`` is overridden, every key and value is dumped by calling it.
+        """
+        env = self.env
+        dump_overridden = type(self).dump is not DefaultDumper.dump
+        # Punctuation doesn't need to be indented, so it is written to the file directly
+        write = env.outfile.write
+        separator = ',\n' if env.indent else ', '
+        handlers = self._handlers
+        dict_handler = DefaultDumper.dict_to_json
+        list_handler = DefaultDumper.list_to_json
+        # the dicts and lists enclosing the one being dumped, with their remaining items, lengths and positions
+        stack: list[tuple[dict[Any, Any] | list[Any], bool, typing.Iterator[Any], int, int]] = []
+        # the ids of obj and the values on the stack, as a value containing itself could never be dumped
+        active = {id(obj)}
+        while True:
+            # Open obj
+            write('{' if is_dict else '[')
+            if env.indent:
+                env.indent_level += 1
+                write('\n')
+            items: typing.Iterator[Any] = iter(obj.items()) if is_dict else iter(obj)  # type: ignore[union-attr]
+            length = len(obj)
+            index = 0
+            while True:
+                for item in items:
+                    index += 1
+                    if env.indent:
+                        env.write('')
+                    if is_dict:
+                        key, value = item
+                        self.dump(key)
+                        write(': ')
+                    else:
+                        value = item
+                    value_type = type(value)
+                    handler = None if dump_overridden else handlers.get(value_type) or self._find_handler(value_type)
+                    if handler is dict_handler or handler is list_handler:
+                        if id(value) in active:
+                            raise ValueError('Circular reference detected')
+                        active.add(id(value))
+                        stack.append((obj, is_dict, items, length, index))
+                        obj = value
+                        is_dict = handler is dict_handler
+                        break
+                    if dump_overridden:
+                        self.dump(value)
+                    elif handler is None:
+                        raise NotImplementedError(f"Cannot dump node {repr(value)}")
+                    else:
+                        handler(self, value)
+                    if index != length:
+                        write(separator)
+                    elif env.indent and not is_dict:
+                        write('\n')
                 else:
-                    self.env.write(', ', indent=0)
-            if self.env.indent:
-                self.env.write('\n', indent=0)
-        if self.env.indent:
-            self.env.indent_level -= 1
-        self.env.write(']')
+                    # Close obj
+                    if env.indent:
+                        env.indent_level -= 1
+                        if is_dict and index != 0:
+                            write('\n')
+                    if is_dict and not env.indent:
+                        write('}')
+                    else:
+                        env.write('}' if is_dict else ']')
+                    active.discard(id(obj))
+                    if not stack:
+                        return
+                    obj, is_dict, items, length, index = stack.pop()
+                    if index != length:
+                        write(separator)
+                    elif env.indent and not is_dict:
+                        write('\n')
+                    continue
+                break
 
     @to_json(float)
     def float_to_json(self, f: float) -> Any:
@@ -168,7 +229,7 @@ class DefaultDumper(BaseDumper):
         self.env.write('null', indent=0)
 
 
-class ModelDumper:
+class ModelDumper(TypeDispatch):
     """
     Dump a model to a JSON string
     """
@@ -177,8 +238,10 @@ class ModelDumper:
         #  any provided environment is ignored
         self.env = Environment()
 
+    # Trivia is read from the underlying slots (which are None when there is none) so dumping doesn't allocate lists
+
     def process_wsc_before(self, node: Node) -> None:
-        for wsc in node.wsc_before:
+        for wsc in node._wsc_before or ():
             if isinstance(wsc, Comment):
                 self.dump(wsc)
             elif isinstance(wsc, str):
@@ -187,7 +250,7 @@ class ModelDumper:
                 raise ValueError(f"Did not expect {type(node)}")
 
     def process_wsc_after(self, node: Node) -> None:
-        for wsc in node.wsc_after:
+        for wsc in node._wsc_after or ():
             if isinstance(wsc, Comment):
                 self.dump(wsc)
             elif isinstance(wsc, str):
@@ -196,7 +259,7 @@ class ModelDumper:
                 raise ValueError(f"Did not expect {type(wsc)}")
 
     def process_leading_wsc(self, node: JSONObject | JSONArray) -> None:
-        for wsc in node.leading_wsc:
+        for wsc in node._leading_wsc or ():
             if isinstance(wsc, Comment):
                 self.dump(wsc)
             elif isinstance(wsc, str):
@@ -204,11 +267,14 @@ class ModelDumper:
             else:
                 raise ValueError(f"Did not expect {type(wsc)}")
 
-    @singledispatchmethod
     def dump(self, node: Node) -> Any:
-        raise NotImplementedError('foo')
+        node_type = type(node)
+        handler = self._handlers.get(node_type) or self._find_handler(node_type)
+        if handler is None:
+            raise NotImplementedError(f"Cannot dump node {repr(node)}")
+        return handler(self, node)
 
-    to_json = dump.register
+    to_json = handles
 
     @to_json(JSONText)
     def json_model_to_json(self, node: JSONText) -> Any:
@@ -216,39 +282,75 @@ class ModelDumper:
         self.dump(node.value)
         self.process_wsc_after(node)
 
+    # Objects and arrays are dumped with an explicit stack rather than recursively, so they can be nested to any depth
+
     @to_json(JSONObject)
     def json_object_to_json(self, node: JSONObject) -> Any:
-        self.process_wsc_before(node)
-        self.env.write('{')
-        if node.leading_wsc:
-            self.process_leading_wsc(node)
-        key_value_pairs = node.key_value_pairs
-        num_pairs = len(key_value_pairs)
-        for index, kvp in enumerate(key_value_pairs, start=1):
-            self.dump(kvp.key)
-            self.env.write(':')
-            self.dump(kvp.value)
-            if index != num_pairs:
-                self.env.write(',')
-        if node.trailing_comma:
-            self.dump(node.trailing_comma)
-        self.env.write('}')
-        self.process_wsc_after(node)
+        self._dump_nested(node)
 
     @to_json(JSONArray)
     def json_array_to_json(self, node: JSONArray) -> Any:
-        self.process_wsc_before(node)
-        self.env.write('[')
-        if node.leading_wsc:
-            self.process_leading_wsc(node)
-        for index, value in enumerate(node.values, start=1):
-            self.dump(value)
-            if index != len(node.values):
-                self.env.write(',')
-        if node.trailing_comma:
-            self.dump(node.trailing_comma)
-        self.env.write(']')
-        self.process_wsc_after(node)
+        self._dump_nested(node)
+
+    def _dump_nested(self, node: JSONObject | JSONArray) -> None:
+        """
+        Dump an object or array along with the objects and arrays inside it. Rather than recursing, the ones still
+        being dumped are kept on an explicit stack. Objects and arrays whose handlers are overridden are dumped by
+        their handlers instead, and when ``dump`` is overridden, every key and value is dumped by calling it.
+        """
+        write = self.env.write
+        dump_overridden = type(self).dump is not ModelDumper.dump
+        handlers = self._handlers
+        object_handler = ModelDumper.json_object_to_json
+        array_handler = ModelDumper.json_array_to_json
+        # the objects and arrays enclosing the one being dumped, with their remaining children, lengths and positions
+        stack: list[tuple[JSONObject | JSONArray, typing.Iterator[Any], int, int]] = []
+        while True:
+            # Open node
+            is_object = isinstance(node, JSONObject)
+            self.process_wsc_before(node)
+            write('{' if is_object else '[')
+            if node._leading_wsc:
+                self.process_leading_wsc(node)
+            children: list[Any] = node.key_value_pairs if is_object else node.values  # type: ignore[union-attr]
+            length = len(children)
+            remaining = iter(children)
+            index = 0
+            while True:
+                for child in remaining:
+                    index += 1
+                    if is_object:
+                        self.dump(child.key)
+                        write(':')
+                        child = child.value
+                    child_type = type(child)
+                    handler = None if dump_overridden else handlers.get(child_type) or self._find_handler(child_type)
+                    if handler is object_handler or handler is array_handler:
+                        stack.append((node, remaining, length, index))
+                        node = child
+                        break
+                    if dump_overridden:
+                        self.dump(child)
+                    elif handler is None:
+                        raise NotImplementedError(f"Cannot dump node {repr(child)}")
+                    else:
+                        handler(self, child)
+                    if index != length:
+                        write(',')
+                else:
+                    # Close node
+                    if node.trailing_comma:
+                        self.dump(node.trailing_comma)
+                    write('}' if is_object else ']')
+                    self.process_wsc_after(node)
+                    if not stack:
+                        return
+                    node, remaining, length, index = stack.pop()
+                    is_object = isinstance(node, JSONObject)
+                    if index != length:
+                        write(',')
+                    continue
+                break
 
     @to_json(Identifier)
     def identifier_to_json(self, node: Identifier) -> Any:
@@ -328,16 +430,19 @@ class ModelDumper:
         self.process_wsc_after(node)
 
 
-class Modelizer:
+class Modelizer(TypeDispatch):
     """
     Turn Python objects into a model
     """
 
-    @singledispatchmethod
     def modelize(self, obj: Any) -> Node:
-        raise NotImplementedError(f"Cannot modelize object of type {type(obj)}")
+        obj_type = type(obj)
+        handler = self._handlers.get(obj_type) or self._find_handler(obj_type)
+        if handler is None:
+            raise NotImplementedError(f"Cannot modelize object of type {obj_type}")
+        return handler(self, obj)  # type: ignore[no-any-return]
 
-    to_model = modelize.register
+    to_model = handles
 
     @to_model(str)
     def str_to_model(self, s: str) -> SingleQuotedString | DoubleQuotedString:
@@ -346,20 +451,73 @@ class Modelizer:
         else:
             return DoubleQuotedString(s, raw_value=repr(s))
 
+    # dicts and lists are modelized with an explicit stack rather than recursively, so they can be nested to any depth
+
     @to_model(dict)
     def dict_to_model(self, d: dict[Any, Any]) -> JSONObject:
-        kvps: list[KeyValuePair] = []
-        for key, value in d.items():
-            kvp = KeyValuePair(key=self.modelize(key), value=self.modelize(value))  # type: ignore[arg-type]
-            kvps.append(kvp)
-        return JSONObject(*kvps)
+        return self._modelize_nested(d, True)  # type: ignore[return-value]
 
     @to_model(list)
     def list_to_model(self, lst: list[Any]) -> JSONArray:
-        list_values: list[Value] = []
-        for v in lst:
-            list_values.append(self.modelize(v))  # type: ignore[arg-type]
-        return JSONArray(*list_values)
+        return self._modelize_nested(lst, False)  # type: ignore[return-value]
+
+    def _modelize_nested(self, obj: dict[Any, Any] | list[Any], is_dict: bool) -> JSONObject | JSONArray:
+        """
+        Modelize a dict or list along with the dicts and lists inside it. Rather than recursing, the ones still being
+        modelized are kept on an explicit stack. Dicts and lists whose handlers are overridden are modelized by their
+        handlers instead, and when ``modelize`` is overridden, every key and value is modelized by calling it.
+        """
+        modelize_overridden = type(self).modelize is not Modelizer.modelize
+        handlers = self._handlers
+        dict_handler = Modelizer.dict_to_model
+        list_handler = Modelizer.list_to_model
+        # the dicts and lists enclosing the one being modelized, with their remaining items, the nodes (or key/value
+        # pairs) made for them so far, and the key node for the value being modelized
+        stack: list[tuple[dict[Any, Any] | list[Any], bool, typing.Iterator[Any], list[Any], Any]] = []
+        # the ids of obj and the values on the stack, as a value containing itself could never be modelized
+        active = {id(obj)}
+        items: typing.Iterator[Any] = iter(obj.items()) if is_dict else iter(obj)  # type: ignore[union-attr]
+        nodes: list[Any] = []
+        key_node: Any = None
+        while True:
+            for item in items:
+                if is_dict:
+                    key, value = item
+                    key_node = self.modelize(key)
+                else:
+                    value = item
+                if modelize_overridden:
+                    value_node: Any = self.modelize(value)
+                    nodes.append(KeyValuePair(key=key_node, value=value_node) if is_dict else value_node)
+                    continue
+                value_type = type(value)
+                handler = handlers.get(value_type) or self._find_handler(value_type)
+                if handler is dict_handler or handler is list_handler:
+                    if id(value) in active:
+                        raise ValueError('Circular reference detected')
+                    active.add(id(value))
+                    stack.append((obj, is_dict, items, nodes, key_node))
+                    obj = value
+                    is_dict = handler is dict_handler
+                    items = iter(obj.items()) if is_dict else iter(obj)  # type: ignore[union-attr]
+                    nodes = []
+                    break
+                if handler is None:
+                    raise NotImplementedError(f"Cannot modelize object of type {value_type}")
+                if is_dict:
+                    nodes.append(KeyValuePair(key=key_node, value=handler(self, value)))
+                else:
+                    nodes.append(handler(self, value))
+            else:
+                node: JSONObject | JSONArray = JSONObject(*nodes) if is_dict else JSONArray(*nodes)
+                active.discard(id(obj))
+                if not stack:
+                    return node
+                obj, is_dict, items, nodes, key_node = stack.pop()
+                if is_dict:
+                    nodes.append(KeyValuePair(key=key_node, value=node))
+                else:
+                    nodes.append(node)
 
     @to_model(int)
     def int_to_model(self, i: int) -> Integer:
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import array
+import io
 import logging
+import mmap as _mmap
+import os
 import typing
 from abc import abstractmethod
-from functools import singledispatchmethod
+from collections import deque
 from typing import Callable
 from typing import Literal
 
 from .model import BooleanLiteral
 from .model import Comment
+from .model import detach_tokens
 from .model import DoubleQuotedString
 from .model import Float
 from .model import Identifier
@@ -22,13 +27,26 @@ from .model import Node
 from .model import NullLiteral
 from .model import SingleQuotedString
 from .model import String
+from .model import T_Positions
 from .model import UnaryOp
-from .parser import parse_source
+from .tokenizer import DEFAULT_CHUNK_SIZE
+from .tokenizer import JSON5Token
+from .tokenizer import JSONLexer
+from .utils import handles
+from .utils import JSON5DecodeError
+from .utils import JsonIdentifier as JsonIdentifier  # re-exported; it used to be defined here
+from .utils import TypeDispatch
+
+if typing.TYPE_CHECKING:
+    from .decoder import Decoder
+    from .schema import T_UnknownFields
 
 logger = logging.getLogger(__name__)
 # logger.setLevel(level=logging.DEBUG)
 # logger.addHandler(logging.StreamHandler(stream=sys.stderr))
 
+T_NumericArrays = Literal['array', 'numpy']
+
 
 class Environment:
     def __init__(
@@ -40,7 +58,13 @@ class Environment:
         strict: bool = True,
         object_pairs_hook: Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
         parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = None,
+        max_depth: int | None = None,
+        numeric_arrays: T_NumericArrays | None = None,
     ):
+        if numeric_arrays not in (None, 'array', 'numpy'):
+            raise ValueError(f"numeric_arrays must be 'array' or 'numpy', not {numeric_arrays!r}")
+        if numeric_arrays == 'numpy':
+            _numpy()  # fail now rather than at the first array of numbers if NumPy isn't installed
         self.object_hook: Callable[[dict[typing.Any, typing.Any]], typing.Any] | None = object_hook
         self.parse_float: Callable[[str], typing.Any] | None = parse_float
         self.parse_int: Callable[[str], typing.Any] | None = parse_int
@@ -50,10 +74,52 @@ class Environment:
             Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any]
         ) = object_pairs_hook
         self.parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = parse_json5_identifiers
+        self.max_depth: int | None = max_depth
+        self.numeric_arrays: T_NumericArrays | None = numeric_arrays
+
+
+# The typecode for the arrays of numbers of each combination of types. Arrays mixing ints and floats become floats.
+_NUMERIC_TYPECODES = {frozenset({int}): 'q', frozenset({float}): 'd', frozenset({int, float}): 'd'}
+
 
+def _numpy() -> typing.Any:
+    try:
+        import numpy  # type: ignore
+    except ImportError as exc:
+        raise ImportError("numeric_arrays='numpy' requires NumPy (pip install json-five[numpy])") from exc
+    return numpy
 
-class JsonIdentifier(str):
-    ...
+
+def _numeric_array(values: list[typing.Any], numeric_arrays: T_NumericArrays) -> typing.Any:
+    """
+    Convert a list of numbers to an ``array.array`` (``numeric_arrays='array'``) or NumPy array (``'numpy'``) of 64-bit
+    ints or floats. Lists that are empty, that hold anything else (including bools), or whose ints don't fit in 64 bits
+    are returned as they are.
+    """
+    if not values:
+        return values
+    typecode = _NUMERIC_TYPECODES.get(frozenset(map(type, values)))
+    if typecode is None:
+        return values
+    try:
+        if numeric_arrays == 'numpy':
+            numpy = _numpy()
+            return numpy.array(values, dtype=numpy.int64 if typecode == 'q' else numpy.float64)
+        return array.array(typecode, values)
+    except OverflowError:
+        return values
+
+
+def _make_decoder(
+    into: typing.Any, unknown_fields: T_UnknownFields, try_json: bool = True, **env_kwargs: typing.Any
+) -> Decoder:
+    if into is None:
+        from .decoder import Decoder
+
+        return Decoder(try_json=try_json, **env_kwargs)
+    from .schema import TypedDecoder
+
+    return TypedDecoder(into, unknown_fields, **env_kwargs)
 
 
 def load(
@@ -67,14 +133,47 @@ def load(
     strict: bool = True,
     object_pairs_hook: Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
     parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = None,
+    max_depth: int | None = None,
+    numeric_arrays: T_NumericArrays | None = None,
+    try_json: bool = True,
+    stream: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    lazy: bool = False,
+    into: typing.Any = None,
+    unknown_fields: T_UnknownFields = 'ignore',
 ) -> typing.Any:
     """
     Like loads, but takes a file-like object with a read method.
 
     :param f:
     :param kwargs:
+    :param stream: read and decode the file in chunks instead of reading it all at once, so memory use doesn't depend on
+        the size of the file. Error messages are less detailed in this mode. Cannot be used with a custom ``loader``
+    :param chunk_size: how many characters to read at a time when ``stream`` is ``True``
+    :param lazy: see ``loads``. Cannot be used with ``stream``
+    :param into: see ``loads``
+    :param unknown_fields: see ``loads``
     :return:
     """
+    if stream:
+        if loader is not None:
+            raise ValueError('A custom loader cannot be used with stream=True')
+        if lazy:
+            raise ValueError('lazy=True cannot be used with stream=True')
+        decoder = _make_decoder(
+            into,
+            unknown_fields,
+            object_hook=object_hook,
+            parse_float=parse_float,
+            parse_int=parse_int,
+            parse_constant=parse_constant,
+            strict=strict,
+            object_pairs_hook=object_pairs_hook,
+            parse_json5_identifiers=parse_json5_identifiers,
+            max_depth=max_depth,
+            numeric_arrays=numeric_arrays,
+        )
+        return decoder.decode_stream(f, chunk_size=chunk_size)
     text = f.read()
     return loads(
         text,
@@ -86,11 +185,17 @@ def load(
         strict=strict,
         object_pairs_hook=object_pairs_hook,
         parse_json5_identifiers=parse_json5_identifiers,
+        max_depth=max_depth,
+        numeric_arrays=numeric_arrays,
+        try_json=try_json,
+        lazy=lazy,
+        into=into,
+        unknown_fields=unknown_fields,
     )
 
 
 def loads(
-    s: str,
+    s: str | bytes | bytearray | memoryview,
     *,
     loader: LoaderBase | None = None,
     object_hook: Callable[[dict[typing.Any, typing.Any]], typing.Any] | None = None,
@@ -100,11 +205,18 @@ def loads(
     strict: bool = True,
     object_pairs_hook: Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
     parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = None,
+    max_depth: int | None = None,
+    numeric_arrays: T_NumericArrays | None = None,
+    try_json: bool = True,
+    lazy: bool = False,
+    into: typing.Any = None,
+    unknown_fields: T_UnknownFields = 'ignore',
 ) -> typing.Any:
     """
     Take a string of JSON text and deserialize it
 
-    :param s:
+    :param s: the text, or a bytes-like object holding UTF-8, UTF-16 or UTF-32 encoded text. With ``try_json=False``,
+        UTF-8 text is decoded token by token instead of decoding the whole text to a ``str`` first
     :param loader: The loader class to use
     :param object_hook: same meaning as in ``json.loads``
     :param parse_float: same meaning as in ``json.loads``
@@ -113,12 +225,31 @@ def loads(
     :param strict: same meaning as in ``json.loads`` (currently has no effect)
     :param object_pairs_hook: same meaning as in ``json.loads``
     :param parse_json5_identifiers: callable that is passed a JsonIdentifer. The return value of the callable is used to load JSON Identifiers (unquoted keys) in JSON5 objects
+    :param max_depth: how many levels deep objects and arrays may be nested. Deeper documents raise a
+        ``JSON5DecodeError``. By default there is no limit: nesting doesn't use recursion, so any depth can be decoded.
+        Has no effect when a ``loader`` is given (set ``max_depth`` on its environment instead)
+    :param numeric_arrays: decode arrays holding only numbers to ``array.array`` (``'array'``) or NumPy arrays
+        (``'numpy'``, which requires NumPy) of 64-bit ints, or of floats if any of the numbers is a float. These take
+        far less memory than lists of Python numbers. Arrays that are empty, hold anything else, or hold ints that
+        don't fit in 64 bits stay lists. Has no effect when a ``loader`` is given. With ``into``, only arrays typed
+        ``Any`` are converted
+    :param try_json: first try decoding the text as plain JSON with the (faster) ``json`` module. Has no effect when a ``loader`` is given
+    :param lazy: return read-only ``Mapping``/``Sequence`` proxies (``json5.tape.LazyObject`` and
+        ``json5.tape.LazyArray``) whose contents are only decoded when they are accessed. Cannot be used with a custom
+        ``loader``, any of the hooks, ``max_depth`` or ``numeric_arrays``
+    :param into: build a value of this type instead of plain dicts and lists, such as a dataclass, ``NamedTuple`` or
+        ``TypedDict`` class (see ``json5.schema.TypedDecoder``). Cannot be used with a custom ``loader`` or ``lazy``
+    :param unknown_fields: with ``into``, whether fields of objects that aren't fields of their class are ignored
+        (``'ignore'``) or rejected with a ``JSON5DecodeError`` (``'reject'``)
     :return:
     """
-    model = parse_source(s)
-    # logger.debug('Model is %r', model)
-    if loader is None:
-        loader = DefaultLoader(
+    if into is not None and (loader is not None or lazy):
+        raise ValueError('into cannot be used with a custom loader or lazy=True')
+    if loader is None and not lazy:
+        # Without a custom loader there is no need for the model; decode straight to Python objects instead
+        decoder = _make_decoder(
+            into,
+            unknown_fields,
             object_hook=object_hook,
             parse_float=parse_float,
             parse_int=parse_int,
@@ -126,72 +257,406 @@ def loads(
             strict=strict,
             object_pairs_hook=object_pairs_hook,
             parse_json5_identifiers=parse_json5_identifiers,
+            max_depth=max_depth,
+            numeric_arrays=numeric_arrays,
+            try_json=try_json,
         )
+        if not isinstance(s, str):
+            return decoder.decode_bytes(s)
+        return decoder.decode(s)
+    if isinstance(s, str):
+        text = s
+    else:
+        from .decoder import _detect_encoding
+
+        text = str(s, _detect_encoding(s))
+    if lazy:
+        hooks = (object_hook, parse_float, parse_int, parse_constant, object_pairs_hook, parse_json5_identifiers)
+        options = (loader, max_depth, numeric_arrays) + hooks
+        if any(option is not None for option in options):
+            raise ValueError('A custom loader, hooks, max_depth or numeric_arrays cannot be used with lazy=True')
+        from .tape import loads_lazy
+
+        return loads_lazy(text)
+    assert loader is not None
+    from .parser import parse_source
+
+    model = parse_source(text)
+    # logger.debug('Model is %r', model)
     return loader.load(model)
 
 
-class LoaderBase:
+def load_path(
+    path: str | os.PathLike[str],
+    *,
+    mmap: bool = True,
+    object_hook: Callable[[dict[typing.Any, typing.Any]], typing.Any] | None = None,
+    parse_float: Callable[[str], typing.Any] | None = None,
+    parse_int: Callable[[str], typing.Any] | None = None,
+    parse_constant: Callable[[Literal['-Infinity', 'Infinity', 'NaN']], typing.Any] | None = None,
+    strict: bool = True,
+    object_pairs_hook: Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
+    parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = None,
+    max_depth: int | None = None,
+    numeric_arrays: T_NumericArrays | None = None,
+    into: typing.Any = None,
+    unknown_fields: T_UnknownFields = 'ignore',
+) -> typing.Any:
+    """
+    Load the JSON5 file at ``path``. Its encoding is detected like ``loads`` does for bytes.
+
+    The bytes of UTF-8 files are tokenized directly, and only the text of strings, names and other tokens is decoded,
+    so the contents of the file are never copied into one big ``str``. With ``mmap`` (the default), the file is memory-mapped
+    rather than read, so its pages are shared with any other processes that map the same file.
+
+    :param path:
+    :param mmap: memory-map the file instead of reading it into memory
+    :param max_depth: see ``loads``
+    :param numeric_arrays: see ``loads``
+    :param into: see ``loads``
+    :param unknown_fields: see ``loads``
+    :param kwargs: the same hooks as ``load``
+    :return:
+    """
+    decoder = _make_decoder(
+        into,
+        unknown_fields,
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        parse_json5_identifiers=parse_json5_identifiers,
+        max_depth=max_depth,
+        numeric_arrays=numeric_arrays,
+        try_json=False,
+    )
+    with open(path, 'rb') as f:
+        # Empty files can't be mapped
+        if not mmap or os.fstat(f.fileno()).st_size == 0:
+            return decoder.decode_bytes(f.read())
+        with _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) as data:
+            return decoder.decode_bytes(data)
+
+
+def load_columns(
+    source: str | bytes | bytearray | memoryview | typing.TextIO,
+    *,
+    object_hook: Callable[[dict[typing.Any, typing.Any]], typing.Any] | None = None,
+    parse_float: Callable[[str], typing.Any] | None = None,
+    parse_int: Callable[[str], typing.Any] | None = None,
+    parse_constant: Callable[[Literal['-Infinity', 'Infinity', 'NaN']], typing.Any] | None = None,
+    strict: bool = True,
+    object_pairs_hook: Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
+    parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = None,
+    max_depth: int | None = None,
+    numeric_arrays: T_NumericArrays | None = None,
+    try_json: bool = True,
+) -> dict[typing.Any, typing.Any]:
+    """
+    Load a document that is an array of objects (records) into columns: a dict with a list of the values of each field,
+    in the order the fields first appear. Records that lack some of the fields have ``None`` in their columns. This
+    takes far less memory than loading a list of dicts, as no dict is kept for any of the records.
+
+    :param source: the text, a bytes-like object as for ``loads``, or a file-like object with a read method
+    :param kwargs: the same hooks as ``load``. The object hooks are not applied to the records themselves
+    :param max_depth: see ``loads``. The records count as nested in the array
+    :param numeric_arrays: see ``loads``. Columns holding only numbers are converted too
+    :param try_json: decode plain JSON documents a record at a time with the (faster) ``json`` module. Has no effect
+        when ``max_depth`` or an object hook is given
+    :return:
+    """
+    from .columns import ColumnDecoder
+
+    decoder = ColumnDecoder(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        parse_json5_identifiers=parse_json5_identifiers,
+        max_depth=max_depth,
+        numeric_arrays=numeric_arrays,
+        try_json=try_json,
+    )
+    if isinstance(source, str):
+        return decoder.decode(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return decoder.decode_bytes(source)
+    return decoder.decode(source.read())
+
+
+def load_lines(
+    f: typing.TextIO,
+    *,
+    object_hook: Callable[[dict[typing.Any, typing.Any]], typing.Any] | None = None,
+    parse_float: Callable[[str], typing.Any] | None = None,
+    parse_int: Callable[[str], typing.Any] | None = None,
+    parse_constant: Callable[[Literal['-Infinity', 'Infinity', 'NaN']], typing.Any] | None = None,
+    strict: bool = True,
+    object_pairs_hook: Callable[[list[tuple[str | JsonIdentifier, typing.Any]]], typing.Any] | None = None,
+    parse_json5_identifiers: Callable[[JsonIdentifier], typing.Any] | None = None,
+    max_depth: int | None = None,
+    numeric_arrays: T_NumericArrays | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+    batch_size: int = 1000,
+) -> typing.Iterator[typing.Any]:
+    """
+    Iterate over the values in a file containing any number of JSON5 values, such as one value per line
+    (JSON5 Lines) or values simply concatenated together. Values may be separated by whitespace and comments.
+
+    The file is read ``chunk_size`` characters at a time and a single tokenizer and decoder are used for the whole
+    file, so this is much cheaper than calling ``loads`` for each line.
+
+    :param f:
+    :param kwargs: the same hooks as ``load``
+    :param workers: if given, decode the file in a pool of this many processes. The file is split into batches of
+        ``batch_size`` lines, so every line must hold complete values, and the hooks must be picklable. Values are
+        still produced in the order they appear in the file
+    :param batch_size: how many lines each worker decodes at a time
+    :return:
+    """
+    env_kwargs: dict[str, typing.Any] = dict(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        object_pairs_hook=object_pairs_hook,
+        parse_json5_identifiers=parse_json5_identifiers,
+        max_depth=max_depth,
+        numeric_arrays=numeric_arrays,
+    )
+    if workers is None:
+        from .decoder import Decoder
+        from .tokenizer import tokenize_file
+
+        decoder = Decoder(try_json=False, **env_kwargs)
+        yield from decoder._iter_values(tokenize_file(f, chunk_size=chunk_size))
+        return
+
+    from concurrent.futures import Future
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending: deque[Future[list[typing.Any]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for batch_text, lineno, index in _line_batches(f, batch_size):
+                pending.append(executor.submit(_decode_lines_batch, batch_text, lineno, index, env_kwargs))
+                # Keep a bounded number of batches in flight, so memory use doesn't grow with the file
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _line_batches(f: typing.TextIO, batch_size: int) -> typing.Iterator[tuple[str, int, int]]:
+    """
+    Split the lines of ``f`` into batches, yielding the text of each batch along with its line number and offset
+    """
+    lineno = 1
+    index = 0
+    batch: list[str] = []
+    for line in f:
+        batch.append(line)
+        if len(batch) == batch_size:
+            text = ''.join(batch)
+            yield text, lineno, index
+            lineno += len(batch)
+            index += len(text)
+            batch = []
+    if batch:
+        yield ''.join(batch), lineno, index
+
+
+def _decode_lines_batch(text: str, lineno: int, index: int, env_kwargs: dict[str, typing.Any]) -> list[typing.Any]:
+    from .decoder import Decoder
+    from .tokenizer import tokenize
+
+    decoder = Decoder(try_json=False, **env_kwargs)
+    try:
+        return list(decoder._iter_values(tokenize(text)))
+    except JSON5DecodeError:
+        # Decode again with tokens positioned relative to the whole file, so the error points at the right place
+        list(decoder._iter_values(_offset_tokens(JSONLexer().tokenize_stream(io.StringIO(text), lineno=lineno), index)))
+        raise
+
+
+def _offset_tokens(tokens: typing.Iterator[JSON5Token], index: int) -> typing.Iterator[JSON5Token]:
+    for tok in tokens:
+        tok.index += index
+        tok.end += index
+        yield tok
+
+
+class LoaderBase(TypeDispatch):
     def __init__(self, env: Environment | None = None, **env_kwargs: typing.Any):
         if env is None:
             env = Environment(**env_kwargs)
         self.env: Environment = env
 
-    @singledispatchmethod
     @abstractmethod
     def load(self, node: Node) -> typing.Any:
         return NotImplemented
 
 
 class DefaultLoader(LoaderBase):
-    @singledispatchmethod
+    def __init__(self, env: Environment | None = None, **env_kwargs: typing.Any):
+        super().__init__(env, **env_kwargs)
+        # Objects in a document tend to share the same keys, so each distinct key is only created once and all
+        # objects refer to the same key object. Cleared after each document, and after each object or array loaded
+        # other than as part of a document.
+        self._identifiers: dict[str, JsonIdentifier] = {}
+        self._string_keys: dict[str, str] = {}
+        self._depth = 0
+        # how many calls to _load_nested are in progress
+        self._nested_calls = 0
+
     def load(self, node: Node) -> typing.Any:
-        raise NotImplementedError(f"Can't load node {node}")
+        node_type = type(node)
+        handler = self._handlers.get(node_type) or self._find_handler(node_type)
+        if handler is None:
+            raise NotImplementedError(f"Can't load node {node}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s evaluating node %r', handler.__name__, node)
+        return handler(self, node)
 
-    to_python = load.register
+    to_python = handles
 
     @to_python(JSONText)
     def json_model_to_python(self, node: JSONText) -> typing.Any:
-        logger.debug('json_model_to_python evaluating node %r', node)
-        return self.load(node.value)
+        try:
+            return self.load(node.value)
+        finally:
+            self._identifiers.clear()
+            self._string_keys.clear()
 
     @to_python(JSONObject)
     def json_object_to_python(self, node: JSONObject) -> typing.Any:
-        logger.debug('json_object_to_python evaluating node %r', node)
-        d = {}
-        for key_value_pair in node.key_value_pairs:
-            key = self.load(key_value_pair.key)
-            value = self.load(key_value_pair.value)
-            d[key] = value
-        if self.env.object_pairs_hook:
-            return self.env.object_pairs_hook(list(d.items()))
-        elif self.env.object_hook:
-            return self.env.object_hook(d)
-        else:
-            return d
+        return self._load_nested(node)
 
     @to_python(JSONArray)
     def json_array_to_python(self, node: JSONArray) -> list[typing.Any]:
-        logger.debug('json_array_to_python evaluating node %r', node)
-        return [self.load(value) for value in node.values]
+        ret: list[typing.Any] = self._load_nested(node)
+        return ret
+
+    def _load_nested(self, node: JSONObject | JSONArray) -> typing.Any:
+        """
+        Load an object or array with ``_load_nested_values``. Once the outermost one is done, the shared keys are
+        forgotten, whether it was loaded as part of a document or on its own.
+        """
+        self._nested_calls += 1
+        try:
+            return self._load_nested_values(node)
+        finally:
+            self._nested_calls -= 1
+            if not self._nested_calls:
+                self._identifiers.clear()
+                self._string_keys.clear()
+
+    def _load_nested_values(self, node: JSONObject | JSONArray) -> typing.Any:
+        """
+        Load an object or array along with the objects and arrays inside it. Rather than recursing, the ones still
+        being loaded are kept on an explicit stack, so they can be nested to any depth (up to ``env.max_depth``).
+        Objects and arrays whose handlers are overridden are loaded by their handlers instead, and when ``load`` is
+        overridden, every key and value is loaded by calling it.
+        """
+        env = self.env
+        max_depth = env.max_depth
+        # how deep node is nested in the objects and arrays loaded by the calls to load further up the call stack
+        depth = self._depth
+        load_overridden = type(self).load is not DefaultLoader.load
+        handlers = self._handlers
+        string_keys = self._string_keys
+        object_handler = DefaultLoader.json_object_to_python
+        array_handler = DefaultLoader.json_array_to_python
+        # the objects and arrays enclosing the one being loaded, each with its result so far and remaining children
+        stack: list[tuple[bool, typing.Any, typing.Iterator[typing.Any], typing.Any]] = []
+        if max_depth is not None and depth >= max_depth:
+            raise JSON5DecodeError(f'Maximum nesting depth of {max_depth} exceeded', node._tok)  # type: ignore[arg-type]
+        is_object = isinstance(node, JSONObject)
+        result: typing.Any = {} if is_object else []
+        children: typing.Iterator[typing.Any] = iter(
+            node.key_value_pairs if is_object else node.values  # type: ignore[union-attr]
+        )
+        key: typing.Any = None
+        while True:
+            for child in children:
+                if load_overridden:
+                    self._depth = depth + len(stack) + 1
+                    try:
+                        if is_object:
+                            result[self.load(child.key)] = self.load(child.value)
+                        else:
+                            result.append(self.load(child))
+                    finally:
+                        self._depth = depth
+                    continue
+                if is_object:
+                    key_node = child.key
+                    key_handler = handlers.get(type(key_node)) or self._find_handler(type(key_node))
+                    if key_handler is None:
+                        raise NotImplementedError(f"Can't load node {key_node}")
+                    key = key_handler(self, key_node)
+                    if type(key) is str:
+                        key = string_keys.setdefault(key, key)
+                    child = child.value
+                child_type = type(child)
+                handler = handlers.get(child_type) or self._find_handler(child_type)
+                if handler is object_handler or handler is array_handler:
+                    if max_depth is not None and depth + len(stack) + 1 >= max_depth:
+                        raise JSON5DecodeError(f'Maximum nesting depth of {max_depth} exceeded', child._tok)
+                    stack.append((is_object, result, children, key))
+                    is_object = handler is object_handler
+                    result = {} if is_object else []
+                    children = iter(child.key_value_pairs if is_object else child.values)
+                    break
+                if handler is None:
+                    raise NotImplementedError(f"Can't load node {child}")
+                if is_object:
+                    result[key] = handler(self, child)
+                else:
+                    result.append(handler(self, child))
+            else:
+                if is_object:
+                    if env.object_pairs_hook:
+                        result = env.object_pairs_hook(list(result.items()))
+                    elif env.object_hook:
+                        result = env.object_hook(result)
+                elif env.numeric_arrays:
+                    result = _numeric_array(result, env.numeric_arrays)
+                if not stack:
+                    return result
+                value = result
+                is_object, result, children, key = stack.pop()
+                if is_object:
+                    result[key] = value
+                else:
+                    result.append(value)
 
     @to_python(Identifier)
     def identifier_to_python(self, node: Identifier) -> typing.Any:
-        logger.debug('identifier_to_python evaluating node %r', node)
-        res = JsonIdentifier(node.name)
+        res = self._identifiers.get(node.name)
+        if res is None:
+            res = self._identifiers[node.name] = JsonIdentifier(node.name)
         if self.env.parse_json5_identifiers:
             return self.env.parse_json5_identifiers(res)
         return res
 
     @to_python(Infinity)  # NaN/Infinity are covered here
     def inf_to_python(self, node: Infinity) -> typing.Any:
-        logger.debug('inf_to_python evaluating node %r', node)
         if self.env.parse_constant:
             return self.env.parse_constant(node.const)
         return node.value
 
     @to_python(NaN)  # NaN/Infinity are covered here
     def nan_to_python(self, node: NaN) -> typing.Any:
-        logger.debug('nan_to_python evaluating node %r', node)
         if self.env.parse_constant:
             return self.env.parse_constant(node.const)
         return node.value
@@ -212,7 +677,6 @@ class DefaultLoader(LoaderBase):
 
     @to_python(UnaryOp)
     def unary_to_python(self, node: UnaryOp) -> typing.Any:
-        logger.debug('unary_to_python evaluating node %r', node)
         if isinstance(node.value, Infinity):
             return self.load(node.value)
         value = self.load(node.value)
@@ -223,18 +687,15 @@ class DefaultLoader(LoaderBase):
 
     @to_python(String)
     def string_to_python(self, node: DoubleQuotedString | SingleQuotedString) -> str:
-        logger.debug('string_to_python evaluating node %r', node)
         ret: str = node.characters
         return ret
 
     @to_python(NullLiteral)
     def null_to_python(self, node: NullLiteral) -> None:
-        logger.debug('null_to_python evaluating node %r', node)
         return None
 
     @to_python(BooleanLiteral)
     def boolean_to_python(self, node: BooleanLiteral) -> bool:
-        logger.debug('boolean_to_python evaluating node %r', node)
         return node.value
 
     @to_python(Comment)
@@ -243,6 +704,15 @@ class DefaultLoader(LoaderBase):
 
 
 class ModelLoader(LoaderBase):
-    @singledispatchmethod
+    """
+    Returns the model itself. ``positions`` determines what its nodes keep of the tokens they were parsed from; see
+    ``json5.model.detach_tokens``. With ``'spans'`` or ``None``, the model doesn't keep the source text alive.
+    """
+
+    def __init__(self, env: Environment | None = None, positions: T_Positions = 'tokens', **env_kwargs: typing.Any):
+        super().__init__(env, **env_kwargs)
+        self.positions: T_Positions = positions
+
     def load(self, node: Node) -> typing.Any:
+        detach_tokens(node, self.positions)
         return node
@@ -7,7 +7,9 @@ from typing import Any
 from typing import Literal
 from typing import NamedTuple
 
-from .tokenizer import JSON5Token
+if typing.TYPE_CHECKING:
+    from .tokenizer import JSON5Token
+    from .tokenizer import LineIndex
 
 __all__ = [
     'Node',
@@ -33,6 +35,7 @@ __all__ = [
     'Comment',
     'LineComment',
     'BlockComment',
+    'TokenSpan',
 ]
 
 
@@ -41,6 +44,33 @@ class KeyValuePair(NamedTuple):
     value: Value
 
 
+class TokenSpan:
+    """
+    The position of a token in the document it came from, kept in place of the token itself so that neither the token
+    nor the document has to be kept alive.
+    """
+
+    __slots__ = ('lineno', 'colno', 'end_lineno', 'end_colno', 'index', 'end')
+
+    def __init__(self, lineno: int, colno: int, end_lineno: int, end_colno: int, index: int, end: int):
+        self.lineno: int = lineno
+        self.colno: int = colno
+        self.end_lineno: int = end_lineno
+        self.end_colno: int = end_colno
+        self.index: int = index
+        self.end: int = end
+
+    def __repr__(self) -> str:
+        return (
+            f'TokenSpan(lineno={self.lineno}, colno={self.colno}, end_lineno={self.end_lineno}, '
+            f'end_colno={self.end_colno}, index={self.index}, end={self.end})'
+        )
+
+
+# What nodes keep of the tokens they were parsed from: the tokens themselves, just their positions, or nothing
+T_Positions = typing.Optional[Literal['tokens', 'spans']]
+
+
 def walk(root: Node) -> typing.Generator[Node, None, None]:
     todo = deque([root])
     while todo:
@@ -61,6 +91,10 @@ def iter_child_nodes(node: Node) -> typing.Generator[Node, None, None]:
 
 def iter_fields(node: Node) -> typing.Generator[tuple[str, Any], None, None]:
     for field_name in node._fields:
+        if field_name in _TRIVIA_FIELDS:
+            # Read the underlying slot, so that walking a model doesn't allocate lists for nodes without any trivia
+            yield field_name, getattr(node, f'_{field_name}') or []
+            continue
         try:
             value = getattr(node, field_name)
             yield field_name, value
@@ -68,15 +102,99 @@ def iter_fields(node: Node) -> typing.Generator[tuple[str, Any], None, None]:
             pass
 
 
+_TRIVIA_FIELDS = frozenset({'wsc_before', 'wsc_after', 'leading_wsc'})
+
+
+_SLOT_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _slot_fields(cls: type[Node]) -> tuple[str, ...]:
+    """
+    The names of the (public) fields declared in the ``__slots__`` of ``cls`` and its bases, most derived first
+    """
+    try:
+        return _SLOT_FIELDS[cls]
+    except KeyError:
+        pass
+    names: list[str] = []
+    for klass in cls.__mro__:
+        for name in klass.__dict__.get('__slots__', ()):
+            if name.startswith('_'):
+                # a field computed on first access is kept in a private slot, behind a property of the same name
+                name = name[1:]
+                if name in _TRIVIA_FIELDS or not isinstance(getattr(cls, name, None), property):
+                    continue
+            if name not in cls.excluded_names and name not in names:
+                names.append(name)
+    fields = _SLOT_FIELDS[cls] = tuple(names)
+    return fields
+
+
+def detach_tokens(root: Node, positions: T_Positions = 'spans') -> None:
+    """
+    Replace the tokens held by ``root`` and every node below it (including comments) with a ``TokenSpan`` of their
+    position, or drop them altogether if ``positions`` is ``None``. Afterwards, the model no longer references the
+    source document, so it can be garbage collected.
+    """
+    if positions not in ('tokens', 'spans', None):
+        raise ValueError(f"positions must be 'tokens', 'spans' or None, not {positions!r}")
+    if positions == 'tokens':
+        return
+    spans: dict[int, TokenSpan] = {}
+
+    def detach(tok: JSON5Token | TokenSpan | None) -> TokenSpan | None:
+        if tok is None or positions is None:
+            return None
+        if isinstance(tok, TokenSpan):
+            return tok
+        span = spans.get(id(tok))
+        if span is None:
+            span = spans[id(tok)] = TokenSpan(tok.lineno, tok.colno, tok.end_lineno, tok.end_colno, tok.index, tok.end)
+        return span
+
+    todo = [root]
+    while todo:
+        node = todo.pop()
+        node._tok = detach(node._tok)
+        node._end_tok = detach(node._end_tok)
+        todo.extend(iter_child_nodes(node))
+        if isinstance(node, (JSONObject, JSONArray)) and node._leading_wsc:
+            todo.extend(wsc for wsc in node._leading_wsc if isinstance(wsc, Node))
+
+
 class Node:
+    # Models of large documents have a great many nodes, so nodes use __slots__ and their trivia (whitespace and
+    # comments) lists are only allocated when there is trivia to put in them.
+    __slots__ = ('_wsc_before', '_wsc_after', '_tok', '_end_tok')
+
     excluded_names = ['excluded_names', 'wsc_before', 'wsc_after', 'leading_wsc', 'tok', 'end_tok']
 
-    def __init__(self, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    def __init__(self, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None):
         # Whitespace/Comments before/after the node
-        self.wsc_before: list[str | Comment] = []
-        self.wsc_after: list[str | Comment] = []
-        self._tok: JSON5Token | None = tok
-        self._end_tok: JSON5Token | None = end_tok
+        self._wsc_before: list[str | Comment] | None = None
+        self._wsc_after: list[str | Comment] | None = None
+        self._tok: JSON5Token | TokenSpan | None = tok
+        self._end_tok: JSON5Token | TokenSpan | None = end_tok
+
+    @property
+    def wsc_before(self) -> list[str | Comment]:
+        if self._wsc_before is None:
+            self._wsc_before = []
+        return self._wsc_before
+
+    @wsc_before.setter
+    def wsc_before(self, value: list[str | Comment]) -> None:
+        self._wsc_before = value
+
+    @property
+    def wsc_after(self) -> list[str | Comment]:
+        if self._wsc_after is None:
+            self._wsc_after = []
+        return self._wsc_after
+
+    @wsc_after.setter
+    def wsc_after(self, value: list[str | Comment]) -> None:
+        self._wsc_after = value
 
     @property
     def col_offset(self) -> int | None:
@@ -103,48 +221,77 @@ class Node:
         r = self._end_tok.end_lineno
         return r
 
+    def _own_fields(self) -> list[str]:
+        fields = list(_slot_fields(type(self)))
+        # subclasses without __slots__ of their own may add fields in their __dict__
+        for item in getattr(self, '__dict__', ()):
+            if not item.startswith('_') and item not in self.excluded_names and item not in fields:
+                fields.append(item)
+        return fields
+
     def __repr__(self) -> str:
         rep = (
             f"{self.__class__.__name__}("
-            + ", ".join(
-                f"{key}={repr(value)}"
-                for key, value in self.__dict__.items()
-                if not key.startswith('_') and key not in self.excluded_names
-            )
+            + ", ".join(f"{key}={repr(getattr(self, key))}" for key in self._own_fields() if hasattr(self, key))
             + ")"
         )
         return rep
 
     @property
     def _fields(self) -> list[str]:
-        fields = [item for item in list(self.__dict__) if not item.startswith('_') and item not in self.excluded_names]
+        fields = self._own_fields()
         fields.extend(['wsc_before', 'wsc_after'])
         return fields
 
 
 class JSONText(Node):
-    def __init__(self, value: Value, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    __slots__ = ('value',)
+
+    def __init__(
+        self, value: Value, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None
+    ):
         assert isinstance(value, Value)
         self.value: Value = value
         super().__init__(tok=tok, end_tok=tok)
 
+    def offset_to_position(self, offset: int) -> tuple[int, int]:
+        """
+        Convert an offset in the document this model was parsed from to a ``(lineno, colno)`` position.
+        Lines are numbered from 1 and columns from 0.
+        """
+        return self._line_index().offset_to_position(offset)
+
+    def position_to_offset(self, lineno: int, colno: int) -> int:
+        """
+        Convert a ``(lineno, colno)`` position in the document this model was parsed from to an offset.
+        """
+        return self._line_index().position_to_offset(lineno, colno)
+
+    def _line_index(self) -> LineIndex:
+        line_index: LineIndex | None = getattr(self._tok, 'line_index', None)
+        if line_index is None:
+            raise ValueError('Positions are only available for models parsed from a string, with their tokens')
+        return line_index
+
 
 class Value(Node):
-    pass
+    __slots__ = ()
 
 
 class Key(Node):
-    ...
+    __slots__ = ()
 
 
 class JSONObject(Value):
+    __slots__ = ('keys', 'values', 'trailing_comma', '_leading_wsc')
+
     def __init__(
         self,
         *key_value_pairs: KeyValuePair,
         trailing_comma: TrailingComma | None = None,
         leading_wsc: list[str | Comment] | None = None,
-        tok: JSON5Token | None = None,
-        end_tok: JSON5Token | None = None,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
         keys: list[Key] = []
         values: list[Value] = []
@@ -158,23 +305,35 @@ class JSONObject(Value):
         self.values: list[Value] = values
         assert leading_wsc is None or all(isinstance(item, str) or isinstance(item, Comment) for item in leading_wsc)
         self.trailing_comma: TrailingComma | None = trailing_comma
-        self.leading_wsc: list[str | Comment] = leading_wsc or []
+        self._leading_wsc: list[str | Comment] | None = leading_wsc or None
 
         super().__init__(tok=tok, end_tok=end_tok)
 
+    @property
+    def leading_wsc(self) -> list[str | Comment]:
+        if self._leading_wsc is None:
+            self._leading_wsc = []
+        return self._leading_wsc
+
+    @leading_wsc.setter
+    def leading_wsc(self, value: list[str | Comment]) -> None:
+        self._leading_wsc = value
+
     @property
     def key_value_pairs(self) -> list[KeyValuePair]:
         return list(KeyValuePair(key, value) for key, value in zip(self.keys, self.values))
 
 
 class JSONArray(Value):
+    __slots__ = ('values', 'trailing_comma', '_leading_wsc')
+
     def __init__(
         self,
         *values: Value,
         trailing_comma: TrailingComma | None = None,
         leading_wsc: list[str | Comment] | None = None,
-        tok: JSON5Token | None = None,
-        end_tok: JSON5Token | None = None,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
         vals = list(values)
         for value in vals:
@@ -182,14 +341,30 @@ class JSONArray(Value):
         assert leading_wsc is None or all(isinstance(item, str) or isinstance(item, Comment) for item in leading_wsc)
         self.values: list[Value] = vals
         self.trailing_comma: TrailingComma | None = trailing_comma
-        self.leading_wsc: list[str | Comment] = leading_wsc or []
+        self._leading_wsc: list[str | Comment] | None = leading_wsc or None
 
         super().__init__(tok=tok, end_tok=end_tok)
 
+    @property
+    def leading_wsc(self) -> list[str | Comment]:
+        if self._leading_wsc is None:
+            self._leading_wsc = []
+        return self._leading_wsc
+
+    @leading_wsc.setter
+    def leading_wsc(self, value: list[str | Comment]) -> None:
+        self._leading_wsc = value
+
 
 class Identifier(Key):
+    __slots__ = ('name', 'raw_value')
+
     def __init__(
-        self, name: str, raw_value: str | None = None, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None
+        self,
+        name: str,
+        raw_value: str | None = None,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
         assert isinstance(name, str)
         if raw_value is None:
@@ -209,57 +384,86 @@ class Identifier(Key):
 
 
 class Number(Value):
-    ...
+    __slots__ = ()
 
 
 class Integer(Number):
+    __slots__ = ('_value', 'raw_value', 'is_hex', 'is_octal')
+
     def __init__(
         self,
         raw_value: str,
         is_hex: bool = False,
         is_octal: bool = False,
-        tok: JSON5Token | None = None,
-        end_tok: JSON5Token | None = None,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
         assert isinstance(raw_value, str)
         if is_hex and is_octal:
             raise ValueError("is_hex and is_octal are mutually exclusive")
-        if is_hex:
-            value = int(raw_value, 0)
-        elif is_octal:
-            if raw_value.startswith('0o'):
-                value = int(raw_value, 8)
-            else:
-                value = int(raw_value.replace('0', '0o', 1), 8)
-        else:
-            value = int(raw_value)
-        self.value: int = value
+        self._value: int | None = None  # converted from raw_value when first needed
         self.raw_value: str = raw_value
         self.is_hex: bool = is_hex
         self.is_octal: bool = is_octal
 
         super().__init__(tok=tok, end_tok=end_tok or tok)
 
+    @property
+    def value(self) -> int:
+        if self._value is None:
+            raw_value = self.raw_value
+            if self.is_hex:
+                self._value = int(raw_value, 0)
+            elif self.is_octal:
+                if raw_value.startswith('0o'):
+                    self._value = int(raw_value, 8)
+                else:
+                    self._value = int(raw_value.replace('0', '0o', 1), 8)
+            else:
+                self._value = int(raw_value)
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+
 
 class Float(Number):
+    __slots__ = ('raw_value', 'exp_notation', '_value')
+
     def __init__(
         self,
         raw_value: str,
         exp_notation: str | None = None,
-        tok: JSON5Token | None = None,
-        end_tok: JSON5Token | None = None,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
-        value = float(raw_value)
         assert exp_notation is None or exp_notation in ('e', 'E')
         self.raw_value: str = raw_value
         self.exp_notation: str | None = exp_notation
-
-        self.value: float = value
+        self._value: float | None = None  # converted from raw_value when first needed
         super().__init__(tok=tok, end_tok=end_tok or tok)
 
+    @property
+    def value(self) -> float:
+        if self._value is None:
+            self._value = float(self.raw_value)
+        return self._value
+
+    @value.setter
+    def value(self, value: float) -> None:
+        self._value = value
+
 
 class Infinity(Number):
-    def __init__(self, negative: bool = False, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    __slots__ = ('negative',)
+
+    def __init__(
+        self,
+        negative: bool = False,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
+    ):
         self.negative: bool = negative
 
         super().__init__(tok=tok, end_tok=tok)
@@ -277,7 +481,9 @@ class Infinity(Number):
 
 
 class NaN(Number):
-    def __init__(self, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    __slots__ = ()
+
+    def __init__(self, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None):
         super().__init__(tok=tok, end_tok=tok)
 
     @property
@@ -290,8 +496,14 @@ class NaN(Number):
 
 
 class String(Value, Key):
+    __slots__ = ('characters', 'raw_value')
+
     def __init__(
-        self, characters: str, raw_value: str, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None
+        self,
+        characters: str,
+        raw_value: str,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
         assert isinstance(raw_value, str)
         assert isinstance(characters, str)
@@ -302,15 +514,19 @@ class String(Value, Key):
 
 
 class DoubleQuotedString(String):
-    ...
+    __slots__ = ()
 
 
 class SingleQuotedString(String):
-    ...
+    __slots__ = ()
 
 
 class BooleanLiteral(Value):
-    def __init__(self, value: bool, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    __slots__ = ('value',)
+
+    def __init__(
+        self, value: bool, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None
+    ):
         assert value in (True, False)
         self.value: bool = value
 
@@ -318,15 +534,23 @@ class BooleanLiteral(Value):
 
 
 class NullLiteral(Value):
+    __slots__ = ()
+
     value = None
 
-    def __init__(self, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    def __init__(self, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None):
         super().__init__(tok=tok, end_tok=tok)
 
 
 class UnaryOp(Value):
+    __slots__ = ('op', 'value')
+
     def __init__(
-        self, op: Literal['-', '+'], value: Number, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None
+        self,
+        op: Literal['-', '+'],
+        value: Number,
+        tok: JSON5Token | TokenSpan | None = None,
+        end_tok: JSON5Token | TokenSpan | None = None,
     ):
         assert op in ('-', '+')
         assert isinstance(value, Number)
@@ -337,20 +561,26 @@ class UnaryOp(Value):
 
 
 class TrailingComma(Node):
-    def __init__(self, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    __slots__ = ()
+
+    def __init__(self, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None):
         super().__init__(tok=tok, end_tok=tok)  # Trailing comma is always a single COMMA token
 
 
 class Comment(Node):
-    def __init__(self, value: str, tok: JSON5Token | None = None, end_tok: JSON5Token | None = None):
+    __slots__ = ('value',)
+
+    def __init__(
+        self, value: str, tok: JSON5Token | TokenSpan | None = None, end_tok: JSON5Token | TokenSpan | None = None
+    ):
         assert isinstance(value, str), f"Expected str got {type(value)}"
         self.value: str = value
         super().__init__(tok=tok, end_tok=tok)  # Comments are always a single token
 
 
 class LineComment(Comment):
-    ...
+    __slots__ = ()
 
 
 class BlockComment(Comment):
-    ...
+    __slots__ = ()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import ast
+import hashlib
+import os
 import sys
 import typing
-from functools import lru_cache
 from typing import Any
 from typing import Literal
 from typing import Protocol
@@ -15,6 +15,7 @@ from sly.yacc import SlyLogger  # type: ignore
 from .model import BlockComment
 from .model import BooleanLiteral
 from .model import Comment
+from .model import detach_tokens
 from .model import DoubleQuotedString
 from .model import Float
 from .model import Identifier
@@ -29,11 +30,16 @@ from .model import LineComment
 from .model import NaN
 from .model import NullLiteral
 from .model import SingleQuotedString
+from .model import T_Positions
 from .model import TrailingComma
 from .model import UnaryOp
 from .model import Value
+from .tokenizer import decode_identifier_name
+from .tokenizer import decode_string_literal
+from .tokenizer import is_valid_identifier_name
 from .tokenizer import JSON5Token
 from .tokenizer import JSONLexer
+from .tokenizer import LineIndex
 from .tokenizer import tokenize
 from .utils import JSON5DecodeError
 
@@ -46,56 +52,6 @@ class QuietSlyLogger(SlyLogger):  # type: ignore[misc]
     info = warning
 
 
-ESCAPE_SEQUENCES = {
-    'b': '\u0008',
-    'f': '\u000C',
-    'n': '\u000A',
-    'r': '\u000D',
-    't': '\u0009',
-    'v': '\u000B',
-    '0': '\u0000',
-    '\\': '\u005c',
-    '"': '\u0022',
-    "'": '\u0027',
-}
-
-# class TrailingComma:
-#     pass
-
-
-def replace_escape_literals(matchobj: re.Match[str]) -> str:
-    s = matchobj.group(0)
-    if s.startswith('\\0') and len(s) == 3:
-        raise JSON5DecodeError("'\\0' MUST NOT be followed by a decimal digit", None)
-    seq = matchobj.group(1)
-    return ESCAPE_SEQUENCES.get(seq, seq)
-
-
-@lru_cache(maxsize=1024)
-def _latin_escape_replace(s: str) -> str:
-    if s.startswith('\\x') and len(s) != 4:
-        raise JSON5DecodeError("'\\x' MUST be followed by two hexadecimal digits", None)
-    val: str = ast.literal_eval(f'"{s}"')
-    if val == '\\':
-        val = '\\\\'  # this is important; the subsequent regex will sub it back to \\
-    return val
-
-
-def latin_unicode_escape_replace(matchobj: re.Match[str]) -> str:
-    s = matchobj.group(0)
-    return _latin_escape_replace(s)
-
-
-def _unicode_escape_replace(s: str) -> str:
-    ret: str = ast.literal_eval(f'"{s}"')
-    return ret
-
-
-def unicode_escape_replace(matchobj: re.Match[str]) -> str:
-    s = matchobj.group(0)
-    return _unicode_escape_replace(s)
-
-
 class T_TokenSlice(Protocol):
     def __getitem__(self, item: int) -> JSON5Token:
         ...
@@ -250,6 +206,44 @@ class T_ValueProduction(Protocol):
         ...
 
 
+class CachedLRTable:
+    """
+    The parts of a ``sly.yacc.LRTable`` that are needed at parse time, as stored in ``json5._parsetab``.
+    """
+
+    def __init__(
+        self,
+        lr_action: dict[int, dict[str, int]],
+        lr_goto: dict[int, dict[str, int]],
+        defaulted_states: dict[int, int],
+    ):
+        self.lr_action = lr_action
+        self.lr_goto = lr_goto
+        self.defaulted_states = defaulted_states
+
+
+def grammar_hash(grammar: Any) -> str:
+    """
+    A digest of the terminals and productions of a sly grammar. The cached parse tables are only used when this matches.
+    """
+    h = hashlib.sha256()
+    for terminal in sorted(grammar.Terminals):
+        h.update(f'{terminal}\n'.encode('utf-8'))
+    for production in grammar.Productions:
+        h.update(f'{production}\n'.encode('utf-8'))
+    return h.hexdigest()
+
+
+def load_cached_lrtable(grammar: Any) -> CachedLRTable | None:
+    try:
+        from . import _parsetab
+    except ImportError:
+        return None
+    if _parsetab.GRAMMAR_HASH != grammar_hash(grammar):
+        return None
+    return CachedLRTable(_parsetab.lr_action, _parsetab.lr_goto, _parsetab.defaulted_states)
+
+
 T_CallArg = typing.TypeVar('T_CallArg')
 _: typing.Callable[..., typing.Callable[[T_CallArg], T_CallArg]]
 
@@ -266,6 +260,22 @@ class JSONParser(Parser):  # type: ignore[misc]
         self.seen_tokens: list[JSON5Token] = []
         self.expecting: list[list[str]] = []
 
+    # sly calls ``Parser.__build_lrtables`` (a private, name-mangled method) while the class is being created.
+    # Building the LALR tables is the bulk of the cost of importing this module, so it is overridden to use the
+    # pregenerated tables in ``json5._parsetab`` when they were generated from this exact grammar. This was checked
+    # against sly 0.5, which looks the tables up as ``lr_action``, ``lr_goto`` and ``defaulted_states``. A sly without
+    # this method never calls the override and builds its tables as usual, as it does here when they can't be used.
+    if hasattr(Parser, '_Parser__build_lrtables'):
+
+        @classmethod
+        def _Parser__build_lrtables(cls) -> bool:
+            cached = load_cached_lrtable(cls._grammar)
+            if cached is None:
+                built: bool = super()._Parser__build_lrtables()
+                return built
+            cls._lrtable = cached
+            return True
+
     @_('{ wsc } value { wsc }')
     def text(self, p: T_TextProduction) -> JSONText:
         node = JSONText(value=p[1], tok=p.value._tok)
@@ -401,7 +411,7 @@ class JSONParser(Parser):  # type: ignore[misc]
         for index, value in enumerate(p.subsequent_array_value):
             if isinstance(value, TrailingComma):
                 if index + 1 != num_values:
-                    self.errors.append(JSON5DecodeError("Syntax Error: multiple trailing commas", value._tok))
+                    self.errors.append(JSON5DecodeError("Syntax Error: multiple trailing commas", value._tok))  # type: ignore[arg-type]
                     return ret, value
                 return ret, value
             else:
@@ -445,9 +455,8 @@ class JSONParser(Parser):  # type: ignore[misc]
     @_('NAME')
     def identifier(self, p: T_IdentifierProduction) -> Identifier:
         raw_value = p[0]
-        name = re.sub(r'\\u[0-9a-fA-F]{4}', unicode_escape_replace, raw_value)
-        pattern = r'[\w_\$]([\w_\d\$\p{Pc}\p{Mn}\p{Mc}\u200C\u200D])*'
-        if not re.fullmatch(pattern, name):
+        name = decode_identifier_name(raw_value)
+        if not is_valid_identifier_name(name):
             self.errors.append(JSON5DecodeError("Invalid identifier name", p._slice[0]))
         return Identifier(name=name, raw_value=raw_value, tok=p._slice[0])
 
@@ -505,55 +514,13 @@ class JSONParser(Parser):  # type: ignore[misc]
     @_('DOUBLE_QUOTE_STRING')
     def double_quoted_string(self, p: T_StringTokenProduction) -> DoubleQuotedString:
         raw_value = p[0]
-        contents = raw_value[1:-1]
-        terminator_in_string = re.search(r'(?<!\\)([\u000D\u2028\u2029]|(?<!\r)\n)', contents)
-        if terminator_in_string:
-            end = terminator_in_string.span()[0]
-            before_terminator = terminator_in_string.string[:end]
-            tok = p._slice[0]
-            pos = tok.index + len(before_terminator)
-            doc = tok.doc
-            lineno = doc.count('\n', 0, pos) + 1
-            colno = pos - doc.rfind('\n', 0, pos) + 1
-            index = pos + 1
-            errmsg = f"Illegal line terminator (line {lineno} column {colno} (char {index}) without continuation"
-            self.errors.append(JSON5DecodeError(errmsg, tok))
-        contents = re.sub(r'\\(\r\n|[\u000A\u000D\u2028\u2029])', '', contents)
-        try:
-            contents = re.sub(r'(\\x[a-fA-F0-9]{0,2}|\\u[0-9a-fA-F]{4})', latin_unicode_escape_replace, contents)
-        except JSON5DecodeError as exc:
-            self.errors.append(JSON5DecodeError(exc.args[0], p._slice[0]))
-        try:
-            contents = re.sub(r'\\(0\d|.)', replace_escape_literals, contents)
-        except JSON5DecodeError as exc:
-            self.errors.append(JSON5DecodeError(exc.args[0], p._slice[0]))
+        contents = decode_string_literal(raw_value, p._slice[0], self.errors)
         return DoubleQuotedString(contents, raw_value=raw_value, tok=p._slice[0])
 
     @_("SINGLE_QUOTE_STRING")
     def single_quoted_string(self, p: T_StringTokenProduction) -> SingleQuotedString:
         raw_value = p[0]
-        contents = raw_value[1:-1]
-        terminator_in_string = re.search(r'(?<!\\)([\u000D\u2028\u2029]|(?<!\r)\n)', contents)
-        if terminator_in_string:
-            end = terminator_in_string.span()[0]
-            before_terminator = terminator_in_string.string[:end]
-            tok = p._slice[0]
-            pos = tok.index + len(before_terminator)
-            doc = tok.doc
-            lineno = doc.count('\n', 0, pos) + 1
-            colno = pos - doc.rfind('\n', 0, pos) + 1
-            index = pos + 1
-            errmsg = f"Illegal line terminator (line {lineno} column {colno} (char {index}) without continuation"
-            self.errors.append(JSON5DecodeError(errmsg, tok))
-        contents = re.sub(r'\\(\r\n|[\u000A\u000D\u2028\u2029])', '', contents)
-        try:
-            contents = re.sub(r'(\\x[a-fA-F0-9]{0,2}|\\u[0-9a-fA-F]{4})', latin_unicode_escape_replace, contents)
-        except JSON5DecodeError as exc:
-            self.errors.append(JSON5DecodeError(exc.args[0], p._slice[0]))
-        try:
-            contents = re.sub(r'\\(0\d|.)', replace_escape_literals, contents)
-        except JSON5DecodeError as exc:
-            self.errors.append(JSON5DecodeError(exc.args[0], p._slice[0]))
+        contents = decode_string_literal(raw_value, p._slice[0], self.errors)
         return SingleQuotedString(contents, raw_value=raw_value, tok=p._slice[0])
 
     @_('double_quoted_string', 'single_quoted_string')
@@ -619,19 +586,13 @@ class JSONParser(Parser):  # type: ignore[misc]
                 return next(self.tokens)  # type: ignore
             except StopIteration:
                 # EOF
-                class tok:
-                    type = '$end'
-                    value = None
-                    lineno = None
-                    index = None
-                    end = None
-
-                return JSON5Token(tok(), None)  # type: ignore[arg-type]
+                return JSON5Token('$end', None, None, None, None, None)  # type: ignore[arg-type]
         elif self.last_token:
             doc = self.last_token.doc
             pos = len(doc)
-            lineno = doc.count('\n', 0, pos) + 1
-            colno = pos - doc.rfind('\n', 0, pos)
+            line_index = self.last_token.line_index or LineIndex(doc)
+            lineno, colno = line_index.offset_to_position(pos)
+            colno += 1
             message = f'Expecting value. Unexpected EOF at: ' f'line {lineno} column {colno} (char {pos})'
             if self.expecting:
                 expected = self.expecting[-1]
@@ -680,7 +641,43 @@ def parse_tokens(raw_tokens: typing.Iterable[JSON5Token]) -> JSONText:
     return parser.parse(raw_tokens)
 
 
-def parse_source(text: str) -> JSONText:
+def parse_source(text: str, positions: T_Positions = 'tokens') -> JSONText:
+    """
+    Parse ``text`` to a model. ``positions`` determines what the nodes keep of the tokens they were parsed from: the
+    tokens themselves (``'tokens'``, the default), only their positions (``'spans'``) or nothing (``None``).
+    Only with ``'tokens'`` does the model keep a reference to ``text``.
+    """
     tokens = tokenize(text)
     model = parse_tokens(tokens)
+    detach_tokens(model, positions)
     return model
+
+
+def write_parse_tables(path: str | None = None) -> None:
+    """
+    (Re)generate ``json5/_parsetab.py`` from the grammar of ``JSONParser``. This must be run after changing the grammar,
+    in a fresh interpreter: ``python -c "from json5.parser import write_parse_tables; write_parse_tables()"``
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), '_parsetab.py')
+    grammar = JSONParser._grammar
+    lrtable = JSONParser._lrtable
+    lines = [
+        '# This file is generated by json5.parser.write_parse_tables. Do not edit it by hand.',
+        '# fmt: off',
+        'from __future__ import annotations',
+        '',
+        f'GRAMMAR_HASH = {grammar_hash(grammar)!r}',
+        '',
+        'lr_action: dict[int, dict[str, int]] = {',
+        *(f'    {state!r}: {actions!r},' for state, actions in sorted(lrtable.lr_action.items())),
+        '}',
+        '',
+        'lr_goto: dict[int, dict[str, int]] = {',
+        *(f'    {state!r}: {gotos!r},' for state, gotos in sorted(lrtable.lr_goto.items())),
+        '}',
+        '',
+        f'defaulted_states: dict[int, int] = {dict(sorted(lrtable.defaulted_states.items()))!r}',
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
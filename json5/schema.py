@@ -0,0 +1,565 @@
+"""
+Decoding JSON5 straight into instances of annotated types: dataclasses, ``typing.NamedTuple`` and ``typing.TypedDict``
+classes, and the lists, tuples, dicts, unions and scalars they are made of.
+
+The first time a type is used, a plan for building its values is compiled from its annotations and cached. The decoder
+then follows the plan while it reads the tokens, so instances are built in a single pass, without building the plain
+dicts and lists first.
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import types
+import typing
+
+from .decoder import _NUMBER_TYPES
+from .decoder import Decoder
+from .loader import Environment
+from .utils import JSON5DecodeError
+
+if typing.TYPE_CHECKING:
+    from .tokenizer import JSON5Token
+
+__all__ = ['TypedDecoder']
+
+T_UnknownFields = typing.Literal['ignore', 'reject']
+
+_NoneType = type(None)
+_UnionType = getattr(types, 'UnionType', None)  # the type of ``X | Y``, from Python 3.10
+
+# The first tokens of numbers, including the constants Infinity and NaN
+_NUMBER_TOKEN_TYPES = _NUMBER_TYPES | {'MINUS', 'PLUS'}
+
+# The key stored for the values of unknown fields, which are decoded but then dropped
+_SKIP = object()
+
+
+def _describe(value: typing.Any) -> str:
+    if value is None:
+        return 'null'
+    elif isinstance(value, bool):
+        return 'a boolean'
+    elif isinstance(value, (int, float)):
+        return 'a number'
+    elif isinstance(value, str):
+        return 'a string'
+    return type(value).__name__
+
+
+def _type_name(tp: typing.Any) -> str:
+    if isinstance(tp, type) and not typing.get_args(tp):
+        return tp.__name__
+    return repr(tp).replace('typing.', '')
+
+
+class _Plan:
+    """
+    How to build the values of one type while decoding. Scalars (strings, numbers, booleans and null) are passed to
+    ``check``; plans for types that can be built from objects or arrays accept them and override the methods for them.
+    """
+
+    __slots__ = ('name',)
+
+    accepts_object: bool = False
+    accepts_array: bool = False
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def mismatch(self, found: str, tok: JSON5Token | None) -> JSON5DecodeError:
+        return JSON5DecodeError(f'Expected {self.name}, not {found}', tok)
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        """
+        The value to use for the scalar ``value``
+        """
+        raise self.mismatch(_describe(value), tok)
+
+    def check_hooked(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        """
+        The value to use for a number that ``parse_int``, ``parse_float`` or ``parse_constant`` made into ``value``
+        """
+        return self.check(value, tok)
+
+    def field(self, key: typing.Any) -> tuple[typing.Any, _Plan] | None:
+        """
+        The key to keep the value of ``key`` under, along with the plan for the value. None for unknown fields.
+        """
+        raise NotImplementedError
+
+    def build_object(self, decoder: Decoder, d: dict[typing.Any, typing.Any], tok: JSON5Token | None) -> typing.Any:
+        raise NotImplementedError
+
+    def item(self, index: int, tok: JSON5Token | None) -> _Plan:
+        """
+        The plan for the item at ``index`` of an array
+        """
+        raise NotImplementedError
+
+    def build_array(self, decoder: Decoder, values: list[typing.Any], tok: JSON5Token | None) -> typing.Any:
+        return values
+
+
+class _AnyPlan(_Plan):
+    """
+    Values are decoded as they are without ``into``
+    """
+
+    __slots__ = ()
+
+    accepts_object = True
+    accepts_array = True
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        return value
+
+    def field(self, key: typing.Any) -> tuple[typing.Any, _Plan]:
+        return key, self
+
+    def build_object(self, decoder: Decoder, d: dict[typing.Any, typing.Any], tok: JSON5Token | None) -> typing.Any:
+        return decoder._finish_object(d)
+
+    def item(self, index: int, tok: JSON5Token | None) -> _Plan:
+        return self
+
+    def build_array(self, decoder: Decoder, values: list[typing.Any], tok: JSON5Token | None) -> typing.Any:
+        return decoder._finish_array(values)
+
+
+_ANY = _AnyPlan('Any')
+
+
+class _InstancePlan(_Plan):
+    __slots__ = ('cls',)
+
+    def __init__(self, cls: type):
+        super().__init__('null' if cls is _NoneType else cls.__name__)
+        self.cls = cls
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        if isinstance(value, self.cls):
+            return value
+        raise self.mismatch(_describe(value), tok)
+
+
+class _IntPlan(_Plan):
+    __slots__ = ()
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        raise self.mismatch(_describe(value), tok)
+
+    def check_hooked(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        # the hook decides what numbers become
+        return value
+
+
+class _FloatPlan(_Plan):
+    __slots__ = ()
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        if type(value) is float:
+            return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        raise self.mismatch(_describe(value), tok)
+
+    def check_hooked(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        return value
+
+
+class _LiteralPlan(_Plan):
+    __slots__ = ('values',)
+
+    def __init__(self, name: str, values: tuple[typing.Any, ...]):
+        super().__init__(name)
+        self.values = values
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        for allowed in self.values:
+            # 1 == True, but they are different literals
+            if type(allowed) is type(value) and allowed == value:
+                return allowed
+        raise self.mismatch(repr(value), tok)
+
+
+class _EnumPlan(_Plan):
+    __slots__ = ('cls',)
+
+    def __init__(self, cls: type[enum.Enum]):
+        super().__init__(cls.__name__)
+        self.cls = cls
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        try:
+            return self.cls(value)
+        except ValueError:
+            raise self.mismatch(repr(value), tok) from None
+
+
+class _UnionPlan(_Plan):
+    """
+    Scalars are checked against each of the options in turn. Objects and arrays can only be built by one of them.
+    """
+
+    __slots__ = ('options', 'object_option', 'array_option', 'accepts_object', 'accepts_array')
+
+    def __init__(self, name: str, options: list[_Plan]):
+        super().__init__(name)
+        self.options = options
+        object_options = [option for option in options if option.accepts_object]
+        array_options = [option for option in options if option.accepts_array]
+        if len(object_options) > 1 or len(array_options) > 1:
+            raise TypeError(f'{name} is ambiguous: only one of its options may be decoded from objects (or arrays)')
+        self.object_option: _Plan | None = object_options[0] if object_options else None
+        self.array_option: _Plan | None = array_options[0] if array_options else None
+        self.accepts_object = self.object_option is not None
+        self.accepts_array = self.array_option is not None
+
+    def check(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        for option in self.options:
+            try:
+                return option.check(value, tok)
+            except JSON5DecodeError:
+                pass
+        raise self.mismatch(_describe(value), tok)
+
+    def check_hooked(self, value: typing.Any, tok: JSON5Token | None) -> typing.Any:
+        for option in self.options:
+            try:
+                return option.check_hooked(value, tok)
+            except JSON5DecodeError:
+                pass
+        raise self.mismatch(_describe(value), tok)
+
+    def field(self, key: typing.Any) -> tuple[typing.Any, _Plan] | None:
+        assert self.object_option is not None
+        return self.object_option.field(key)
+
+    def build_object(self, decoder: Decoder, d: dict[typing.Any, typing.Any], tok: JSON5Token | None) -> typing.Any:
+        assert self.object_option is not None
+        return self.object_option.build_object(decoder, d, tok)
+
+    def item(self, index: int, tok: JSON5Token | None) -> _Plan:
+        assert self.array_option is not None
+        return self.array_option.item(index, tok)
+
+    def build_array(self, decoder: Decoder, values: list[typing.Any], tok: JSON5Token | None) -> typing.Any:
+        assert self.array_option is not None
+        return self.array_option.build_array(decoder, values, tok)
+
+
+class _ListPlan(_Plan):
+    """
+    Lists, and tuples of any length
+    """
+
+    __slots__ = ('item_plan', 'make_tuple')
+
+    accepts_array = True
+
+    def __init__(self, name: str, item_plan: _Plan, make_tuple: bool):
+        super().__init__(name)
+        self.item_plan = item_plan
+        self.make_tuple = make_tuple
+
+    def item(self, index: int, tok: JSON5Token | None) -> _Plan:
+        return self.item_plan
+
+    def build_array(self, decoder: Decoder, values: list[typing.Any], tok: JSON5Token | None) -> typing.Any:
+        return tuple(values) if self.make_tuple else values
+
+
+class _TuplePlan(_Plan):
+    """
+    Tuples with a fixed number of items, each of its own type
+    """
+
+    __slots__ = ('item_plans',)
+
+    accepts_array = True
+
+    def __init__(self, name: str, item_plans: list[_Plan]):
+        super().__init__(name)
+        self.item_plans = item_plans
+
+    def item(self, index: int, tok: JSON5Token | None) -> _Plan:
+        if index >= len(self.item_plans):
+            raise JSON5DecodeError(f'Expected {self.name}, not more than {len(self.item_plans)} values', tok)
+        return self.item_plans[index]
+
+    def build_array(self, decoder: Decoder, values: list[typing.Any], tok: JSON5Token | None) -> typing.Any:
+        if len(values) != len(self.item_plans):
+            raise JSON5DecodeError(f'Expected {self.name}, not {len(values)} values', tok)
+        return tuple(values)
+
+
+class _DictPlan(_Plan):
+    __slots__ = ('value_plan',)
+
+    accepts_object = True
+
+    def __init__(self, name: str, value_plan: _Plan):
+        super().__init__(name)
+        self.value_plan = value_plan
+
+    def field(self, key: typing.Any) -> tuple[typing.Any, _Plan]:
+        return key, self.value_plan
+
+    def build_object(self, decoder: Decoder, d: dict[typing.Any, typing.Any], tok: JSON5Token | None) -> typing.Any:
+        return d
+
+
+class _StructPlan(_Plan):
+    """
+    Dataclasses, named tuples and typed dicts, which are built from objects with their field names as keys
+    """
+
+    __slots__ = ('cls', 'fields', 'required', 'is_typeddict')
+
+    accepts_object = True
+
+    def __init__(self, cls: type, is_typeddict: bool):
+        super().__init__(cls.__name__)
+        self.cls = cls
+        self.is_typeddict = is_typeddict
+        # Filled in by _struct_plan once this plan is among the plans being compiled, so types can refer to themselves
+        self.fields: dict[str, tuple[str, _Plan]] = {}
+        self.required: tuple[str, ...] = ()
+
+    def field(self, key: typing.Any) -> tuple[typing.Any, _Plan] | None:
+        return self.fields.get(key)
+
+    def build_object(self, decoder: Decoder, d: dict[typing.Any, typing.Any], tok: JSON5Token | None) -> typing.Any:
+        if len(d) < len(self.fields):
+            missing = [name for name in self.required if name not in d]
+            if missing:
+                raise JSON5DecodeError(f'Missing {", ".join(map(repr, missing))} for {self.name}', tok)
+        if self.is_typeddict:
+            return d
+        try:
+            return self.cls(**d)
+        except (TypeError, ValueError) as exc:
+            # such as a __post_init__ that rejects the values
+            raise JSON5DecodeError(f'Could not make {self.name}: {exc}', tok) from exc
+
+
+_PLANS: dict[typing.Any, _Plan] = {}
+
+
+def _plan_for(tp: typing.Any) -> _Plan:
+    """
+    The (cached) plan for building values of type ``tp``
+    """
+    plan = _PLANS.get(tp)
+    if plan is None:
+        # The plans are only cached once all of them are complete, so that other threads never use a plan for a class
+        # whose fields haven't been compiled yet
+        compiling: dict[typing.Any, _Plan] = {}
+        plan = _compiled_plan(tp, compiling)
+        _PLANS.update(compiling)
+    return plan
+
+
+def _compiled_plan(tp: typing.Any, compiling: dict[typing.Any, _Plan]) -> _Plan:
+    """
+    The plan for ``tp``, from the cache or from the plans being compiled (which a class refers to if it contains
+    itself), or else compiled and added to ``compiling``
+    """
+    plan = _PLANS.get(tp)
+    if plan is None:
+        plan = compiling.get(tp)
+        if plan is None:
+            plan = compiling[tp] = _compile(tp, compiling)
+    return plan
+
+
+def _compile(tp: typing.Any, compiling: dict[typing.Any, _Plan]) -> _Plan:
+    if tp is typing.Any or tp is object:
+        return _ANY
+    if tp is None or tp is _NoneType:
+        return _InstancePlan(_NoneType)
+    name = _type_name(tp)
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union or (_UnionType is not None and origin is _UnionType):
+        return _UnionPlan(name, [_compiled_plan(arg, compiling) for arg in args])
+    elif origin is typing.Literal:
+        return _LiteralPlan(name, args)
+    elif tp is list or origin is list:
+        return _ListPlan(name, _compiled_plan(args[0], compiling) if args else _ANY, make_tuple=False)
+    elif tp is tuple or origin is tuple:
+        if not args or (len(args) == 2 and args[1] is Ellipsis):
+            return _ListPlan(name, _compiled_plan(args[0], compiling) if args else _ANY, make_tuple=True)
+        return _TuplePlan(name, [_compiled_plan(arg, compiling) for arg in args])
+    elif tp is dict or origin is dict:
+        if args and args[0] not in (str, typing.Any):
+            raise TypeError(f'Keys of JSON5 objects are strings, so {name} is not supported')
+        return _DictPlan(name, _compiled_plan(args[1], compiling) if args else _ANY)
+    elif not isinstance(tp, type):
+        raise TypeError(f'Cannot decode into {tp!r}')
+    elif dataclasses.is_dataclass(tp):
+        fields = [field for field in dataclasses.fields(tp) if field.init]
+        required = [
+            field.name
+            for field in fields
+            if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+        ]
+        return _struct_plan(tp, [field.name for field in fields], required, False, compiling)
+    elif issubclass(tp, tuple) and hasattr(tp, '_fields'):
+        field_names = list(tp._fields)
+        defaults = tp._field_defaults  # type: ignore[attr-defined]
+        return _struct_plan(tp, field_names, [name for name in field_names if name not in defaults], False, compiling)
+    elif issubclass(tp, dict) and hasattr(tp, '__total__'):
+        field_names = list(tp.__annotations__)
+        required_keys = getattr(tp, '__required_keys__', field_names if tp.__total__ else ())
+        return _struct_plan(tp, field_names, [name for name in field_names if name in required_keys], True, compiling)
+    elif issubclass(tp, enum.Enum):
+        return _EnumPlan(tp)
+    elif tp is int:
+        return _IntPlan(name)
+    elif tp is float:
+        return _FloatPlan(name)
+    return _InstancePlan(tp)
+
+
+def _struct_plan(
+    cls: type, field_names: list[str], required: list[str], is_typeddict: bool, compiling: dict[typing.Any, _Plan]
+) -> _StructPlan:
+    plan = compiling[cls] = _StructPlan(cls, is_typeddict)
+    hints = typing.get_type_hints(cls)
+    plan.fields = {name: (name, _compiled_plan(hints.get(name, typing.Any), compiling)) for name in field_names}
+    plan.required = tuple(required)
+    return plan
+
+
+class TypedDecoder(Decoder):
+    """
+    A ``Decoder`` that builds values of the type ``into`` rather than plain dicts and lists. ``into`` may be a
+    dataclass, ``typing.NamedTuple`` or ``typing.TypedDict`` class, or any combination of ``list``, ``tuple``,
+    ``dict`` (with ``str`` keys), ``typing.Union``/``Optional``, ``typing.Literal``, enums, ``typing.Any`` and scalar
+    types. Fields are decoded according to their annotations. Values that don't match their type raise a
+    ``JSON5DecodeError`` pointing at them.
+
+    Fields of an object that aren't fields of its class are skipped, or rejected with ``unknown_fields='reject'``.
+
+    The hooks and ``numeric_arrays`` only apply to values typed ``Any``, except for ``parse_int``, ``parse_float`` and
+    ``parse_constant``, which apply to all numbers. ``int`` and ``float`` fields take whatever those return (such as a
+    ``Decimal`` from ``parse_float=Decimal``). The ``json`` module is never used, since it can only produce dicts and
+    lists.
+    """
+
+    def __init__(
+        self,
+        into: typing.Any,
+        unknown_fields: T_UnknownFields = 'ignore',
+        env: Environment | None = None,
+        **env_kwargs: typing.Any,
+    ):
+        if unknown_fields not in ('ignore', 'reject'):
+            raise ValueError(f"unknown_fields must be 'ignore' or 'reject', not {unknown_fields!r}")
+        super().__init__(env, try_json=False, **env_kwargs)
+        self.into = into
+        self.unknown_fields: T_UnknownFields = unknown_fields
+        self._plan = _plan_for(into)
+
+    def _field(self, plan: _Plan, key: typing.Any, tok: JSON5Token | None) -> tuple[typing.Any, _Plan]:
+        field = plan.field(key)
+        if field is not None:
+            return field
+        if self.unknown_fields == 'reject':
+            raise JSON5DecodeError(f'Unknown field {str(key)!r} for {plan.name}', tok)
+        return _SKIP, _ANY
+
+    def _check_scalar(self, plan: _Plan, tok: JSON5Token | None) -> typing.Any:
+        value = self._scalar()
+        if tok is not None and tok.type in _NUMBER_TOKEN_TYPES and type(value) is not int and type(value) is not float:
+            # Without hooks, numbers are always ints or floats
+            return plan.check_hooked(value, tok)
+        return plan.check(value, tok)
+
+    def _value(self, depth: int = 0) -> typing.Any:
+        """
+        Decode the value starting at the current token following the plan for ``into``, with an explicit stack of the
+        containers still open like ``Decoder._value``
+        """
+        plan = self._plan
+        tok = self._tok
+        if tok is None or (tok.type != 'LBRACE' and tok.type != 'LBRACKET'):
+            return self._check_scalar(plan, tok)
+        max_depth = self.env.max_depth
+        # the containers enclosing the innermost open one, each with its plan and the key being decoded
+        stack: list[tuple[typing.Any, _Plan | None, typing.Any]] = []
+        container: typing.Any = None
+        container_plan: _Plan | None = None
+        key: typing.Any = None
+        while True:
+            tok = self._tok
+            if tok is not None and (tok.type == 'LBRACE' or tok.type == 'LBRACKET'):
+                if max_depth is not None and depth + len(stack) >= max_depth:
+                    raise JSON5DecodeError(f'Maximum nesting depth of {max_depth} exceeded', tok)
+                is_object = tok.type == 'LBRACE'
+                if not (plan.accepts_object if is_object else plan.accepts_array):
+                    raise plan.mismatch('an object' if is_object else 'an array', tok)
+                self._advance()
+                self._skip_wsc()
+                if is_object:
+                    if self._tok is not None and self._tok.type != 'RBRACE':
+                        stack.append((container, container_plan, key))
+                        container = {}
+                        container_plan = plan
+                        key_tok = self._tok
+                        key, plan = self._field(container_plan, self._key(), key_tok)
+                        self._expect('COLON')
+                        self._skip_wsc()
+                        continue
+                    end_tok = self._tok
+                    self._expect('RBRACE')
+                    value = plan.build_object(self, {}, end_tok)
+                else:
+                    if self._tok is not None and self._tok.type != 'RBRACKET':
+                        stack.append((container, container_plan, key))
+                        container = []
+                        container_plan = plan
+                        key = None
+                        plan = plan.item(0, self._tok)
+                        continue
+                    end_tok = self._tok
+                    self._expect('RBRACKET')
+                    value = plan.build_array(self, [], end_tok)
+            else:
+                value = self._check_scalar(plan, tok)
+            # Add the value to its container, then move on to the container's next value or close it
+            while stack:
+                assert container_plan is not None
+                in_object = type(container) is dict
+                if not in_object:
+                    container.append(value)
+                elif key is not _SKIP:
+                    container[key] = value
+                self._skip_wsc()
+                tok = self._tok
+                if tok is not None and tok.type == 'COMMA':
+                    self._advance()
+                    self._skip_wsc()
+                    tok = self._tok
+                    if tok is not None and tok.type != ('RBRACE' if in_object else 'RBRACKET'):
+                        if in_object:
+                            key, plan = self._field(container_plan, self._key(), tok)
+                            self._expect('COLON')
+                            self._skip_wsc()
+                        else:
+                            plan = container_plan.item(len(container), tok)
+                        break
+                end_tok = self._tok
+                if in_object:
+                    self._expect('RBRACE')
+                    value = container_plan.build_object(self, container, end_tok)
+                else:
+                    self._expect('RBRACKET')
+                    value = container_plan.build_array(self, container, end_tok)
+                container, container_plan, key = stack.pop()
+            else:
+                return value
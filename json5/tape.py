@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import typing
+from array import array
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+from .decoder import _identifier_value
+from .decoder import _parse_source
+from .decoder import _string_value
+from .decoder import _walk_tokens
+from .tokenizer import tokenize
+from .utils import JSON5DecodeError
+
+if typing.TYPE_CHECKING:
+    from .model import Value
+
+__all__ = ['Tape', 'TapeCursor', 'parse_tape', 'LazyObject', 'LazyArray', 'loads_lazy']
+
+# Kinds of tape entries
+OBJECT = 1
+ARRAY = 2
+KEY = 3
+STRING = 4
+NUMBER = 5
+TRUE = 6
+FALSE = 7
+NULL = 8
+
+KIND_NAMES = {
+    OBJECT: 'object',
+    ARRAY: 'array',
+    KEY: 'key',
+    STRING: 'string',
+    NUMBER: 'number',
+    TRUE: 'boolean',
+    FALSE: 'boolean',
+    NULL: 'null',
+}
+
+_LITERAL_KINDS = {'TRUE': TRUE, 'FALSE': FALSE, 'NULL': NULL}
+
+
+class Tape:
+    """
+    A parsed JSON5 document, stored as a "tape" of entries in a few flat arrays instead of a graph of nodes.
+
+    The entries are in document order. Containers are followed by their contents; the entries of an object alternate
+    between a key and the (first entry of the) value for that key. For every entry ``i``:
+
+    * ``kinds[i]`` is the kind of entry (``OBJECT``, ``ARRAY``, ``KEY``, ``STRING``, ``NUMBER``, ``TRUE``, ``FALSE``
+      or ``NULL``)
+    * ``starts[i]`` and ``ends[i]`` are the offsets in ``text`` of the entry's source (for containers, from the
+      opening to the closing brace or bracket)
+    * ``skips[i]`` is the index of the entry following the entry and everything inside it, so a whole subtree can be
+      skipped in one step
+    * ``atom_indexes[i]`` is the index in ``atoms`` of the (decoded) value of keys, strings and numbers, or -1
+
+    Whitespace and comments are not represented.
+    """
+
+    __slots__ = ('text', 'kinds', 'starts', 'ends', 'skips', 'atom_indexes', 'atoms')
+
+    def __init__(self, text: str):
+        self.text: str = text
+        # Offsets and indexes all fit in 32 bits unless the text is huge
+        typecode = 'i' if len(text) < 2**31 else 'q'
+        self.kinds: array[int] = array('B')
+        self.starts: array[int] = array(typecode)
+        self.ends: array[int] = array(typecode)
+        self.skips: array[int] = array(typecode)
+        self.atom_indexes: array[int] = array(typecode)
+        self.atoms: list[typing.Any] = []
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def root(self) -> TapeCursor:
+        return TapeCursor(self, 0)
+
+    def to_python(self) -> typing.Any:
+        return self.root.to_python()
+
+
+class TapeCursor:
+    """
+    Points at one value on a ``Tape``. Cursors are cheap to create and can be used to navigate the document and to
+    convert any part of it to Python objects or to a model.
+    """
+
+    __slots__ = ('tape', 'index')
+
+    def __init__(self, tape: Tape, index: int):
+        self.tape: Tape = tape
+        self.index: int = index
+
+    def __repr__(self) -> str:
+        return f'TapeCursor(kind={self.kind!r}, index={self.index})'
+
+    @property
+    def kind(self) -> str:
+        return KIND_NAMES[self.tape.kinds[self.index]]
+
+    @property
+    def span(self) -> tuple[int, int]:
+        return self.tape.starts[self.index], self.tape.ends[self.index]
+
+    @property
+    def source(self) -> str:
+        start, end = self.span
+        return self.tape.text[start:end]
+
+    def _children(self) -> typing.Iterator[int]:
+        """
+        The indexes of the entries directly inside this container (keys and values alike, for objects)
+        """
+        tape = self.tape
+        if tape.kinds[self.index] not in (OBJECT, ARRAY):
+            raise TypeError(f'{self.kind} values have no children')
+        skips = tape.skips
+        end = skips[self.index]
+        i = self.index + 1
+        while i < end:
+            yield i
+            i = skips[i]
+
+    def keys(self) -> typing.Iterator[str]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> typing.Iterator[TapeCursor]:
+        if self.tape.kinds[self.index] == OBJECT:
+            for _, value in self.items():
+                yield value
+        else:
+            for i in self._children():
+                yield TapeCursor(self.tape, i)
+
+    def items(self) -> typing.Iterator[tuple[str, TapeCursor]]:
+        tape = self.tape
+        if tape.kinds[self.index] != OBJECT:
+            raise TypeError(f'{self.kind} values have no keys')
+        children = self._children()
+        for key_index in children:
+            yield tape.atoms[tape.atom_indexes[key_index]], TapeCursor(tape, next(children))
+
+    def __len__(self) -> int:
+        count = sum(1 for _ in self._children())
+        return count // 2 if self.tape.kinds[self.index] == OBJECT else count
+
+    def __getitem__(self, item: str | int) -> TapeCursor:
+        """
+        Get the cursor of the value for the given key of an object, or at the given index of an array.
+        As in JSON5, the last of duplicate keys wins. Entries before the one asked for are skipped over, not visited.
+        """
+        if self.tape.kinds[self.index] == OBJECT:
+            found: TapeCursor | None = None
+            for key, value in self.items():
+                if key == item:
+                    found = value
+            if found is None:
+                raise KeyError(item)
+            return found
+        if not isinstance(item, int):
+            raise TypeError(f'{self.kind} indices must be integers, not {type(item).__name__}')
+        if item < 0:
+            children = list(self._children())
+            if -item > len(children):
+                raise IndexError(item)
+            return TapeCursor(self.tape, children[item])
+        for position, i in enumerate(self._children()):
+            if position == item:
+                return TapeCursor(self.tape, i)
+        raise IndexError(item)
+
+    def to_python(self) -> typing.Any:
+        """
+        Build the Python object for this value (and everything inside it)
+        """
+        return _to_python(self.tape, self.index)
+
+    def to_model(self) -> Value:
+        """
+        Parse the source of this value to a ``json5.model`` node. Unlike the tape, the model includes the comments and
+        whitespace inside the value. Positions in the model are relative to the start of the value.
+        """
+        from .parser import parse_source
+
+        return parse_source(self.source).value
+
+
+def _to_python(tape: Tape, i: int) -> typing.Any:
+    """
+    The Python object for the entry at ``i``. Entries are visited in order, keeping the objects and arrays still being
+    filled on a stack rather than recursing, so they can be nested to any depth.
+    """
+    kinds = tape.kinds
+    skips = tape.skips
+    atoms = tape.atoms
+    atom_indexes = tape.atom_indexes
+    # the open objects and arrays, the index of the entry after each, and the key of each object's current value
+    containers: list[typing.Any] = []
+    ends: list[int] = []
+    keys: list[typing.Any] = []
+    while True:
+        kind = kinds[i]
+        value: typing.Any
+        if kind == OBJECT or kind == ARRAY:
+            end = skips[i]
+            value = {} if kind == OBJECT else []
+            i += 1
+            if i < end:
+                containers.append(value)
+                ends.append(end)
+                if kind == OBJECT:
+                    keys.append(atoms[atom_indexes[i]])
+                    i += 1
+                else:
+                    keys.append(None)
+                continue
+        elif kind == TRUE:
+            value = True
+            i += 1
+        elif kind == FALSE:
+            value = False
+            i += 1
+        elif kind == NULL:
+            value = None
+            i += 1
+        else:
+            value = atoms[atom_indexes[i]]
+            i += 1
+        while containers:
+            container = containers[-1]
+            if type(container) is list:
+                container.append(value)
+            else:
+                container[keys[-1]] = value
+            if i < ends[-1]:
+                if type(container) is dict:
+                    keys[-1] = atoms[atom_indexes[i]]
+                    i += 1
+                break
+            containers.pop()
+            ends.pop()
+            keys.pop()
+            value = container
+        else:
+            return value
+
+
+_NOT_DECODED = object()
+
+
+class LazyObject(Mapping):  # type: ignore[type-arg]
+    """
+    A read-only mapping for an object on a ``Tape``. The positions of its values are only looked up on first use, and
+    each value is only decoded when it is first accessed (and then kept), so nested objects and arrays that are never
+    accessed are never built.
+    """
+
+    __slots__ = ('_tape', '_index', '_positions', '_cache')
+
+    def __init__(self, tape: Tape, index: int):
+        self._tape: Tape = tape
+        self._index: int = index
+        self._positions: dict[typing.Any, int] | None = None
+        self._cache: dict[typing.Any, typing.Any] = {}
+
+    def _get_positions(self) -> dict[typing.Any, int]:
+        """
+        Map each key to the index of its value on the tape. As with ``loads``, the last of duplicate keys wins
+        """
+        if self._positions is None:
+            tape = self._tape
+            atoms = tape.atoms
+            atom_indexes = tape.atom_indexes
+            skips = tape.skips
+            positions = {}
+            end = skips[self._index]
+            i = self._index + 1
+            while i < end:
+                positions[atoms[atom_indexes[i]]] = i + 1
+                i = skips[i + 1]
+            self._positions = positions
+        return self._positions
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        value = self._cache.get(key, _NOT_DECODED)
+        if value is _NOT_DECODED:
+            value = self._cache[key] = _lazy_value(self._tape, self._get_positions()[key])
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._get_positions()
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(self._get_positions())
+
+    def __len__(self) -> int:
+        return len(self._get_positions())
+
+    def __repr__(self) -> str:
+        return f'LazyObject({self.to_python()!r})'
+
+    def to_python(self) -> dict[typing.Any, typing.Any]:
+        """
+        Decode the whole object to a ``dict``, as ``loads`` would have
+        """
+        return TapeCursor(self._tape, self._index).to_python()  # type: ignore[no-any-return]
+
+
+class LazyArray(Sequence):  # type: ignore[type-arg]
+    """
+    A read-only sequence for an array on a ``Tape``. Like ``LazyObject``, each element is only decoded when it is first
+    accessed.
+    """
+
+    __slots__ = ('_tape', '_index', '_positions', '_cache')
+
+    def __init__(self, tape: Tape, index: int):
+        self._tape: Tape = tape
+        self._index: int = index
+        self._positions: list[int] | None = None
+        self._cache: list[typing.Any] | None = None
+
+    def _get_positions(self) -> list[int]:
+        if self._positions is None:
+            self._positions = list(TapeCursor(self._tape, self._index)._children())
+            self._cache = [_NOT_DECODED] * len(self._positions)
+        return self._positions
+
+    def __getitem__(self, item: typing.Any) -> typing.Any:
+        positions = self._get_positions()
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(positions)))]
+        cache = typing.cast('list[typing.Any]', self._cache)
+        value = cache[item]
+        if value is _NOT_DECODED:
+            value = cache[item] = _lazy_value(self._tape, positions[item])
+        return value
+
+    def __len__(self) -> int:
+        return len(self._get_positions())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyArray):
+            other = list(other)
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return f'LazyArray({self.to_python()!r})'
+
+    def to_python(self) -> list[typing.Any]:
+        """
+        Decode the whole array to a ``list``, as ``loads`` would have
+        """
+        return TapeCursor(self._tape, self._index).to_python()  # type: ignore[no-any-return]
+
+
+def _lazy_value(tape: Tape, i: int) -> typing.Any:
+    kind = tape.kinds[i]
+    if kind == OBJECT:
+        return LazyObject(tape, i)
+    elif kind == ARRAY:
+        return LazyArray(tape, i)
+    return _to_python(tape, i)
+
+
+def loads_lazy(text: str) -> typing.Any:
+    """
+    Parse JSON5 text, returning a ``LazyObject`` or ``LazyArray`` (or a plain value, for documents that are not objects
+    or arrays) whose contents are decoded as they are accessed. The whole document is still checked for errors upfront.
+    """
+    return _lazy_value(parse_tape(text), 0)
+
+
+def parse_tape(text: str) -> Tape:
+    """
+    Parse JSON5 text into a ``Tape``. This is much more compact than a model and quicker to build, since only a few
+    array entries are added for each value, instead of creating node objects.
+    """
+    try:
+        return _build_tape(text)
+    except JSON5DecodeError:
+        _parse_source(text)
+        raise
+
+
+def _build_tape(text: str) -> Tape:
+    tape = Tape(text)
+    kinds = tape.kinds
+    starts = tape.starts
+    ends = tape.ends
+    skips = tape.skips
+    atom_indexes = tape.atom_indexes
+    atoms = tape.atoms
+    key_atoms: dict[str, int] = {}  # keys tend to repeat, so each distinct key is only decoded and stored once
+    containers: list[int] = []  # the entries of the containers we're in
+    for event, tok, value, end in _walk_tokens(tokenize(text)):
+        if event == 'end_map' or event == 'end_array':
+            i = containers.pop()
+            ends[i] = tok.end
+            skips[i] = len(kinds)
+            continue
+        if event == 'start_map' or event == 'start_array':
+            containers.append(len(kinds))
+            kinds.append(OBJECT if event == 'start_map' else ARRAY)
+            end = -1  # filled in when the container is closed
+            skips.append(-1)
+            atom_index = -1
+        else:
+            if event == 'map_key':
+                # Keys are shared by their source text: a quoted key and an identifier are different (a str and a
+                # JsonIdentifier), even though they compare equal
+                atom_index = key_atoms.get(tok.value, -1)
+                if atom_index == -1:
+                    atom_index = key_atoms[tok.value] = len(atoms)
+                    atoms.append(_identifier_value(tok) if tok.type == 'NAME' else _string_value(tok))
+                kinds.append(KEY)
+            elif event == 'string' or event == 'number':
+                atom_index = len(atoms)
+                atoms.append(value)
+                kinds.append(STRING if event == 'string' else NUMBER)
+            else:
+                atom_index = -1
+                kinds.append(_LITERAL_KINDS[tok.type])  # type: ignore[index]
+            skips.append(len(kinds))
+        starts.append(tok.index)
+        ends.append(len(text) if end is None else end)
+        atom_indexes.append(atom_index)
+    return tape
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
+import re
 import typing
+from bisect import bisect_right
 from typing import Generator
 from typing import NoReturn
 
-import regex as re
-from sly import Lexer  # type: ignore
-from sly.lex import Token  # type: ignore
+if typing.TYPE_CHECKING:
+    from mmap import mmap
+
+import regex
 
 from .utils import JSON5DecodeError
 
@@ -15,22 +18,77 @@ logger = logging.getLogger(__name__)
 # logger.addHandler(logging.StreamHandler(stream=sys.stderr))
 # logger.setLevel(level=logging.DEBUG)
 
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class LineIndex:
+    '''
+    Converts between offsets in a document and (line, column) positions in O(log n), using a table of the offsets at
+    which each line starts. The table is built the first time it is needed and shared by all tokens of the document.
+
+    Lines are numbered from 1 and columns from 0, like the ``lineno`` and ``colno`` of tokens.
+    '''
+
+    __slots__ = ('doc', '_line_starts')
 
-class JSON5Token(Token):  # type: ignore[misc]
+    def __init__(self, doc: str):
+        self.doc: str = doc
+        self._line_starts: list[int] | None = None
+
+    @property
+    def line_starts(self) -> list[int]:
+        if self._line_starts is None:
+            self._line_starts = [0]
+            self._line_starts.extend(m.end() for m in re.finditer('\n', self.doc))
+        return self._line_starts
+
+    def offset_to_position(self, offset: int) -> tuple[int, int]:
+        if not 0 <= offset <= len(self.doc):
+            raise ValueError(f'offset {offset} is outside of the document (length {len(self.doc)})')
+        line_starts = self.line_starts
+        lineno = bisect_right(line_starts, offset)
+        return lineno, offset - line_starts[lineno - 1]
+
+    def position_to_offset(self, lineno: int, colno: int) -> int:
+        line_starts = self.line_starts
+        if not 1 <= lineno <= len(line_starts):
+            raise ValueError(f'line {lineno} is outside of the document ({len(line_starts)} lines)')
+        line_start = line_starts[lineno - 1]
+        line_end = line_starts[lineno] - 1 if lineno < len(line_starts) else len(self.doc)
+        if not 0 <= colno <= line_end - line_start:
+            raise ValueError(f'column {colno} is outside of line {lineno} (length {line_end - line_start})')
+        return line_start + colno
+
+
+class JSON5Token:
     '''
     Representation of a single token.
     '''
 
-    def __init__(self, tok: Token, doc: str):
-        self.type: str | None = tok.type
-        self.value: str = tok.value
-        self.lineno: int = tok.lineno
-        self.index: int = tok.index
+    __slots__ = ('type', 'value', 'lineno', 'index', 'doc', 'end', 'line_index')
+
+    def __init__(
+        self,
+        type: str | None,
+        value: str,
+        lineno: int,
+        index: int,
+        end: int,
+        doc: str,
+        line_index: LineIndex | None = None,
+    ):
+        self.type: str | None = type
+        self.value: str = value
+        self.lineno: int = lineno
+        self.index: int = index
         self.doc: str = doc
-        self.end: int = tok.end
+        self.end: int = end
+        self.line_index: LineIndex | None = line_index
 
     @property
     def colno(self) -> int:
+        if self.line_index is not None:
+            return self.line_index.offset_to_position(self.index)[1]
         line_start_index = self.doc.rfind('\n', 0, self.index) + 1
         return self.index - line_start_index
 
@@ -42,8 +100,6 @@ class JSON5Token(Token):  # type: ignore[misc]
     def end_lineno(self) -> int:
         return self.lineno + self.value.count('\n')
 
-    __slots__ = ('type', 'value', 'lineno', 'index', 'doc', 'end')
-
     def __str__(self) -> str:
         if self.value:
             return self.value
@@ -54,94 +110,268 @@ class JSON5Token(Token):  # type: ignore[misc]
         return f'JSON5Token(type={self.type!r}, value={self.value!r}, lineno={self.lineno}, index={self.index}, end={self.end})'
 
 
-T_CallArg = typing.TypeVar('T_CallArg')
-_: typing.Callable[[str], typing.Callable[[T_CallArg], T_CallArg]]
-
-
-class JSONLexer(Lexer):  # type: ignore[misc]
-    regex_module = re
-    reflags = re.DOTALL
-    tokens = {
-        LBRACE,
-        RBRACE,
-        LBRACKET,
-        RBRACKET,
-        DOUBLE_QUOTE_STRING,
-        SINGLE_QUOTE_STRING,
-        UNTERMINATED_DOUBLE_QUOTE_STRING,
-        UNTERMINATED_SINGLE_QUOTE_STRING,
-        NAME,
-        COMMA,
-        BLOCK_COMMENT,
-        LINE_COMMENT,
-        WHITESPACE,
-        TRUE,
-        FALSE,
-        NULL,
-        COLON,
-        # Numbers
-        PLUS,
-        MINUS,
-        FLOAT,
-        INTEGER,
-        INFINITY,
-        NAN,
-        EXPONENT,
-        HEXADECIMAL,
-        OCTAL,  # Not allowed, but we capture as a token to raise error later
+# The patterns of lexer rules matching non-ASCII characters, for matching UTF-8 encoded text
+_BYTES_RULES = {
+    'WHITESPACE': rb'(?:[\t\n\x0b\x0c\r ]|\xc2\xa0|\xe2\x80[\xa8\xa9]|\xef\xbb\xbf)+',
+    'NAME': rb'[a-zA-Z_\$\\][a-zA-Z0-9_\$\\]*(?![a-zA-Z0-9_\$\\\x80-\xff])',
+}
+
+
+class JSONLexer:
+    '''
+    Breaks JSON5 text into tokens.
+
+    All token rules are combined into a single regular expression; at each position, the first rule (in the order
+    below) that matches produces the next token.
+    '''
+
+    rules: list[tuple[str, str]] = [
+        ('LBRACE', r'{'),
+        ('RBRACE', r'}'),
+        ('LBRACKET', r'\['),
+        ('RBRACKET', r'\]'),
+        ('COLON', r"\:"),
+        ('COMMA', r"\,"),
+        ('DOUBLE_QUOTE_STRING', r'"(?:[^"\\]|\\.)*"'),
+        ('SINGLE_QUOTE_STRING', r"'(?:[^'\\]|\\.)*'"),
+        ('LINE_COMMENT', r"//[^\n]*"),
+        ('BLOCK_COMMENT', r'/\*(?:.|\n)*?\*/'),
+        ('WHITESPACE', "[\u0009\u000A\u000B\u000C\u000D\u0020\u00A0\u2028\u2029\ufeff]+"),
+        ('MINUS', r'\-'),
+        ('PLUS', r'\+'),
+        ('EXPONENT', r"(?:e|E)(?:\-|\+)?\d+"),
+        ('HEXADECIMAL', r'0(?:x|X)[0-9a-fA-F]+'),
+        ('OCTAL', r'(?:0\d+|0o\d+)'),  # Not allowed, but we capture as a token to raise error later
+        ('FLOAT', r'(?:\d+\.\d*)|(?:\d*\.\d+)'),  # 23.45
+        ('INTEGER', r'\d+'),
+        # Only ASCII names are matched here; see ``unicode_name_re``
+        ('NAME', r'[a-zA-Z_\$\\][a-zA-Z0-9_\$\\]*(?![a-zA-Z0-9_\$\\]|[^\x00-\x7f])'),
+        ('UNTERMINATED_DOUBLE_QUOTE_STRING', r'"(?:[^"\\]|\\.)*'),
+        ('UNTERMINATED_SINGLE_QUOTE_STRING', r"'(?:[^'\\]|\\.)*"),
+    ]
+
+    # NAME tokens with these exact values get a type of their own
+    keywords: dict[str, str] = {
+        'true': 'TRUE',
+        'false': 'FALSE',
+        'null': 'NULL',
+        'Infinity': 'INFINITY',
+        'NaN': 'NAN',
     }
 
+    tokens: set[str] = {name for name, _ in rules} | set(keywords.values())
+
+    # Token types whose value may span multiple lines
+    multiline_tokens: frozenset[str] = frozenset(
+        {
+            'DOUBLE_QUOTE_STRING',
+            'SINGLE_QUOTE_STRING',
+            'BLOCK_COMMENT',
+            'WHITESPACE',
+            'UNTERMINATED_DOUBLE_QUOTE_STRING',
+            'UNTERMINATED_SINGLE_QUOTE_STRING',
+        }
+    )
+
+    master_re = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in rules), re.DOTALL)
+
+    # Names may contain any unicode letter, combining mark or connector punctuation, which the ``re`` module can't
+    # express. Any input ``master_re`` can't match is tried against this before it is considered an error.
+    unicode_name_re = regex.compile(r'[\w_\$\\](?:[\w_\d\$\\\p{Pc}\p{Mn}\p{Mc}\u200C\u200D])*')
+
+    # Single-character tokens that can be recognized without running the regex at all
+    punctuation: dict[str, str] = {
+        '{': 'LBRACE',
+        '}': 'RBRACE',
+        '[': 'LBRACKET',
+        ']': 'RBRACKET',
+        ':': 'COLON',
+        ',': 'COMMA',
+    }
+
+    def __init__(self) -> None:
+        self.lineno: int = 1
+        self.index: int = 0
+
     def tokenize(self, text: str, lineno: int = 1, index: int = 0) -> Generator[JSON5Token, None, None]:
-        for tok in super().tokenize(text, lineno, index):
-            tok = JSON5Token(tok, text)
-            yield tok
-
-    LBRACE = r'{'
-    RBRACE = r'}'
-    LBRACKET = r'\['
-    RBRACKET = r'\]'
-    COLON = r"\:"
-    COMMA = r"\,"
-
-    @_(r'"(?:[^"\\]|\\.)*"')
-    def DOUBLE_QUOTE_STRING(self, tok: JSON5Token) -> JSON5Token:
-        self.lineno += tok.value.count('\n')
-        return tok
-
-    @_(r"'(?:[^'\\]|\\.)*'")
-    def SINGLE_QUOTE_STRING(self, tok: JSON5Token) -> JSON5Token:
-        self.lineno += tok.value.count('\n')
-        return tok
-
-    LINE_COMMENT = r"//[^\n]*"
-
-    @_(r'/\*((.|\n))*?\*/')
-    def BLOCK_COMMENT(self, tok: JSON5Token) -> JSON5Token:
-        self.lineno += tok.value.count('\n')
-        return tok
-
-    @_("[\u0009\u000A\u000B\u000C\u000D\u0020\u00A0\u2028\u2029\ufeff]+")
-    def WHITESPACE(self, tok: JSON5Token) -> JSON5Token:
-        self.lineno += tok.value.count('\n')
-        return tok
-
-    MINUS = r'\-'
-    PLUS = r'\+'
-    EXPONENT = r"(e|E)(\-|\+)?\d+"
-    HEXADECIMAL = r'0(x|X)[0-9a-fA-F]+'
-    OCTAL = r'(0\d+|0o\d+)'
-    FLOAT = r'(\d+\.\d*)|(\d*\.\d+)'  # 23.45
-    INTEGER = r'\d+'
-    NAME = r'[\w_\$\\]([\w_\d\$\\\p{Pc}\p{Mn}\p{Mc}\u200C\u200D])*'
-
-    NAME['true'] = TRUE  # type: ignore[index]
-    NAME['false'] = FALSE  # type: ignore[index]
-    NAME['null'] = NULL  # type: ignore[index]
-    NAME['Infinity'] = INFINITY  # type: ignore[index]
-    NAME['NaN'] = NAN  # type: ignore[index]
-
-    UNTERMINATED_DOUBLE_QUOTE_STRING = r'"(?:[^"\\]|\\.)*'
-    UNTERMINATED_SINGLE_QUOTE_STRING = r"'(?:[^'\\]|\\.)*"
+        match = self.master_re.match
+        keywords = self.keywords
+        punctuation = self.punctuation
+        multiline_tokens = self.multiline_tokens
+        line_index = LineIndex(text)
+        text_length = len(text)
+        while index < text_length:
+            char = text[index]
+            if char in punctuation:
+                yield JSON5Token(punctuation[char], char, lineno, index, index + 1, text, line_index)
+                index += 1
+                continue
+            m = match(text, index)
+            if m is not None:
+                tok_type: str = m.lastgroup  # type: ignore[assignment]
+                value = m.group()
+                end = m.end()
+            else:
+                name_match = self.unicode_name_re.match(text, index)
+                if name_match is None:
+                    self.index = index
+                    self.lineno = lineno
+                    self.error(JSON5Token('ERROR', text[index:], lineno, index, index, text, line_index))
+                    index = self.index
+                    lineno = self.lineno
+                    continue
+                tok_type = 'NAME'
+                value = name_match.group()
+                end = name_match.end()
+            if tok_type == 'NAME':
+                tok_type = keywords.get(value, tok_type)
+            yield JSON5Token(tok_type, value, lineno, index, end, text, line_index)
+            if tok_type in multiline_tokens:
+                lineno += value.count('\n')
+            index = end
+        self.index = index
+        self.lineno = lineno
+
+    # How close to the end of the buffer a match may end before more text must be read, as more text could change it.
+    # This has to cover the lookahead needed by the rules; for example ``0x`` may be an INTEGER or the start of a
+    # HEXADECIMAL, depending on what comes next.
+    stream_margin: int = 8
+
+    def tokenize_stream(
+        self, f: typing.TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE, lineno: int = 1
+    ) -> Generator[JSON5Token, None, None]:
+        '''
+        Like ``tokenize``, but reads the text from ``f`` as it is needed, ``chunk_size`` characters at a time.
+
+        Text is discarded once it has been tokenized, so the tokens produced have an empty ``doc`` and their
+        ``index``/``end`` are offsets from the start of the stream.
+        '''
+        match = self.master_re.match
+        keywords = self.keywords
+        punctuation = self.punctuation
+        multiline_tokens = self.multiline_tokens
+        margin = self.stream_margin
+        buffer = f.read(chunk_size)
+        at_eof = not buffer
+        offset = 0  # stream offset of buffer[0]
+        pos = 0
+        while True:
+            if at_eof or pos < len(buffer) - margin:
+                if pos >= len(buffer):
+                    break
+                char = buffer[pos]
+                if char in punctuation:
+                    yield JSON5Token(punctuation[char], char, lineno, offset + pos, offset + pos + 1, '')
+                    pos += 1
+                    continue
+                m = match(buffer, pos)
+                if m is not None:
+                    tok_type: str = m.lastgroup  # type: ignore[assignment]
+                    end = m.end()
+                else:
+                    name_match = self.unicode_name_re.match(buffer, pos)
+                    tok_type = 'NAME'
+                    end = name_match.end() if name_match is not None else pos
+                if end == pos and (at_eof or char != '/' or buffer[pos + 1 : pos + 2] not in ('', '*')):
+                    # A '/' followed by '*' is the start of a block comment that ends beyond the buffer, and one at the
+                    # end of the buffer may be followed by either. Anything else can't become a token with more text.
+                    self.index = offset + pos
+                    self.lineno = lineno
+                    self.error(JSON5Token('ERROR', buffer[pos:], lineno, offset + pos, offset + pos, ''))
+                    pos = self.index - offset
+                    lineno = self.lineno
+                    continue
+                if end != pos and (at_eof or end <= len(buffer) - margin):
+                    value = buffer[pos:end]
+                    if tok_type == 'NAME':
+                        tok_type = keywords.get(value, tok_type)
+                    yield JSON5Token(tok_type, value, lineno, offset + pos, offset + end, '')
+                    if tok_type in multiline_tokens:
+                        lineno += value.count('\n')
+                    pos = end
+                    continue
+            # The buffer is (nearly) used up, or the next token may continue beyond it: read more text.
+            # Read at least as much as is left over, so a very long token takes a logarithmic number of reads.
+            more = f.read(max(chunk_size, len(buffer) - pos))
+            at_eof = not more
+            buffer = buffer[pos:] + more
+            offset += pos
+            pos = 0
+        self.index = offset + pos
+        self.lineno = lineno
+
+    # The rules for UTF-8 encoded text; only those involving non-ASCII characters differ
+    bytes_rules: list[tuple[str, bytes]] = [
+        (name, _BYTES_RULES[name] if name in _BYTES_RULES else pattern.encode('ascii')) for name, pattern in rules
+    ]
+
+    bytes_master_re = re.compile(
+        b'|'.join(b'(?P<%s>%s)' % (name.encode(), pattern) for name, pattern in bytes_rules), re.DOTALL
+    )
+
+    # The bytes that may be part of a name that ``bytes_master_re`` can't match
+    bytes_name_run_re = re.compile(rb'[a-zA-Z0-9_\$\\\x80-\xff]+')
+
+    bytes_punctuation: dict[int, str] = {ord(char): tok_type for char, tok_type in punctuation.items()}
+
+    def tokenize_bytes(
+        self, data: bytes | bytearray | memoryview | mmap, lineno: int = 1, index: int = 0
+    ) -> Generator[JSON5Token, None, None]:
+        '''
+        Like ``tokenize``, but works directly on UTF-8 encoded text in any buffer (such as a memory-mapped file), so the
+        whole text is never decoded to a ``str``. Only the text of each token is decoded, as it is produced.
+
+        The tokens have an empty ``doc`` and their ``index``/``end`` are byte offsets.
+        '''
+        match = self.bytes_master_re.match
+        keywords = self.keywords
+        punctuation = self.bytes_punctuation
+        multiline_tokens = self.multiline_tokens
+        data_length = len(data)
+        while index < data_length:
+            byte = data[index]
+            if byte in punctuation:
+                tok_type = punctuation[byte]
+                yield JSON5Token(tok_type, chr(byte), lineno, index, index + 1, '')
+                index += 1
+                continue
+            m = match(data, index)
+            if m is not None:
+                tok_type = m.lastgroup  # type: ignore[assignment]
+                end = m.end()
+                value = str(data[index:end], 'utf-8')
+            else:
+                value = self._match_bytes_name(data, index)
+                if not value:
+                    self.index = index
+                    self.lineno = lineno
+                    self.error(
+                        JSON5Token('ERROR', str(data[index : index + 4], 'utf-8', 'replace'), lineno, index, index, '')
+                    )
+                    index = self.index
+                    lineno = self.lineno
+                    continue
+                tok_type = 'NAME'
+                end = index + len(value.encode('utf-8'))
+            if tok_type == 'NAME':
+                tok_type = keywords.get(value, tok_type)
+            yield JSON5Token(tok_type, value, lineno, index, end, '')
+            if tok_type in multiline_tokens:
+                lineno += value.count('\n')
+            index = end
+        self.index = index
+        self.lineno = lineno
+
+    def _match_bytes_name(self, data: bytes | bytearray | memoryview | mmap, index: int) -> str:
+        """
+        Match a name containing non-ASCII characters at ``index``, returning the name (or an empty string)
+        """
+        run = self.bytes_name_run_re.match(data, index)
+        if run is None:
+            return ''
+        # A run of name bytes ends at an ASCII character, which can't be in the middle of a UTF-8 sequence
+        name_match = self.unicode_name_re.match(str(data[index : run.end()], 'utf-8'))
+        return name_match.group() if name_match is not None else ''
 
     def error(self, t: JSON5Token) -> NoReturn:
         raise JSON5DecodeError(f'Illegal character {t.value[0]!r} at index {self.index}', None)
@@ -153,7 +383,121 @@ def tokenize(text: str) -> Generator[JSON5Token, None, None]:
     return tokens
 
 
+def tokenize_bytes(data: bytes | bytearray | memoryview | mmap) -> Generator[JSON5Token, None, None]:
+    lexer = JSONLexer()
+    tokens = lexer.tokenize_bytes(data)
+    return tokens
+
+
+def tokenize_file(f: typing.TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Generator[JSON5Token, None, None]:
+    lexer = JSONLexer()
+    tokens = lexer.tokenize_stream(f, chunk_size=chunk_size)
+    return tokens
+
+
 def reversed_enumerate(tokens: typing.Sequence[JSON5Token]) -> typing.Generator[tuple[int, JSON5Token], None, None]:
     for i in reversed(range(len(tokens))):
         tok = tokens[i]
         yield i, tok
+
+
+ESCAPE_SEQUENCES = {
+    'b': '\u0008',
+    'f': '\u000C',
+    'n': '\u000A',
+    'r': '\u000D',
+    't': '\u0009',
+    'v': '\u000B',
+    '0': '\u0000',
+    '\\': '\u005c',
+    '"': '\u0022',
+    "'": '\u0027',
+}
+
+
+# An escape sequence, or an unescaped line terminator (which is not allowed in strings).
+# The groups are: a line continuation, the digits of a \x escape, the digits of a \u escape, a digit following \0
+# and any other escaped character.
+_STRING_ESCAPE = re.compile(
+    r'\\(?:(\r\n|[\n\r\u2028\u2029])|x([0-9a-fA-F]{2})?|u([0-9a-fA-F]{4})|0(\d)?|(.))|[\n\r\u2028\u2029]', re.DOTALL
+)
+
+_IDENTIFIER_ESCAPE = re.compile(r'\\u([0-9a-fA-F]{4})')
+
+
+def _has_line_terminator(s: str) -> bool:
+    return '\n' in s or '\r' in s or '\u2028' in s or '\u2029' in s
+
+
+def decode_string_literal(raw_value: str, tok: JSON5Token, errors: list[JSON5DecodeError]) -> str:
+    """
+    Turn the raw value of a string token (including its quotes) into the characters it represents.
+
+    Any problems found are appended to ``errors`` rather than raised, so the caller can keep going and report them all.
+    """
+    contents = raw_value[1:-1]
+    if '\\' not in contents and not _has_line_terminator(contents):
+        return contents
+    parts: list[str] = []
+    reported: set[str] = set()  # each kind of problem is only reported once per string
+    pos = 0
+    for m in _STRING_ESCAPE.finditer(contents):
+        parts.append(contents[pos : m.start()])
+        pos = m.end()
+        escape = m.group()
+        if escape[0] != '\\':
+            if 'terminator' not in reported:
+                reported.add('terminator')
+                errors.append(_illegal_line_terminator(raw_value, tok, m.start()))
+            parts.append(escape)
+            continue
+        continuation, hex_digits, unicode_digits, digit_after_zero, char = m.groups()
+        if continuation is not None:
+            continue
+        elif unicode_digits is not None:
+            parts.append(chr(int(unicode_digits, 16)))
+        elif escape[1] == 'x':
+            if hex_digits is None:
+                if 'x' not in reported:
+                    reported.add('x')
+                    errors.append(JSON5DecodeError("'\\x' MUST be followed by two hexadecimal digits", tok))
+                parts.append(escape[1:])
+            else:
+                parts.append(chr(int(hex_digits, 16)))
+        elif escape[1] == '0':
+            if digit_after_zero is not None and '0' not in reported:
+                reported.add('0')
+                errors.append(JSON5DecodeError("'\\0' MUST NOT be followed by a decimal digit", tok))
+            parts.append(escape[1:] if digit_after_zero is not None else '\u0000')
+        else:
+            parts.append(ESCAPE_SEQUENCES.get(char, char))
+    parts.append(contents[pos:])
+    return ''.join(parts)
+
+
+def _illegal_line_terminator(raw_value: str, tok: JSON5Token, offset: int) -> JSON5DecodeError:
+    """
+    The error for an unescaped line terminator ``offset`` characters into the contents of a string token
+    """
+    index = tok.index + offset + 1
+    doc = tok.doc
+    if doc:
+        line_index = tok.line_index or LineIndex(doc)
+        lineno, colno = line_index.offset_to_position(index)
+        colno += 1
+        errmsg = f"Illegal line terminator (line {lineno} column {colno} (char {index}) without continuation"
+    else:
+        lineno = tok.lineno + raw_value.count('\n', 0, offset + 1)
+        errmsg = f"Illegal line terminator (line {lineno} (char {index}) without continuation"
+    return JSON5DecodeError(errmsg, tok)
+
+
+def decode_identifier_name(raw_value: str) -> str:
+    return _IDENTIFIER_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), raw_value)
+
+
+_IDENTIFIER_NAME = regex.compile(r'[\w_\$]([\w_\d\$\p{Pc}\p{Mn}\p{Mc}\u200C\u200D])*')
+
+
+def is_valid_identifier_name(name: str) -> bool:
+    return _IDENTIFIER_NAME.fullmatch(name) is not None
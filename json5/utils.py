@@ -3,12 +3,16 @@ from __future__ import annotations
 import typing
 from json import JSONDecodeError
 
-__all__ = ['JSON5DecodeError']
+__all__ = ['JSON5DecodeError', 'JsonIdentifier']
 
 if typing.TYPE_CHECKING:
     from .tokenizer import JSON5Token
 
 
+class JsonIdentifier(str):
+    ...
+
+
 class JSON5DecodeError(JSONDecodeError):
     def __init__(self, msg: str, token: JSON5Token | None):
         lineno = getattr(token, 'lineno', 0)
@@ -16,13 +20,80 @@ class JSON5DecodeError(JSONDecodeError):
         doc = getattr(token, 'doc', None)
         self.token = token
         self.index = index
+        self._unformatted_msg = msg
         if token and doc:
             errmsg = f'{msg} in or near token {token.type} at'
             super().__init__(errmsg, doc, index)
+        elif token and doc == '':
+            # Tokens read from a stream don't keep the text around, so the column can't be determined
+            errmsg = f'{msg} in or near token {token.type} at line {lineno} (char {index})'
+            ValueError.__init__(self, errmsg)
+            self.msg = errmsg
+            self.lineno = lineno
+            self.pos = index
         else:
             ValueError.__init__(self, msg)
             self.msg = msg
             self.lineno = lineno
 
     def __reduce__(self) -> tuple[type[JSON5DecodeError], tuple[str, JSON5Token | None]]:
-        return self.__class__, (self.msg, self.token)
+        return self.__class__, (self._unformatted_msg, self.token)
+
+
+_F = typing.TypeVar('_F', bound=typing.Callable[..., typing.Any])
+
+
+def handles(*types: type) -> typing.Callable[[_F], _F]:
+    """
+    Register the decorated method of a ``TypeDispatch`` class as the handler for values of ``types`` (and their
+    subclasses).
+    """
+
+    def register(func: _F) -> _F:
+        func._dispatch_types = types  # type: ignore[attr-defined]
+        return func
+
+    return register
+
+
+class TypeDispatch:
+    """
+    Base for classes that pick the method to call for a value by its type, like ``functools.singledispatchmethod``.
+
+    The handlers registered (with ``handles``) on a class and its bases are compiled into a dict from type to function
+    when the class is created, so dispatching is a single lookup. Handlers are found by name, so a subclass can
+    override one just by defining a method with the same name.
+    """
+
+    _handlers: typing.ClassVar[dict[type, typing.Callable[..., typing.Any]]] = {}
+    _handled_types: typing.ClassVar[tuple[type, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: typing.Any):
+        super().__init_subclass__(**kwargs)
+        names: dict[type, str] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                for handled_type in getattr(attr, '_dispatch_types', ()):
+                    names[handled_type] = name
+        cls._handlers = {handled_type: getattr(cls, name) for handled_type, name in names.items()}
+        cls._handled_types = tuple(names)
+
+    @classmethod
+    def _find_handler(cls, value_type: type) -> typing.Callable[..., typing.Any] | None:
+        """
+        The handler for a type without a handler of its own, which is then remembered. Returns None if there is none.
+        """
+        for base in value_type.__mro__:
+            handler = cls._handlers.get(base)
+            if handler is not None:
+                break
+        else:
+            # the handled types may be ABCs that value_type is a virtual subclass of
+            for handled_type in cls._handled_types:
+                if issubclass(value_type, handled_type):
+                    handler = cls._handlers[handled_type]
+                    break
+            else:
+                return None
+        cls._handlers[value_type] = handler
+        return handler
@@ -0,0 +1,124 @@
+import array
+import io
+
+import pytest
+
+import json5
+from json5 import JSON5DecodeError
+from json5.columns import ColumnDecoder
+
+RECORDS = [
+    {'ts': 1, 'v': 2.0, 'tags': ['a'], 'meta': {'ok': True}},
+    {'ts': 2, 'v': 2.5, 'tags': [], 'meta': {'ok': False}},
+    {'ts': 3, 'v': -1.0, 'tags': ['b', 'c'], 'meta': None},
+]
+
+COLUMNS = {
+    'ts': [1, 2, 3],
+    'v': [2.0, 2.5, -1.0],
+    'tags': [['a'], [], ['b', 'c']],
+    'meta': [{'ok': True}, {'ok': False}, None],
+}
+
+
+@pytest.mark.parametrize('text', [json5.dumps(RECORDS), json5.dumps(RECORDS, indent=2), json5.dumps(RECORDS) + '\n'])
+@pytest.mark.parametrize('try_json', [True, False])
+def test_load_columns(text, try_json):
+    assert json5.load_columns(text, try_json=try_json) == COLUMNS
+    assert json5.load_columns(text.encode('utf-8'), try_json=try_json) == COLUMNS
+    assert json5.load_columns(io.StringIO(text), try_json=try_json) == COLUMNS
+
+
+def test_load_columns_json5():
+    text = """// readings
+    [
+        {ts: 1, v: 2.0, tags: ['a'], meta: {ok: true}},
+        {ts: 0x2, v: +2.5, tags: [], meta: {ok: false,},},
+        {ts: 3, v: -1., tags: ['b', 'c'], meta: null}, // last
+    ]"""
+    assert json5.load_columns(text) == COLUMNS
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_load_columns_missing_fields(try_json):
+    text = '[{"a": 1, "b": 2}, {"b": 3}, {"c": 4, "a": 5}, {"a": 6, "b": 7, "c": 8}, {}]'
+    columns = json5.load_columns(text, try_json=try_json)
+    assert columns == {
+        'a': [1, None, 5, 6, None],
+        'b': [2, 3, None, 7, None],
+        'c': [None, None, 4, 8, None],
+    }
+    assert list(columns) == ['a', 'b', 'c']
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_load_columns_duplicate_keys(try_json):
+    assert json5.load_columns('[{"a": 1, "a": 2}, {"a": 3}]', try_json=try_json) == {'a': [2, 3]}
+
+
+@pytest.mark.parametrize('text', ['[]', ' [ ] ', '[/* nothing */]'])
+def test_load_columns_empty(text):
+    assert json5.load_columns(text) == {}
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_load_columns_numeric_arrays(try_json):
+    text = '[{"ts": 1, "v": [1.5, 2]}, {"ts": 2, "v": [3]}, {"ts": 3, "v": null}]'
+    columns = json5.load_columns(text, numeric_arrays='array', try_json=try_json)
+    assert columns['ts'] == array.array('q', [1, 2, 3])
+    assert columns['v'] == [array.array('d', [1.5, 2.0]), array.array('q', [3]), None]
+
+
+def test_load_columns_hooks():
+    seen = []
+
+    def hook(d):
+        seen.append(d)
+        return dict(d, hooked=True)
+
+    columns = json5.load_columns('[{"meta": {"a": 1}}, {"meta": {}}]', object_hook=hook)
+    assert columns == {'meta': [{'a': 1, 'hooked': True}, {'hooked': True}]}
+    assert seen == [{'a': 1}, {}]
+    assert json5.load_columns('[{"v": 1.5}]', parse_float=str) == {'v': ['1.5']}
+
+
+@pytest.mark.parametrize(
+    'text, message',
+    [
+        ('{"a": 1}', 'Expected an array of objects'),
+        ('1', 'Expected an array of objects'),
+        ('[{"a": 1}, 2]', 'Expected an object'),
+        ('[[1]]', 'Expected an object'),
+    ],
+)
+def test_load_columns_not_records(text, message):
+    with pytest.raises(JSON5DecodeError, match=message):
+        json5.load_columns(text)
+
+
+@pytest.mark.parametrize('text', ['[{"a": 1} {"b": 2}]', '[{"a": 1}] 2', '[{"a": 1},,]', '[{"a": 1}', '[{a 1}]'])
+def test_load_columns_syntax_errors_match_loads(text):
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        json5.load_columns(text)
+    with pytest.raises(JSON5DecodeError) as expected_exc_info:
+        json5.loads(text)
+    assert str(exc_info.value) == str(expected_exc_info.value)
+
+
+def test_load_columns_max_depth():
+    text = '[{"a": [[1]]}]'
+    assert json5.load_columns(text, max_depth=4) == {'a': [[[1]]]}
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        json5.load_columns(text, max_depth=3)
+    with pytest.raises(JSON5DecodeError) as expected_exc_info:
+        json5.loads(text, max_depth=3)
+    assert str(exc_info.value) == str(expected_exc_info.value)
+    with pytest.raises(JSON5DecodeError, match='Maximum nesting depth'):
+        json5.load_columns('[{}]', max_depth=1)
+
+
+def test_column_decoder_reuse():
+    decoder = ColumnDecoder()
+    assert decoder.decode('[{a: 1}]') == {'a': [1]}
+    assert decoder.decode('[{"b": 2}]') == {'b': [2]}
+    assert decoder.raw_decode('rows = [{a: 1}];', 7) == ({'a': [1]}, 15)
@@ -0,0 +1,245 @@
+import math
+import sys
+from decimal import Decimal
+
+import pytest
+
+from json5.decoder import Decoder
+from json5.dumper import dumps
+from json5.loader import DefaultLoader
+from json5.loader import JsonIdentifier
+from json5.loader import loads
+from json5.parser import parse_source
+from json5.tokenizer import tokenize
+from json5.utils import JSON5DecodeError
+
+DOCUMENTS = [
+    '{}',
+    '[]',
+    '{foo: "bar", \'baz\': [1, 2.5, -3, +4, .5, 5., 1e3, 2.5E-2, 0xC0FFEE, -0x10],}',
+    '// comment\n[true, false, null, /* block */ "string", \'single\',]\n',
+    '{nested: {deeper: [{}, [], [[1]]]}}',
+    '"escapes \\n \\t \\x41 \\u00e9 \\\' \\" \\\\ \\0 line \\\ncontinuation"',
+    '{\\u0061bc: 1, $_: 2}',
+    '[Infinity, -Infinity, +Infinity]',
+]
+
+
+def _load_with_model(text, **kwargs):
+    return DefaultLoader(**kwargs).load(parse_source(text))
+
+
+@pytest.mark.parametrize('text', DOCUMENTS)
+def test_decoder_matches_default_loader(text):
+    assert Decoder().decode(text) == _load_with_model(text)
+
+
+@pytest.mark.parametrize('text', DOCUMENTS)
+def test_decoder_matches_default_loader_with_hooks(text):
+    kwargs = dict(
+        parse_int=lambda s: ('int', s),
+        parse_float=Decimal,
+        parse_constant=lambda s: ('const', s),
+        parse_json5_identifiers=lambda s: ('identifier', s),
+        object_pairs_hook=lambda pairs: ('pairs', pairs),
+    )
+    assert Decoder(**kwargs).decode(text) == _load_with_model(text, **kwargs)
+
+
+def test_decoder_keeps_json_identifiers():
+    key = list(Decoder().decode('{foo: "bar"}'))[0]
+    assert isinstance(key, JsonIdentifier)
+    key = list(Decoder().decode('{"foo": "bar"}'))[0]
+    assert not isinstance(key, JsonIdentifier)
+
+
+def test_decoder_nan():
+    assert math.isnan(Decoder().decode('NaN'))
+    assert math.isnan(Decoder().decode('-NaN'))
+
+
+@pytest.mark.parametrize(
+    'text', ['', '[1,,]', '{foo: "bar",,}', '[true', '{true: 1}', '1 e5', '"\\x1"', '012', '{a b}']
+)
+def test_decoder_errors_match_parser(text):
+    with pytest.raises(JSON5DecodeError) as parser_exc_info:
+        parse_source(text)
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        loads(text)
+    assert str(exc_info.value) == str(parser_exc_info.value)
+
+
+JSON_DOCUMENTS = [
+    '{"foo": [1, -2, 3.5, -4.5e3, -0, true, false, null]}',
+    '{"dupe": 1, "other": 2, "dupe": 3}',
+    '[NaN, Infinity, -Infinity]',
+    '"surrogate pair \\ud83d\\ude00"',
+    '"line separator \u2028"',
+    '"escaped \\u005cn \\/ \\b"',
+]
+
+
+@pytest.mark.parametrize('text', JSON_DOCUMENTS)
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {},
+        dict(parse_int=lambda s: ('int', s), parse_float=lambda s: ('float', s), parse_constant=lambda s: ('const', s)),
+        dict(object_pairs_hook=lambda pairs: ('pairs', pairs)),
+        dict(object_hook=lambda d: ('object', d)),
+    ],
+)
+def test_json_fast_path_matches_json5_decoding(text, kwargs):
+    try:
+        expected = _load_with_model(text, **kwargs)
+    except JSON5DecodeError:
+        with pytest.raises(JSON5DecodeError):
+            Decoder(**kwargs).decode(text)
+        return
+    assert repr(Decoder(**kwargs).decode(text)) == repr(expected)
+    assert repr(Decoder(try_json=False, **kwargs).decode(text)) == repr(expected)
+
+
+def test_json_fast_path_nan_identity():
+    assert Decoder().decode('NaN') is math.nan
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+@pytest.mark.parametrize(
+    'text, idx, expected',
+    [
+        ('{"foo": [1, 2]} trailing text', 0, ({'foo': [1, 2]}, 15)),
+        ('key = {foo: "bar",} // comment', 6, ({'foo': 'bar'}, 19)),
+        ('  /* leading */ 1.5', 0, (1.5, 19)),
+        ('0x10 rest', 0, (16, 4)),
+        ('1. 2', 0, (1.0, 2)),
+        ('"one" \'two\'', 5, ('two', 11)),
+        ('[1]@@', 0, ([1], 3)),
+        ('true', 0, (True, 4)),
+    ],
+)
+def test_raw_decode(text, idx, expected, try_json):
+    assert Decoder(try_json=try_json).raw_decode(text, idx) == expected
+
+
+@pytest.mark.parametrize('text', ['trueish', '[1, 2', '{foo: @}', ''])
+def test_raw_decode_errors(text):
+    with pytest.raises(JSON5DecodeError):
+        Decoder().raw_decode(text)
+
+
+def test_raw_decode_consecutive_values():
+    decoder = Decoder(parse_int=str)
+    text = '1 [2] {three: 3}'
+    values = []
+    idx = 0
+    while idx < len(text):
+        value, idx = decoder.raw_decode(text, idx)
+        values.append(value)
+    assert values == ['1', ['2'], {'three': '3'}]
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_raw_decode_consecutive_values_positions(try_json):
+    decoder = Decoder(try_json=try_json)
+    text = '{"a": 1}\n[2]\n{b: 3}\n"four"\n[5,\n}]'
+    values = []
+    idx = 0
+    for _ in range(4):
+        value, idx = decoder.raw_decode(text, idx)
+        values.append(value)
+    assert values == [{'a': 1}, [2], {'b': 3}, 'four']
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        decoder.raw_decode(text, idx)
+    assert exc_info.value.lineno == exc_info.value.token.lineno == 6
+    # another text, or going back in the same one, starts over
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        decoder.raw_decode('\n\n[1, }]', 0)
+    assert exc_info.value.lineno == exc_info.value.token.lineno == 3
+    assert decoder.raw_decode(text, 0) == ({'a': 1}, 8)
+
+
+def test_raw_decode_illegal_character_message():
+    with pytest.raises(JSON5DecodeError, match="Illegal character '@'"):
+        Decoder().raw_decode('{foo: @}')
+
+
+@pytest.mark.parametrize('text', DOCUMENTS + ['{ñame: "é", \'ü\': [1,   2]}', '﻿{a: 1}'])
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-32-be'])
+@pytest.mark.parametrize('try_json', [True, False])
+def test_decode_bytes(text, encoding, try_json):
+    data = text.encode(encoding)
+    assert Decoder(try_json=try_json).decode_bytes(data) == loads(text)
+    assert loads(memoryview(data), try_json=try_json) == loads(text)
+    assert loads(bytearray(data), try_json=try_json) == loads(text)
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_decode_bytes_errors_match_parser(try_json):
+    text = '{\n  foo: "bär",\n  baz: ,\n}'
+    with pytest.raises(JSON5DecodeError) as parser_exc_info:
+        parse_source(text)
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        loads(text.encode('utf-8'), try_json=try_json)
+    assert str(exc_info.value) == str(parser_exc_info.value)
+
+
+@pytest.mark.parametrize('load', [loads, _load_with_model])
+def test_objects_share_keys(load):
+    first, second = load("[{a: 1, 'b': 2, \"c\": 3}, {a: 4, 'b': 5, \"c\": 6}]")
+    for key, other_key in zip(first, second):
+        assert key is other_key
+    assert isinstance(list(first)[0], JsonIdentifier)
+
+
+def test_decoder_forgets_keys_between_documents():
+    decoder = Decoder(try_json=False)
+    decoder.decode('{foo: {bar: 1}}')
+    assert decoder._keys == {}
+
+
+def test_loader_forgets_keys_after_loading_a_node():
+    loader = DefaultLoader()
+    node = parse_source('{foo: {bar: 1}, "baz": [{qux: 2}]}').value
+    assert loader.load(node) == {'foo': {'bar': 1}, 'baz': [{'qux': 2}]}
+    assert loader._identifiers == {}
+    assert loader._string_keys == {}
+
+
+def test_decoder_forgets_keys_between_streamed_values():
+    decoder = Decoder(try_json=False)
+    for i, value in enumerate(decoder._iter_values(tokenize('{a: {b0: 0}} {a: {b1: 1}} {a: {b2: 2}}'))):
+        assert value == {'a': {f'b{i}': i}}
+        assert decoder._keys == {}
+    tokens = tokenize('{a: 1}')
+    assert decoder._decode_value_at(next(tokens), tokens) == ({'a': 1}, None)
+    assert decoder._keys == {}
+
+
+# deeper than any recursive decoder could go
+DEPTH = sys.getrecursionlimit() * 5
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_decode_deeply_nested(try_json):
+    text = '[' * DEPTH + ']' * DEPTH
+    assert dumps(Decoder(try_json=try_json).decode(text)) == text
+    text = '{"a": ' * DEPTH + '{}' + '}' * DEPTH
+    assert dumps(Decoder(try_json=try_json).decode(text)) == text
+
+
+@pytest.mark.parametrize('load', [loads, _load_with_model])
+def test_max_depth(load):
+    assert load('[[1], {a: [2]}]', max_depth=3) == [[1], {'a': [2]}]
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        load('[[1], {a: [2]}]', max_depth=2)
+    assert 'Maximum nesting depth of 2 exceeded' in str(exc_info.value)
+    assert exc_info.value.pos == 10
+    with pytest.raises(JSON5DecodeError):
+        load('[]', max_depth=0)
+    assert load('1', max_depth=0) == 1
+
+
+def test_max_depth_applies_to_json():
+    with pytest.raises(JSON5DecodeError):
+        Decoder(max_depth=1).decode('[[1]]')
@@ -0,0 +1,127 @@
+import math
+from io import StringIO
+
+import pytest
+
+from json5 import items
+from json5 import iterparse
+from json5 import JSON5DecodeError
+from json5 import loads
+from json5.parser import parse_source
+
+
+def test_iterparse_events():
+    text = "// comment\n{foo: [1, 2e3, -0x10, {bar: null}], 'baz': \"qux\", nested: [[], [true]],}"
+    assert list(iterparse(text)) == [
+        ('', 'start_map', None),
+        ('', 'map_key', 'foo'),
+        ('foo', 'start_array', None),
+        ('foo.item', 'number', 1),
+        ('foo.item', 'number', 2000.0),
+        ('foo.item', 'number', -16),
+        ('foo.item', 'start_map', None),
+        ('foo.item', 'map_key', 'bar'),
+        ('foo.item.bar', 'null', None),
+        ('foo.item', 'end_map', None),
+        ('foo', 'end_array', None),
+        ('', 'map_key', 'baz'),
+        ('baz', 'string', 'qux'),
+        ('', 'map_key', 'nested'),
+        ('nested', 'start_array', None),
+        ('nested.item', 'start_array', None),
+        ('nested.item', 'end_array', None),
+        ('nested.item', 'start_array', None),
+        ('nested.item.item', 'boolean', True),
+        ('nested.item', 'end_array', None),
+        ('nested', 'end_array', None),
+        ('', 'end_map', None),
+    ]
+
+
+@pytest.mark.parametrize('text', ['"string"', '42', '-Infinity', 'true', 'null'])
+def test_iterparse_scalar_document(text):
+    [(prefix, _, value)] = list(iterparse(text))
+    assert prefix == ''
+    assert value == loads(text)
+
+
+def test_iterparse_nan():
+    [(_, event, value)] = list(iterparse('NaN'))
+    assert event == 'number'
+    assert math.isnan(value)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 65536])
+def test_iterparse_file(chunk_size):
+    text = '{foo: [1, 2.5e-1, "bar\\\nbaz"], /* comment */ qux: {}}'
+    assert list(iterparse(StringIO(text), chunk_size=chunk_size)) == list(iterparse(text))
+
+
+@pytest.mark.parametrize('text', ['', '[1,,]', '{foo: "bar",,}', '[true', '{true: 1}', '1 e5', '{a b}', '[1] 2', '[}'])
+def test_iterparse_errors_match_parser(text):
+    with pytest.raises(JSON5DecodeError) as parser_exc_info:
+        parse_source(text)
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        list(iterparse(text))
+    assert str(exc_info.value) == str(parser_exc_info.value)
+
+
+def test_iterparse_file_errors():
+    with pytest.raises(JSON5DecodeError):
+        list(iterparse(StringIO('{foo: [1, 2}'), chunk_size=3))
+
+
+RECORDS_TEXT = """\
+{
+    meta: {count: 3},
+    records: [
+        {id: 1, score: 1.5},
+        {id: 2, score: -Infinity},
+        {id: 3, tags: ['a', 'b']},
+    ],
+    other: {records: ['not', 'these']},
+}
+"""
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 65536])
+def test_items(chunk_size):
+    expected = loads(RECORDS_TEXT)['records']
+    assert list(items(StringIO(RECORDS_TEXT), 'records.item', chunk_size=chunk_size)) == expected
+    assert list(items(RECORDS_TEXT, 'records.item')) == expected
+
+
+def test_items_prefixes():
+    assert list(items(RECORDS_TEXT, 'records.item.id')) == [1, 2, 3]
+    assert list(items(RECORDS_TEXT, 'records.item.tags.item')) == ['a', 'b']
+    assert list(items(RECORDS_TEXT, 'other.records')) == [['not', 'these']]
+    assert list(items(RECORDS_TEXT, '')) == [loads(RECORDS_TEXT)]
+    assert list(items(RECORDS_TEXT, 'missing')) == []
+
+
+def test_items_hooks():
+    kwargs = dict(
+        parse_int=lambda s: ('int', s),
+        parse_float=lambda s: ('float', s),
+        parse_constant=lambda s: ('const', s),
+        object_pairs_hook=lambda pairs: ('pairs', pairs),
+    )
+    expected = loads(RECORDS_TEXT, **kwargs)[1][1][1]
+    assert list(items(StringIO(RECORDS_TEXT), 'records.item', **kwargs)) == expected
+
+
+def test_items_is_lazy():
+    text = '{records: [1, 2, oops]}'
+    records = items(StringIO(text), 'records.item')
+    assert next(records) == 1
+    assert next(records) == 2
+    with pytest.raises(JSON5DecodeError):
+        next(records)
+
+
+def test_items_error_matches_parser():
+    with pytest.raises(JSON5DecodeError) as parser_exc_info:
+        parse_source('{records: [1, 2,, 3]}')
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        list(items('{records: [1, 2,, 3]}', 'records.item'))
+    assert str(exc_info.value) == str(parser_exc_info.value)
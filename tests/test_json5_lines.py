@@ -0,0 +1,88 @@
+import pickle
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+
+from json5.dumper import dump_lines
+from json5.loader import load_lines
+from json5.loader import loads
+from json5.utils import JSON5DecodeError
+
+LINES_TEXT = """\
+{id: 1, name: 'first'}
+// a comment on its own line
+{id: 2, name: "second", tags: ['a', 'b',],}
+[1, 2.5, -Infinity] /* trailing comment */
+
+"just a string"
+null
+"""
+
+EXPECTED = [
+    {'id': 1, 'name': 'first'},
+    {'id': 2, 'name': 'second', 'tags': ['a', 'b']},
+    [1, 2.5, float('-inf')],
+    'just a string',
+    None,
+]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 65536])
+def test_load_lines(chunk_size):
+    assert list(load_lines(StringIO(LINES_TEXT), chunk_size=chunk_size)) == EXPECTED
+
+
+def test_load_lines_concatenated_values():
+    text = '{a: 1}{b: 2}[3] 4 "five"\n{\n  six: 6,\n}'
+    assert list(load_lines(StringIO(text))) == [{'a': 1}, {'b': 2}, [3], 4, 'five', {'six': 6}]
+
+
+def test_load_lines_empty():
+    assert list(load_lines(StringIO(''))) == []
+    assert list(load_lines(StringIO('// nothing here\n'))) == []
+
+
+def test_load_lines_hooks():
+    values = list(load_lines(StringIO('1.5\n{a: 2.5}\n'), parse_float=Decimal))
+    assert values == [Decimal('1.5'), {'a': Decimal('2.5')}]
+
+
+def test_load_lines_error():
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        list(load_lines(StringIO('1\n2\n[3,,]\n')))
+    assert 'line 3' in str(exc_info.value)
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 1000])
+def test_load_lines_workers(batch_size):
+    text = LINES_TEXT * 5
+    assert list(load_lines(StringIO(text), workers=2, batch_size=batch_size)) == EXPECTED * 5
+
+
+def test_load_lines_workers_hooks():
+    values = list(load_lines(StringIO('1.5\n{a: 2.5}\n'), parse_float=Decimal, workers=2, batch_size=1))
+    assert values == [Decimal('1.5'), {'a': Decimal('2.5')}]
+
+
+def test_load_lines_workers_error_matches_serial():
+    text = '1\n2\n{a: 3}\n[4,,]\n5\n'
+    with pytest.raises(JSON5DecodeError) as serial_exc_info:
+        list(load_lines(StringIO(text)))
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        list(load_lines(StringIO(text), workers=2, batch_size=2))
+    assert str(exc_info.value) == str(serial_exc_info.value)
+
+
+def test_decode_error_pickles():
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        loads('[1,,]')
+    assert str(pickle.loads(pickle.dumps(exc_info.value))) == str(exc_info.value)
+
+
+def test_dump_lines():
+    f = StringIO()
+    assert dump_lines(EXPECTED[:2] + ['multi\nline', None], f) == 4
+    text = f.getvalue()
+    assert text.count('\n') == 4
+    assert list(load_lines(StringIO(text))) == EXPECTED[:2] + ['multi\nline', None]
@@ -5,7 +5,10 @@ import pytest
 
 from json5.loader import JsonIdentifier
 from json5.loader import load
+from json5.loader import load_path
 from json5.loader import loads
+from json5.loader import ModelLoader
+from json5.utils import JSON5DecodeError
 
 
 def test_object_string_key_value_pair():
@@ -321,3 +324,76 @@ def test_escape_unicode():
 def test_load_identifier_with_connector_punctuation():
     json_string = """{foo⁀bar: 1}"""
     assert loads(json_string) == {"foo⁀bar": 1}
+
+
+STREAM_TEXT = """\
+// comment before
+{
+    unquoted: 'and you can quote me on that',
+    singleQuotes: 'I can use "double quotes" here',
+    lineBreaks: "Look, Mom! \\
+No \\\\n's!",
+    hexadecimal: 0xdecaf,
+    leadingDecimalPoint: .8675309, andTrailing: 8675309.,
+    positiveSign: +1, exponent: 1e-5,
+    /* a block comment
+       spanning lines */
+    trailingComma: 'in objects', andIn: ['arrays',],
+    "backwardsCompatible": "with JSON",
+}
+"""
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 65536])
+def test_load_stream(chunk_size):
+    assert load(StringIO(STREAM_TEXT), stream=True, chunk_size=chunk_size) == loads(STREAM_TEXT)
+
+
+def test_load_stream_error_reports_line():
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        load(StringIO('{\n  foo: "bar",\n  baz: ,\n}'), stream=True, chunk_size=4)
+    assert 'line 3' in str(exc_info.value)
+
+
+@pytest.mark.parametrize('text', ['[1, / 2]', '[1, /', '[1, /a]'])
+def test_load_stream_stray_slash_fails_early(text):
+    f = StringIO(text + ' ' * 100_000)
+    with pytest.raises(JSON5DecodeError):
+        load(f, stream=True, chunk_size=64)
+    assert f.tell() < 1000
+
+
+def test_load_stream_block_comment_across_chunks():
+    text = '[1, /' + '*' + ' comment ' * 100 + '*/ 2]'
+    assert load(StringIO(text), stream=True, chunk_size=7) == [1, 2]
+
+
+def test_load_stream_with_loader_raises_error():
+    with pytest.raises(ValueError):
+        load(StringIO('{}'), stream=True, loader=ModelLoader())
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_load_path(tmp_path, use_mmap):
+    path = tmp_path / 'test.json5'
+    path.write_text(STREAM_TEXT.replace("'in objects'", "'ïn øbjects'"), encoding='utf-8')
+    assert load_path(path, mmap=use_mmap) == loads(path.read_text(encoding='utf-8'))
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_load_path_unicode(tmp_path, use_mmap):
+    path = tmp_path / 'test.json5'
+    path.write_text('\ufeff{ñame: "é\\u00e9",\u00a0b: [1,\u2028 2], /* ü */}', encoding='utf-8')
+    assert load_path(str(path), mmap=use_mmap) == {'ñame': 'éé', 'b': [1, 2]}
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_load_path_errors(tmp_path, use_mmap):
+    path = tmp_path / 'test.json5'
+    path.write_text('{\n  foo: "bär",\n  baz: ,\n}', encoding='utf-8')
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        load_path(path, mmap=use_mmap)
+    assert 'line 3' in str(exc_info.value)
+    path.write_text('', encoding='utf-8')
+    with pytest.raises(JSON5DecodeError):
+        load_path(path, mmap=use_mmap)
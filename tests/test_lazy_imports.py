@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+CHECK_MODULES = '''
+import sys
+import json5
+{code}
+print(' '.join(sorted(name for name in sys.modules if name.split('.')[0] in ('json5', 'sly', 'regex'))))
+'''
+
+
+def imported_after(code):
+    output = subprocess.check_output([sys.executable, '-c', CHECK_MODULES.format(code=code)], text=True)
+    return set(output.split())
+
+
+def test_import_only_loads_utils():
+    assert imported_after('') == {'json5', 'json5.utils'}
+
+
+def test_dumps_does_not_import_parsing_modules():
+    modules = imported_after('json5.dumps({"foo": [1, 2.5, None]})')
+    assert modules == {'json5', 'json5.dumper', 'json5.model', 'json5.utils'}
+
+
+@pytest.mark.parametrize('text', ['{"foo": [1, 2.5, null]}', "{foo: [1, 2.5, null,],}"])
+def test_loads_does_not_import_parser(text):
+    modules = imported_after(f'json5.loads({text!r})')
+    assert 'regex' in modules
+    assert 'json5.tokenizer' in modules
+    assert 'json5.parser' not in modules
+    assert 'sly' not in modules
+
+
+def test_loads_error_imports_parser():
+    modules = imported_after(
+        '''
+try:
+    json5.loads('{foo: }')
+except json5.JSON5DecodeError:
+    pass
+'''
+    )
+    assert 'json5.parser' in modules
+    assert 'sly' in modules
+
+
+def test_lazy_attributes():
+    import json5
+
+    assert json5.loads is json5.loader.loads
+    assert json5.dumps is json5.dumper.dumps
+    assert json5.JsonIdentifier is json5.loader.JsonIdentifier
+    assert set(json5.__all__) <= set(dir(json5))
+    with pytest.raises(AttributeError):
+        json5.does_not_exist
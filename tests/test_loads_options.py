@@ -1,5 +1,8 @@
 import json
 from decimal import Decimal
+from decimal import InvalidOperation
+
+import pytest
 
 import json5
 
@@ -76,3 +79,37 @@ def test_object_pairs_hook():
     result = json5.loads(json_string, object_pairs_hook=true_object_pair_hook)
     assert result == json.loads(json_string, object_pairs_hook=true_object_pair_hook)
     assert all(value is True for key, value in result.items())
+
+
+def failing_hook(value):
+    raise ValueError('hook failed')
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+@pytest.mark.parametrize(
+    'text, hooks',
+    [
+        ('[0x1, ]]', {'parse_int': Decimal}),
+        ('[1, 2] 3', {'parse_int': failing_hook}),
+        ('{"a": 1.5}}', {'parse_float': failing_hook}),
+        ('[{"a": {}}, ', {'object_hook': failing_hook}),
+        ('[{a: 1}, {b: 2,,}]', {'object_pairs_hook': failing_hook}),
+    ],
+)
+def test_syntax_errors_reported_before_hook_errors(text, hooks, try_json):
+    with pytest.raises(json5.JSON5DecodeError):
+        json5.loads(text, try_json=try_json, **hooks)
+    with pytest.raises(json5.JSON5DecodeError):
+        json5.loads(text.encode('utf-8'), try_json=try_json, **hooks)
+
+
+@pytest.mark.parametrize('try_json', [True, False])
+def test_hook_errors_in_valid_documents(try_json):
+    with pytest.raises(InvalidOperation):
+        json5.loads('[0x1]', parse_int=Decimal, try_json=try_json)
+    with pytest.raises(ValueError, match='hook failed'):
+        json5.loads('{"a": [1.5]}', parse_float=failing_hook, try_json=try_json)
+    with pytest.raises(ValueError, match='hook failed'):
+        json5.load_columns('[{"a": 1.5}]', parse_float=failing_hook, try_json=try_json)
+    with pytest.raises(json5.JSON5DecodeError):
+        json5.load_columns('[{"a": 1.5}] 2', parse_float=failing_hook, try_json=try_json)
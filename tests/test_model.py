@@ -1,9 +1,12 @@
 import ast
+from decimal import Decimal
 
 import pytest
 
+import json5.dumper
 import json5.loader
 import json5.model
+import json5.tokenizer
 
 TEST_TEXT = '''\
 {
@@ -45,3 +48,103 @@ def test_node_attribute_accuracy(attr_name: str, ast_node, json5_node):
     assert getattr(json5_node, attr_name) == getattr(
         ast_node, attr_name
     ), f'{attr_name} did not match {ast_node!r}, {json5_node!r}'
+
+
+def test_nodes_have_no_instance_dict():
+    for node in json5.model.walk(model):
+        assert not hasattr(node, '__dict__')
+
+
+def test_trivia_lists_are_only_allocated_when_needed():
+    m = json5.loads('{foo: [1, 2] /* comment */}', loader=json5.loader.ModelLoader())
+    obj = m.value
+    value = obj.values[0]
+    assert value._wsc_after is not None
+    assert obj._leading_wsc is None
+    assert obj.keys[0]._wsc_before is None
+    assert value.values[0]._wsc_before is None and value.values[0]._wsc_after is None
+    assert value.values[1]._wsc_before == [' ']
+    assert json5.dumps(m, dumper=json5.dumper.ModelDumper()) == '{foo: [1, 2] /* comment */}'
+    assert value.values[0]._wsc_before is None
+    assert value.values[0].wsc_before == []
+    value.values[0].wsc_before.append(' ')
+    assert json5.dumps(m, dumper=json5.dumper.ModelDumper()) == '{foo: [ 1, 2] /* comment */}'
+
+
+def test_fields_and_repr():
+    node = json5.model.Integer('0x10', is_hex=True)
+    assert node._fields == ['value', 'raw_value', 'is_hex', 'is_octal', 'wsc_before', 'wsc_after']
+    assert dict(json5.model.iter_fields(node))['wsc_before'] == []
+    assert repr(node) == "Integer(value=16, raw_value='0x10', is_hex=True, is_octal=False)"
+    obj = json5.model.JSONObject(json5.model.KeyValuePair(json5.model.Identifier('a'), json5.model.NullLiteral()))
+    assert repr(obj) == (
+        "JSONObject(keys=[Identifier(name='a', raw_value='a')], values=[NullLiteral()], trailing_comma=None)"
+    )
+
+
+def test_jsontext_positions():
+    text = '{\n  foo: [1, 2],\n  bar: "x",\n}'
+    m = json5.loads(text, loader=json5.loader.ModelLoader())
+    assert m.offset_to_position(text.index('bar')) == (3, 2)
+    assert m.position_to_offset(3, 2) == text.index('bar')
+    bar = m.value.keys[1]
+    assert (bar.lineno, bar.col_offset) == m.offset_to_position(text.index('bar'))
+
+
+def test_jsontext_positions_need_a_document():
+    m = json5.model.JSONText(value=json5.model.NullLiteral())
+    with pytest.raises(ValueError):
+        m.offset_to_position(0)
+
+
+@pytest.mark.parametrize('positions', ['spans', None])
+def test_models_without_tokens(positions):
+    text = '// leading\n{foo: [1, -2, /* two */], "bar": null,}'
+    with_tokens = json5.loads(text, loader=json5.loader.ModelLoader())
+    detached = json5.loads(text, loader=json5.loader.ModelLoader(positions=positions))
+    for node in json5.model.walk(detached):
+        assert not isinstance(node._tok, json5.tokenizer.JSON5Token)
+        assert not isinstance(node._end_tok, json5.tokenizer.JSON5Token)
+        for wsc in node._wsc_before or ():
+            if isinstance(wsc, json5.model.Comment):
+                assert not isinstance(wsc._tok, json5.tokenizer.JSON5Token)
+    for with_tok, without_tok in zip(json5.model.walk(with_tokens), json5.model.walk(detached)):
+        for attr in ('lineno', 'col_offset', 'end_lineno', 'end_col_offset'):
+            expected = getattr(with_tok, attr) if positions == 'spans' else None
+            assert getattr(without_tok, attr) == expected
+    assert json5.dumps(detached, dumper=json5.dumper.ModelDumper()) == text
+
+
+def test_parse_source_positions():
+    from json5.parser import parse_source
+
+    model = parse_source('[1, 2]', positions='spans')
+    assert isinstance(model.value._tok, json5.model.TokenSpan)
+    assert model.value.values[1].col_offset == 4
+    with pytest.raises(ValueError):
+        model.offset_to_position(0)
+    with pytest.raises(ValueError):
+        parse_source('[1, 2]', positions='offsets')
+
+
+def test_number_values_are_converted_on_first_access():
+    m = json5.loads('[12, 0x1F, 1.5e3]', loader=json5.loader.ModelLoader())
+    integer, hexadecimal, floating = m.value.values
+    assert all(node._value is None for node in (integer, hexadecimal, floating))
+    assert (integer.value, hexadecimal.value, floating.value) == (12, 31, 1500.0)
+    assert json5.model.Integer('010', is_octal=True).value == 8
+    assert integer._value == 12
+
+
+def test_number_hooks_do_not_convert_values():
+    m = json5.loads('[1, 2.5]', loader=json5.loader.ModelLoader())
+    loader = json5.loader.DefaultLoader(parse_int=Decimal, parse_float=Decimal)
+    assert loader.load(m) == [Decimal(1), Decimal('2.5')]
+    assert [node._value for node in m.value.values] == [None, None]
+
+
+def test_huge_integer_is_only_converted_when_needed():
+    text = '1' * 5000  # more digits than int() accepts by default
+    m = json5.loads(text, loader=json5.loader.ModelLoader())
+    assert m.value.raw_value == text
+    assert json5.loader.DefaultLoader(parse_int=str).load(m) == text
@@ -1,9 +1,19 @@
+import sys
+from collections import OrderedDict
+from decimal import Decimal
+
 import pytest
 
+from json5 import JSON5DecodeError
+from json5.dumper import DefaultDumper
 from json5.dumper import dumps
 from json5.dumper import ModelDumper
+from json5.dumper import Modelizer
+from json5.loader import DefaultLoader
 from json5.loader import loads
 from json5.loader import ModelLoader
+from json5.model import Identifier
+from json5.model import Integer
 
 
 @pytest.mark.parametrize(
@@ -157,3 +167,120 @@ def test_load_empty_object_with_comments():
 def test_load_empty_array_with_comments():
     json_string = "[ // foo \n]"
     assert dumps(loads(json_string, loader=ModelLoader()), dumper=ModelDumper()) == json_string
+
+
+class SingleValueArrayLoader(DefaultLoader):
+    def json_array_to_python(self, node):
+        if len(node.values) == 1:
+            return self.load(node.values[0])
+        return super().json_array_to_python(node)
+
+
+class DecimalDumper(DefaultDumper):
+    @DefaultDumper.to_json(Decimal)
+    def decimal_to_json(self, d):
+        self.env.write(str(d), indent=0)
+
+    def bool_to_json(self, b):
+        self.env.write(str(int(b)), indent=0)
+
+
+def test_subclass_overrides_handler_by_name():
+    assert loads("{foo: ['bar', 'baz'], bacon: ['eggs']}", loader=SingleValueArrayLoader()) == {
+        'foo': ['bar', 'baz'],
+        'bacon': 'eggs',
+    }
+
+
+def test_subclass_registers_new_type():
+    assert dumps([Decimal('1.10'), True], dumper=DecimalDumper()) == '[1.10, 1]'
+    # the base class is unaffected
+    assert dumps([True]) == '[true]'
+    with pytest.raises(NotImplementedError):
+        dumps(Decimal('1.10'))
+
+
+def test_handlers_cover_subclasses():
+    class MyStr(str):
+        pass
+
+    assert dumps([MyStr('foo'), OrderedDict(a=1)]) == '["foo", {"a": 1}]'
+
+
+DEPTH = sys.getrecursionlimit() * 5
+
+
+def test_deeply_nested_model():
+    text = '[{a: ' * DEPTH + '[]' + '}]' * DEPTH
+    model = loads(text, loader=ModelLoader())
+    assert dumps(model, dumper=ModelDumper()) == text
+    assert dumps(DefaultLoader().load(model)) == '[{a: ' * DEPTH + '[]' + '}]' * DEPTH
+
+
+def test_dump_deeply_nested():
+    obj = []
+    for _ in range(DEPTH):
+        obj = [{'a': obj}]
+    assert dumps(obj) == '[{"a": ' * DEPTH + '[]' + '}]' * DEPTH
+    # every bracket is on its own line, apart from those of the innermost (empty) list
+    assert dumps(obj, indent=1).count('\n') == DEPTH * 4 + 1
+
+
+def test_dump_circular_reference():
+    obj = {'a': [1]}
+    obj['a'].append(obj)
+    with pytest.raises(ValueError, match='Circular reference'):
+        dumps(obj)
+    # the same object may appear more than once, as long as it doesn't contain itself
+    shared = [1]
+    assert dumps([shared, {'a': shared}]) == '[[1], {"a": [1]}]'
+
+
+def test_subclass_handlers_apply_inside_nested_values():
+    assert loads('[[[1]], {a: [[2]]}]', loader=SingleValueArrayLoader()) == [1, {'a': 2}]
+
+
+class IncrementingLoader(DefaultLoader):
+    def load(self, node):
+        if isinstance(node, Integer):
+            return node.value + 1
+        return super().load(node)
+
+
+class SetDumper(DefaultDumper):
+    def dump(self, obj):
+        if isinstance(obj, (set, frozenset)):
+            return super().dump(sorted(obj))
+        return super().dump(obj)
+
+
+class SetModelizer(Modelizer):
+    def modelize(self, obj):
+        if isinstance(obj, set):
+            return super().modelize(sorted(obj))
+        return super().modelize(obj)
+
+
+class UpperModelDumper(ModelDumper):
+    def dump(self, node):
+        if isinstance(node, Identifier):
+            self.env.write(node.name.upper())
+            return
+        return super().dump(node)
+
+
+def test_overridden_load_applies_inside_nested_values():
+    assert loads('{a: [1, {b: 2}]}', loader=IncrementingLoader()) == {'a': [2, {'b': 3}]}
+    with pytest.raises(JSON5DecodeError, match='Maximum nesting depth'):
+        loads('[[[1]]]', loader=IncrementingLoader(max_depth=2))
+    assert loads('[[1]]', loader=IncrementingLoader(max_depth=2)) == [[2]]
+
+
+def test_overridden_dump_applies_inside_nested_values():
+    assert dumps({'x': {1, 2}, 'y': [{3}]}, dumper=SetDumper()) == '{"x": [1, 2], "y": [[3]]}'
+    assert dumps(loads('{a: [{b: 1}]}', loader=ModelLoader()), dumper=UpperModelDumper()) == '{A: [{B: 1}]}'
+
+
+def test_overridden_modelize_applies_inside_nested_values():
+    model = SetModelizer().modelize({'x': [{2, 1}]})
+    assert dumps(model, dumper=ModelDumper()) == "{'x':[[1,2]]}"
@@ -1,4 +1,5 @@
 import math
+import sys
 
 import pytest
 
@@ -41,3 +42,18 @@ def test_modelize_nan():
 def test_modelize_double_quote_string():
     s = "'"
     assert loads(dumps(modelize(s), dumper=ModelDumper())) == s
+
+
+def test_modelize_deeply_nested():
+    depth = sys.getrecursionlimit() * 5
+    obj = []
+    for _ in range(depth):
+        obj = [{'a': obj}]
+    assert dumps(modelize(obj), dumper=ModelDumper()) == "[{'a':" * depth + '[]' + '}]' * depth
+
+
+def test_modelize_circular_reference():
+    obj = [1]
+    obj.append(obj)
+    with pytest.raises(ValueError, match='Circular reference'):
+        modelize(obj)
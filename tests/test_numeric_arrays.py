@@ -0,0 +1,100 @@
+import array
+import importlib.util
+import io
+import typing
+
+import pytest
+
+import json5
+from json5.decoder import Decoder
+from json5.loader import DefaultLoader
+from json5.parser import parse_source
+
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+JSON_TEXT = (
+    '{"samples": [1, 2, 3], "vectors": [[0.5, 1], [2.5, -1e3]], "mixed": [1, "a"], "flags": [true], "empty": []}'
+)
+JSON5_TEXT = "{samples: [1, 2, 0x3,], vectors: [[.5, 1], [2.5, -1e3]], mixed: [1, 'a'], flags: [true], empty: []}"
+
+
+def check_arrays(data):
+    assert data['samples'] == array.array('q', [1, 2, 3])
+    assert data['vectors'] == [array.array('d', [0.5, 1.0]), array.array('d', [2.5, -1000.0])]
+    assert data['mixed'] == [1, 'a']
+    assert data['flags'] == [True]
+    assert data['empty'] == []
+
+
+@pytest.mark.parametrize('text', [JSON_TEXT, JSON5_TEXT])
+@pytest.mark.parametrize('try_json', [True, False])
+def test_loads_numeric_arrays(text, try_json):
+    check_arrays(json5.loads(text, numeric_arrays='array', try_json=try_json))
+    check_arrays(json5.loads(text.encode('utf-8'), numeric_arrays='array', try_json=try_json))
+
+
+@pytest.mark.parametrize('text', ['[1, 2]', '[[1, 2]]', '{a: [1.5]}', '[[[1], [2.5]], [3]]'])
+def test_loads_numeric_arrays_paths_agree(text):
+    expected = json5.loads(text, numeric_arrays='array', try_json=False)
+    assert json5.loads(text, numeric_arrays='array') == expected
+    assert Decoder(numeric_arrays='array').raw_decode(text) == (expected, len(text))
+    assert DefaultLoader(numeric_arrays='array').load(parse_source(text)) == expected
+
+
+def test_numeric_arrays_keep_lists():
+    assert json5.loads('[9223372036854775808]', numeric_arrays='array') == [2**63]
+    assert json5.loads('[1, null]', numeric_arrays='array') == [1, None]
+    assert json5.loads('[1.5]', numeric_arrays='array', parse_float=str) == ['1.5']
+    assert json5.loads('[NaN, Infinity]', numeric_arrays='array').typecode == 'd'
+
+
+def test_numeric_arrays_object_hook():
+    seen = []
+
+    def hook(d):
+        seen.append(d['a'])
+        return d
+
+    assert json5.loads('{"a": [1, 2]}', numeric_arrays='array', object_hook=hook) == {'a': array.array('q', [1, 2])}
+    assert seen == [array.array('q', [1, 2])]
+
+
+def test_load_path_and_lines_numeric_arrays(tmp_path):
+    path = tmp_path / 'data.json5'
+    path.write_text(JSON5_TEXT, encoding='utf-8')
+    check_arrays(json5.load_path(path, numeric_arrays='array'))
+    assert list(json5.load_lines(io.StringIO('[1, 2]\n[3.5]\n'), numeric_arrays='array')) == [
+        array.array('q', [1, 2]),
+        array.array('d', [3.5]),
+    ]
+
+
+def test_numeric_arrays_into_any():
+    data = json5.loads('{a: [1, 2], b: [3]}', into=typing.Dict[str, typing.Any], numeric_arrays='array')
+    assert data == {'a': array.array('q', [1, 2]), 'b': array.array('q', [3])}
+    assert json5.loads('[1, 2]', into=typing.List[int], numeric_arrays='array') == [1, 2]
+
+
+def test_numeric_arrays_errors():
+    with pytest.raises(ValueError):
+        json5.loads('[1]', numeric_arrays='list')
+    with pytest.raises(ValueError):
+        json5.loads('[1]', numeric_arrays='array', lazy=True)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason='requires NumPy')
+def test_loads_numpy_arrays():
+    import numpy
+
+    data = json5.loads(JSON5_TEXT, numeric_arrays='numpy')
+    assert data['samples'].dtype == numpy.int64
+    assert data['samples'].tolist() == [1, 2, 3]
+    assert data['vectors'][1].dtype == numpy.float64
+    assert data['vectors'][1].tolist() == [2.5, -1000.0]
+    assert data['mixed'] == [1, 'a']
+
+
+@pytest.mark.skipif(HAS_NUMPY, reason='requires NumPy not to be installed')
+def test_numpy_arrays_without_numpy():
+    with pytest.raises(ImportError, match='requires NumPy'):
+        json5.loads('[1]', numeric_arrays='numpy')
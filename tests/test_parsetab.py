@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+from json5.parser import CachedLRTable
+from json5.parser import JSONParser
+from json5.parser import load_cached_lrtable
+
+
+def test_shipped_parse_tables_match_grammar():
+    # If this fails, the grammar was changed without regenerating the tables:
+    # python -c "from json5.parser import write_parse_tables; write_parse_tables()"
+    assert isinstance(JSONParser._lrtable, CachedLRTable)
+
+
+def test_parse_tables_not_used_for_other_grammar(monkeypatch):
+    from json5 import _parsetab
+
+    monkeypatch.setattr(_parsetab, 'GRAMMAR_HASH', 'stale')
+    assert load_cached_lrtable(JSONParser._grammar) is None
+
+
+# Building the tables changes the grammar, so they can only be built once per interpreter
+BUILD_TABLES = '''
+import os
+import runpy
+import sys
+
+class BlockParsetab:
+    def find_spec(self, name, path=None, target=None):
+        if name == 'json5._parsetab':
+            raise ImportError(name)
+
+sys.meta_path.insert(0, BlockParsetab())
+import json5.parser
+from json5.parser import JSONParser
+
+shipped = runpy.run_path(os.path.join(os.path.dirname(json5.parser.__file__), '_parsetab.py'))
+lrtable = JSONParser._lrtable
+print(type(lrtable).__name__)
+print(lrtable.lr_action == shipped['lr_action'])
+print(lrtable.lr_goto == shipped['lr_goto'])
+print(lrtable.defaulted_states == shipped['defaulted_states'])
+print(json5.parser.parse_source('[1, {a: 2}]').value.values[1].keys[0].name)
+'''
+
+
+def test_parse_tables_match_freshly_built_tables():
+    # Without the shipped tables sly builds its own, which must be the same
+    output = subprocess.check_output([sys.executable, '-c', BUILD_TABLES], text=True)
+    assert output.split() == ['LRTable', 'True', 'True', 'True', 'a']
@@ -0,0 +1,265 @@
+import dataclasses
+import enum
+import sys
+import typing
+from decimal import Decimal
+
+import pytest
+
+import json5
+from json5 import JSON5DecodeError
+from json5.loader import ModelLoader
+from json5.schema import _PLANS
+from json5.schema import TypedDecoder
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+class Point(typing.NamedTuple):
+    x: int
+    y: float = 0.0
+
+
+class Meta(typing.TypedDict, total=False):
+    tags: typing.List[str]
+
+
+class Named(typing.TypedDict):
+    name: str
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: typing.List['Node'] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Config:
+    port: int
+    host: str
+    points: typing.List[Point] = dataclasses.field(default_factory=list)
+    meta: Meta = dataclasses.field(default_factory=dict)  # type: ignore[assignment]
+    color: Color = Color.RED
+    mode: typing.Literal['fast', 'slow'] = 'fast'
+    tree: typing.Optional[Node] = None
+    pair: typing.Tuple[int, str] = (0, '')
+    extra: typing.Dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class Positive:
+    value: int
+
+    def __post_init__(self):
+        if self.value <= 0:
+            raise ValueError('value must be positive')
+
+
+TEXT = """{
+    port: 8080, host: 'localhost', // comment
+    points: [{x: 1}, {x: 2, y: 3}],
+    meta: {tags: ['a', 'b']},
+    color: 'green',
+    mode: 'slow',
+    tree: {name: 'root', children: [{name: 'leaf'}]},
+    pair: [1, 'one'],
+    extra: {a: 1, b: 2.5},
+}"""
+
+
+def test_loads_into_dataclass():
+    config = json5.loads(TEXT, into=Config)
+    assert config == Config(
+        port=8080,
+        host='localhost',
+        points=[Point(1, 0.0), Point(2, 3.0)],
+        meta={'tags': ['a', 'b']},
+        color=Color.GREEN,
+        mode='slow',
+        tree=Node('root', [Node('leaf')]),
+        pair=(1, 'one'),
+        extra={'a': 1.0, 'b': 2.5},
+    )
+    assert type(config.points[1].y) is float
+    assert type(config.extra['a']) is float
+
+
+def test_loads_into_defaults():
+    assert json5.loads('{port: 1, host: "h"}', into=Config) == Config(1, 'h')
+
+
+def test_loads_into_typeddict():
+    assert json5.loads('{name: "x"}', into=Named) == {'name': 'x'}
+    assert json5.loads('{}', into=Meta) == {}
+    with pytest.raises(JSON5DecodeError, match="Missing 'name' for Named"):
+        json5.loads('{}', into=Named)
+
+
+@pytest.mark.parametrize(
+    'into, text, expected',
+    [
+        (typing.List[int], '[1, 2, 0x3]', [1, 2, 3]),
+        (typing.Tuple[int, ...], '[1, 2]', (1, 2)),
+        (typing.Tuple[int, str], '[1, "a"]', (1, 'a')),
+        (typing.Dict[str, typing.Any], '{a: [1, {b: null}]}', {'a': [1, {'b': None}]}),
+        (typing.Optional[int], 'null', None),
+        (typing.Optional[int], '5', 5),
+        (typing.Union[int, str], '"a"', 'a'),
+        (typing.Union[typing.List[int], Point], '{x: 1}', Point(1)),
+        (typing.Union[typing.List[int], Point], '[1]', [1]),
+        (float, '1', 1.0),
+        (float, 'Infinity', float('inf')),
+        (typing.Any, '[1, {a: 2}]', [1, {'a': 2}]),
+        (Color, '"red"', Color.RED),
+    ],
+)
+def test_loads_into_types(into, text, expected):
+    assert json5.loads(text, into=into) == expected
+
+
+@pytest.mark.parametrize(
+    'into, text, message',
+    [
+        (Config, '{port: "80", host: "h"}', 'Expected int, not a string'),
+        (Config, '{port: true, host: "h"}', 'Expected int, not a bool'),
+        (Config, '[]', 'Expected Config, not an array'),
+        (Config, '{port: 1}', "Missing 'host' for Config"),
+        (Config, '{port: 1, host: "h", color: "blue"}', 'Expected Color'),
+        (Config, '{port: 1, host: "h", mode: "slower"}', "Expected Literal\\['fast', 'slow'\\]"),
+        (Config, '{port: 1, host: "h", pair: [1]}', 'not 1 values'),
+        (Config, '{port: 1, host: "h", pair: [1, "a", 2]}', 'not more than 2 values'),
+        (Config, '{port: 1, host: "h", tree: {name: 1}}', 'Expected str, not a number'),
+        (typing.Dict[str, int], '{a: null}', 'Expected int, not null'),
+        (typing.List[int], '{}', 'not an object'),
+        (Positive, '{value: -1}', 'Could not make Positive: value must be positive'),
+    ],
+)
+def test_loads_into_errors(into, text, message):
+    with pytest.raises(JSON5DecodeError, match=message):
+        json5.loads(text, into=into)
+
+
+def test_loads_into_error_position():
+    text = '{port: 1,\n host: 2}'
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        json5.loads(text, into=Config)
+    assert exc_info.value.lineno == 2
+    assert exc_info.value.index == text.index('2')
+
+
+def test_loads_into_syntax_error_matches_parser():
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        json5.loads('{port: 1,, host: "h"}', into=Config)
+    with pytest.raises(JSON5DecodeError) as expected_exc_info:
+        json5.loads('{port: 1,, host: "h"}')
+    assert str(exc_info.value) == str(expected_exc_info.value)
+
+
+def test_loads_into_unknown_fields():
+    text = '{port: 1, host: "h", junk: [1, {z: 2}], points: [{x: 1, z: 2}]}'
+    assert json5.loads(text, into=Config) == Config(1, 'h', [Point(1)])
+    with pytest.raises(JSON5DecodeError, match="Unknown field 'junk' for Config"):
+        json5.loads(text, into=Config, unknown_fields='reject')
+    with pytest.raises(ValueError):
+        json5.loads(text, into=Config, unknown_fields='warn')
+
+
+def test_loads_into_options():
+    assert json5.loads(b'{port: 1, host: "h"}', into=Config) == Config(1, 'h')
+    assert json5.loads('[1.5]', into=typing.List[typing.Any], parse_float=str) == ['1.5']
+    with pytest.raises(ValueError):
+        json5.loads('{}', into=Config, lazy=True)
+    with pytest.raises(ValueError):
+        json5.loads('{}', into=Config, loader=ModelLoader())
+
+
+@dataclasses.dataclass
+class Reading:
+    value: float
+    count: int
+    limit: typing.Optional[float] = None
+
+
+def test_loads_into_with_number_hooks():
+    reading = json5.loads('{value: 1.5, count: 2, limit: -2.5}', into=Reading, parse_float=Decimal, parse_int=Decimal)
+    assert reading == Reading(Decimal('1.5'), Decimal('2'), Decimal('-2.5'))
+    assert type(reading.value) is Decimal
+    assert json5.loads('{value: 1, count: 2}', into=Reading, parse_float=Decimal) == Reading(1.0, 2)
+    assert json5.loads('{value: NaN, count: 1}', into=Reading, parse_constant=str) == Reading('NaN', 1)  # type: ignore
+    with pytest.raises(JSON5DecodeError, match='Expected float, not a string'):
+        json5.loads('{value: "1.5", count: 1}', into=Reading, parse_float=Decimal)
+    with pytest.raises(JSON5DecodeError, match='Expected str, not Decimal'):
+        json5.loads('{name: 1.5}', into=Named, parse_float=Decimal)
+
+
+def test_load_path_into(tmp_path):
+    path = tmp_path / 'config.json5'
+    path.write_text(TEXT, encoding='utf-8')
+    assert json5.load_path(path, into=Config) == json5.loads(TEXT, into=Config)
+    with open(path, encoding='utf-8') as f:
+        assert json5.load(f, into=Config) == json5.loads(TEXT, into=Config)
+
+
+def test_typed_decoder_reuse():
+    decoder = TypedDecoder(typing.List[Point])
+    assert decoder.decode('[{x: 1}]') == [Point(1)]
+    assert decoder.decode('[]') == []
+    assert _PLANS[typing.List[Point]] is decoder._plan
+
+
+@dataclasses.dataclass
+class Tree:
+    children: typing.List['Tree']
+    broken: 'Missing'  # type: ignore[name-defined]
+
+
+@dataclasses.dataclass
+class Branch:
+    name: str
+    branches: typing.List['Branch'] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Grove:
+    branches: typing.List[Branch]
+    tallest: typing.Optional[Branch] = None
+
+
+def test_plans_cached_once_complete(monkeypatch):
+    seen_while_compiling = []
+
+    def get_type_hints(cls):
+        seen_while_compiling.extend(tp for tp in (Grove, Branch) if tp in _PLANS)
+        return original_get_type_hints(cls)
+
+    original_get_type_hints = typing.get_type_hints
+    monkeypatch.setattr(typing, 'get_type_hints', get_type_hints)
+    assert json5.loads('{branches: [{name: "a", branches: [{name: "b"}]}]}', into=Grove) == Grove(
+        [Branch('a', [Branch('b')])]
+    )
+    # another thread could have used the plans as soon as they were cached, before their fields were compiled
+    assert seen_while_compiling == []
+    assert _PLANS[Grove].fields and _PLANS[Branch].fields
+    with pytest.raises(NameError):
+        json5.loads('{children: []}', into=Tree)
+    assert Tree not in _PLANS
+
+
+def test_ambiguous_union():
+    with pytest.raises(TypeError):
+        json5.loads('{}', into=typing.Union[Point, Config])
+
+
+def test_loads_into_deeply_nested():
+    depth = sys.getrecursionlimit() * 5
+    text = '{name: "n", children: [' * depth + '{name: "leaf"}' + ']}' * depth
+    node = json5.loads(text, into=Node)
+    for _ in range(depth):
+        node = node.children[0]
+    assert node == Node('leaf')
+    with pytest.raises(JSON5DecodeError, match='Maximum nesting depth'):
+        json5.loads(text, into=Node, max_depth=100)
@@ -0,0 +1,164 @@
+import math
+import sys
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+import pytest
+
+from json5 import dumps
+from json5 import JSON5DecodeError
+from json5 import JsonIdentifier
+from json5 import loads
+from json5.model import JSONArray
+from json5.parser import parse_source
+from json5.tape import LazyArray
+from json5.tape import LazyObject
+from json5.tape import parse_tape
+
+TEXT = "// comment\n{foo: [1, 2e3, -0x10, {bar: null}], 'baz': \"qux\", nested: [[], [true]], foo2: +Infinity,}"
+
+
+def test_tape_to_python():
+    assert parse_tape(TEXT).to_python() == loads(TEXT)
+
+
+@pytest.mark.parametrize('text', ['"string"', '42', '-Infinity', 'true', 'false', 'null', '[]', '{}', ' 1.5e3 '])
+def test_tape_scalar_document(text):
+    tape = parse_tape(text)
+    assert tape.to_python() == loads(text)
+    assert tape.root.source == text.strip()
+
+
+def test_tape_nan():
+    assert math.isnan(parse_tape('NaN').to_python())
+
+
+def test_tape_navigation():
+    root = parse_tape(TEXT).root
+    assert root.kind == 'object'
+    assert list(root.keys()) == ['foo', 'baz', 'nested', 'foo2']
+    assert len(root) == 4
+    assert root['foo'].kind == 'array'
+    assert len(root['foo']) == 4
+    assert root['foo'][3]['bar'].kind == 'null'
+    assert root['foo'][-2].to_python() == -16
+    assert root['foo'][-2].source == '-0x10'
+    assert root['baz'].source == '"qux"'
+    assert root['nested'][1][0].to_python() is True
+    assert [value.kind for value in root.values()] == ['array', 'string', 'array', 'number']
+    assert [(key, value.to_python()) for key, value in root['foo'][3].items()] == [('bar', None)]
+
+
+def test_tape_cursor_errors():
+    root = parse_tape(TEXT).root
+    with pytest.raises(KeyError):
+        root['missing']
+    with pytest.raises(IndexError):
+        root['foo'][4]
+    with pytest.raises(IndexError):
+        root['foo'][-5]
+    with pytest.raises(TypeError):
+        root['foo']['bar']
+    with pytest.raises(TypeError):
+        list(root['baz'].values())
+
+
+def test_tape_duplicate_keys_last_wins():
+    tape = parse_tape('{a: 1, a: 2}')
+    assert tape.root['a'].to_python() == 2
+    assert tape.to_python() == {'a': 2}
+
+
+def test_tape_skips_subtrees():
+    tape = parse_tape('[[1, [2, 3]], 4]')
+    outer = tape.root
+    first = outer[0]
+    assert tape.skips[first.index] == outer[1].index
+    assert tape.skips[outer.index] == len(tape)
+
+
+def test_tape_shares_repeated_keys():
+    tape = parse_tape('[{id: 1}, {id: 2}, {id: 3}]')
+    assert tape.atoms.count('id') == 1
+
+
+def test_tape_keys_keep_their_quoting():
+    text = '[{a: 1}, {"a": 2}, {\'a\': 3}, {a: 4}]'
+    data = parse_tape(text).to_python()
+    assert data == loads(text)
+    assert [type(key) for d in data for key in d] == [type(key) for d in loads(text) for key in d]
+    assert [type(key) for d in data for key in d] == [JsonIdentifier, str, str, JsonIdentifier]
+
+
+def test_tape_to_model():
+    model = parse_tape(TEXT).root['foo'].to_model()
+    assert isinstance(model, JSONArray)
+    assert len(model.values) == 4
+
+
+@pytest.mark.parametrize('text', ['', '[1,,]', '{foo: "bar",,}', '[true', '{true: 1}', '1 e5', '{a b}', '[1] 2', '[}'])
+def test_tape_errors_match_parser(text):
+    with pytest.raises(JSON5DecodeError) as parser_exc_info:
+        parse_source(text)
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        parse_tape(text)
+    assert str(exc_info.value) == str(parser_exc_info.value)
+
+
+def test_loads_lazy():
+    data = loads(TEXT, lazy=True)
+    assert isinstance(data, LazyObject)
+    assert isinstance(data['foo'], LazyArray)
+    assert data == loads(TEXT)
+    assert list(data) == ['foo', 'baz', 'nested', 'foo2']
+    assert len(data['foo']) == 4
+    assert data['foo'][-1] == {'bar': None}
+    assert data['foo'][1:3] == [2000.0, -16]
+    assert data.to_python() == loads(TEXT)
+    assert data['nested'].to_python() == [[], [True]]
+
+
+@pytest.mark.parametrize(
+    'text', [TEXT, '[{a: 1}, {"a": 2}, {\'a\': {a: 3, "b": 4}}]', '{a: 1, "a": 2, b: {"c": 3, c: 4}}']
+)
+def test_loads_lazy_matches_eager_key_types(text):
+    def key_types(value):
+        if isinstance(value, Mapping):
+            return [(type(key), key_types(item)) for key, item in value.items()]
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            return [key_types(item) for item in value]
+        return None
+
+    lazy = loads(text, lazy=True)
+    eager = loads(text)
+    assert lazy == eager
+    assert key_types(lazy) == key_types(eager)
+    assert key_types(lazy.to_python()) == key_types(eager)
+
+
+def test_loads_lazy_decodes_on_access():
+    data = loads('{a: {b: [1, 2]}, c: [3]}', lazy=True)
+    assert data._cache == {}
+    a = data['a']
+    assert data['a'] is a
+    assert list(data._cache) == ['a']
+    assert a._cache == {}
+
+
+@pytest.mark.parametrize('text', ['"string"', '42', 'true', 'null'])
+def test_loads_lazy_scalar_document(text):
+    assert loads(text, lazy=True) == loads(text)
+
+
+def test_loads_lazy_errors():
+    with pytest.raises(JSON5DecodeError):
+        loads('{a: [1, 2}', lazy=True)
+    with pytest.raises(ValueError):
+        loads('{}', lazy=True, parse_int=float)
+
+
+def test_tape_to_python_deeply_nested():
+    depth = sys.getrecursionlimit() * 5
+    text = '[{a: ' * depth + '[]' + '}]' * depth
+    assert dumps(parse_tape(text).to_python()) == text
+    assert dumps(loads(text, lazy=True).to_python()) == text
@@ -0,0 +1,146 @@
+import pytest
+
+from json5.tokenizer import decode_string_literal
+from json5.tokenizer import LineIndex
+from json5.tokenizer import tokenize
+from json5.tokenizer import tokenize_bytes
+from json5.utils import JSON5DecodeError
+
+
+def _types_and_values(text):
+    return [(tok.type, tok.value) for tok in tokenize(text)]
+
+
+def test_keywords():
+    assert _types_and_values('true false null Infinity NaN') == [
+        ('TRUE', 'true'),
+        ('WHITESPACE', ' '),
+        ('FALSE', 'false'),
+        ('WHITESPACE', ' '),
+        ('NULL', 'null'),
+        ('WHITESPACE', ' '),
+        ('INFINITY', 'Infinity'),
+        ('WHITESPACE', ' '),
+        ('NAN', 'NaN'),
+    ]
+
+
+def test_keyword_followed_by_unicode_whitespace():
+    assert _types_and_values('true ') == [('TRUE', 'true'), ('WHITESPACE', ' ')]
+
+
+@pytest.mark.parametrize('name', ['nullé', 'café', 'ümlaut', 'a‌b', 'foo‿bar', 'a\\u0062'])
+def test_names_with_unicode_characters(name):
+    assert _types_and_values(name) == [('NAME', name)]
+
+
+def test_exponent_takes_precedence_over_name():
+    assert _types_and_values('1e5') == [('INTEGER', '1'), ('EXPONENT', 'e5')]
+
+
+def test_line_numbers():
+    text = '{\n  "foo": /* a\ncomment */ "bar\\\nbaz",\n}'
+    tokens = list(tokenize(text))
+    assert [(tok.type, tok.lineno) for tok in tokens if tok.type != 'WHITESPACE'] == [
+        ('LBRACE', 1),
+        ('DOUBLE_QUOTE_STRING', 2),
+        ('COLON', 2),
+        ('BLOCK_COMMENT', 2),
+        ('DOUBLE_QUOTE_STRING', 3),
+        ('COMMA', 4),
+        ('RBRACE', 5),
+    ]
+    assert tokens[-1].index == len(text) - 1
+
+
+def test_illegal_character():
+    with pytest.raises(JSON5DecodeError) as exc_info:
+        list(tokenize('[1, #]'))
+    assert "Illegal character '#' at index 4" in str(exc_info.value)
+
+
+def test_tokens_share_line_index():
+    tokens = list(tokenize('{\n  foo: [1, 2],\n\n bar: "x"}'))
+    assert all(tok.line_index is tokens[0].line_index for tok in tokens)
+    positions = [(tok.value, tok.lineno, tok.colno) for tok in tokens if tok.type != 'WHITESPACE']
+    assert positions[:4] == [('{', 1, 0), ('foo', 2, 2), (':', 2, 5), ('[', 2, 7)]
+    assert positions[-4:] == [('bar', 4, 1), (':', 4, 4), ('"x"', 4, 6), ('}', 4, 9)]
+
+
+@pytest.mark.parametrize('offset, position', [(0, (1, 0)), (3, (1, 3)), (4, (2, 0)), (5, (3, 0)), (8, (3, 3))])
+def test_line_index(offset, position):
+    line_index = LineIndex('abc\n\nxyz')
+    assert line_index.offset_to_position(offset) == position
+    assert line_index.position_to_offset(*position) == offset
+
+
+@pytest.mark.parametrize('position', [(0, 0), (4, 0), (1, 4), (2, 1), (1, -1)])
+def test_line_index_invalid_position(position):
+    with pytest.raises(ValueError):
+        LineIndex('abc\n\nxyz').position_to_offset(*position)
+
+
+@pytest.mark.parametrize('offset', [-1, 9])
+def test_line_index_invalid_offset(offset):
+    with pytest.raises(ValueError):
+        LineIndex('abc\n\nxyz').offset_to_position(offset)
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        '{a: 1, "b\\u00e9": [\'x\\\n\', 1e5, 0x1F, -.5], ñame: true, /* é\n */ c: NaN}\n// comment',
+        '\ufeff[\u00a0null,\u2028Infinity]',
+        'abcé déf',
+        '"unterminated',
+    ],
+)
+def test_tokenize_bytes(text):
+    tokens = list(tokenize_bytes(text.encode('utf-8')))
+    assert [(tok.type, tok.value, tok.lineno) for tok in tokens] == [
+        (tok.type, tok.value, tok.lineno) for tok in tokenize(text)
+    ]
+    assert tokens[-1].end == len(text.encode('utf-8'))
+
+
+@pytest.mark.parametrize('text', ['@', '{a: ¡}'])
+def test_tokenize_bytes_illegal_character(text):
+    with pytest.raises(JSON5DecodeError):
+        list(tokenize_bytes(text.encode('utf-8')))
+
+
+@pytest.mark.parametrize(
+    'raw_value, expected',
+    [
+        ('"plain"', 'plain'),
+        (r'"\b\f\n\r\t\v\0\\\"\'\q"', '\b\f\n\r\t\v\0\\"\'q'),
+        (r'"\x41é\ud83d"', 'Aé\ud83d'),
+        ('"a\\\r\nb\\\nc\\ d"', 'abcd'),
+        # escapes that produce a backslash don't start another escape
+        (r'"\n\x5cn"', '\n\\n'),
+        (r'"\u00"', 'u00'),
+    ],
+)
+def test_decode_string_literal(raw_value, expected):
+    errors = []
+    [tok] = tokenize(raw_value)
+    assert decode_string_literal(raw_value, tok, errors) == expected
+    assert errors == []
+
+
+@pytest.mark.parametrize(
+    'raw_value, message',
+    [
+        ('"a\nb"', 'Illegal line terminator'),
+        # the backslash is escaped, so it doesn't continue the line
+        ('"a\\\\\nb"', 'Illegal line terminator'),
+        (r'"\x4"', "'\\x' MUST be followed by two hexadecimal digits"),
+        (r'"\01"', "'\\0' MUST NOT be followed by a decimal digit"),
+    ],
+)
+def test_decode_string_literal_errors(raw_value, message):
+    errors = []
+    [tok] = tokenize(raw_value)
+    decode_string_literal(raw_value, tok, errors)
+    assert len(errors) == 1
+    assert message in str(errors[0])